@@ -4,6 +4,8 @@
 import pygame.gfxdraw
 import sys
 import os
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 
 # Ajouter le répertoire src au path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -11,14 +13,71 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from src.simulation.simulator import FreeFallSimulator
 from src.models.physics_object import PhysicsObject
 from src.simulation.numerical_methods import EulerMethod
+from src.simulation.events import IMPACT, APEX, REST
+from src.simulation.recording import RecordNothing, RecordEveryNthStep
+from src.simulation.fixed_timestep import FixedTimestepAccumulator
+from src.simulation.prefix_cache import ImpactSnapshotStore
+from src.simulation.physics_worker import PhysicsWorker, SnapshotBuffer
 from src.visualization.modern_ui import *
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCALE, INITIAL_HEIGHTS, BALL_TYPES, GROUND_TYPES, AIR_DENSITY_FACTORS, BALL_RADIUS, FPS
+from src.utils.constants import TIME_SCALES, MAX_JUMP_STEPS_PER_FRAME
+
+
+ENERGY_KEYS = ('time', 'kinetic', 'potential', 'total', 'rebounds')
+
+
+class SimulationFrame:
+    """
+    Données lues par l'affichage pour dessiner une image
+
+    Les deux emplacements du double tampon sont alloués une fois ; chaque
+    publication y recopie l'état courant au lieu de créer de nouveaux objets.
+    """
+
+    TRAIL_LENGTH = 50
+    OBJECT_FIELDS = ('x', 'y', 'vx', 'vy', 'mass', 'radius', 'drag_coefficient',
+                     'restitution_coefficient', 'color')
+
+    def __init__(self):
+        self.time = 0.0
+        self.obj: Optional[PhysicsObject] = None  # Copie de l'objet simulé (None sans objet)
+        self.display_position: Tuple[float, float] = (0.0, 0.0)
+        self.energy_data: Dict[str, List[float]] = {key: [] for key in ENERGY_KEYS}
+        self.bounce_heights: List[float] = []
+        self.bounce_times: List[float] = []
+        self.physics_info: dict = {}
+        self._object = PhysicsObject()
+        self._trail = np.zeros((self.TRAIL_LENGTH, 2))
+        self.trail = self._trail[:0]  # Vue sur les dernières positions
+
+    def copy_object(self, source: Optional[PhysicsObject]):
+        """Recopie l'état de l'objet simulé dans la copie de l'image"""
+        if source is None:
+            self.obj = None
+            return
+        for name in self.OBJECT_FIELDS:
+            setattr(self._object, name, getattr(source, name))
+        self.obj = self._object
+
+    def copy_trail(self, x: np.ndarray, y: np.ndarray):
+        """Recopie les dernières positions de l'historique"""
+        length = min(self.TRAIL_LENGTH, len(x))
+        if length:
+            self._trail[:length, 0] = x[-length:]
+            self._trail[:length, 1] = y[-length:]
+        self.trail = self._trail[:length]
 
 
 class SingleBallSimulationApp:
     """Application de simulation d'une seule balle"""
 
-    def __init__(self):
+    def __init__(self, threaded: bool = False):
+        """
+        Args:
+            threaded: Fait tourner la physique dans un thread séparé ; l'affichage
+                ne lit alors que la dernière image publiée
+        """
+
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Simulation Balle Rebondissante - Dissipation d'Énergie")
@@ -34,11 +93,21 @@ class SingleBallSimulationApp:
         self.selected_ground = 0
         self.selected_air_density = 2  # Air normal par défaut
         self.selected_height = 3  # 10m par défaut
+        self.selected_time_scale = 0  # Temps réel par défaut
 
         # Simulateur
         self.simulator = None
         self.init_simulator()
 
+        # Pas physiques fixes, indépendants de la fréquence d'affichage
+        self.accumulator = FixedTimestepAccumulator(self.simulator.dt, TIME_SCALES[0]["factor"])
+
+        # Position avant le dernier pas physique, pour l'interpolation de l'affichage
+        self.previous_position = None
+
+        # Débuts de chute déjà calculés (réutilisés quand seul le sol change)
+        self.snapshot_store = ImpactSnapshotStore()
+
         # Données pour graphiques (plus de points pour voir la dissipation complète)
         self.energy_data = {
             'time': [],
@@ -52,6 +121,14 @@ class SingleBallSimulationApp:
         self.bounce_heights = []  # Hauteurs successives après chaque rebond
         self.bounce_times = []    # Temps de chaque rebond
 
+        # Images publiées pour l'affichage (double tampon)
+        self.frames = SnapshotBuffer(factory=SimulationFrame)
+        self.frames.write(self.fill_frame)
+        self.frame = None  # Image en cours de dessin, lue dans self.frames.read()
+        self.physics_worker = None
+        if threaded:
+            self.start_physics_worker()
+
     def init_simulator(self):
         """Initialise le simulateur"""
         ball_config = BALL_TYPES[self.selected_ball]
@@ -63,7 +140,8 @@ class SingleBallSimulationApp:
             air_resistance=True,
             ground_level=0.0,
             air_density_factor=air_config["factor"],
-            numerical_method=EulerMethod()
+            numerical_method=EulerMethod(),
+            recording_policy=RecordNothing()  # L'historique est enregistré par l'application
         )
 
         # Objet physique
@@ -88,69 +166,204 @@ class SingleBallSimulationApp:
         self.bounce_heights = []
         self.bounce_times = []
         self.init_simulator()
+        self.accumulator.reset()
+        self.previous_position = None
         self.simulator.start()
+        if TIME_SCALES[self.selected_time_scale]["factor"] is None:
+            # En mode instantané, la chute commune est reprise dès la remise à zéro
+            self.resume_fall_prefix(MAX_JUMP_STEPS_PER_FRAME * self.simulator.dt)
+
+    def update_simulation(self, frame_time: float = 1.0 / FPS):
+        """
+        Met à jour la simulation pour le temps réel écoulé depuis l'image précédente
+
+        Args:
+            frame_time: Temps réel écoulé (s) ; l'accumulateur le convertit en sous-pas physiques
+        """
+        if self.paused or self.state != "simulation" or self.simulator.physics_engine.simulation_stopped:
+            return
 
-    def update_simulation(self):
-        """Met à jour la simulation"""
-        if not self.paused and self.state == "simulation" and not self.simulator.physics_engine.simulation_stopped:
-            previous_rebounds = self.simulator.physics_engine.total_rebounds
+        if TIME_SCALES[self.selected_time_scale]["factor"] is None:
+            self.jump_to_rest()
+            return
 
-            # Mettre à jour la simulation et récupérer la hauteur de pic si atteinte
-            collision, peak_height = self.simulator.physics_engine.update_object(
-                self.simulator.objects[0],
-                self.simulator.dt,
-                self.simulator.numerical_method
-            )
+        steps = self.accumulator.advance(frame_time)
+        for i in range(steps):
+            self.physics_step(record=(i == steps - 1))
+            if self.simulator.physics_engine.simulation_stopped:
+                break
 
-            # Mise à jour du temps de simulation
-            self.simulator.time += self.simulator.dt
+    def jump_to_rest(self):
+        """
+        Avance rapidement vers l'arrêt de la balle
+
+        Chaque appel (une image, ou un tour du thread physique) effectue au
+        plus MAX_JUMP_STEPS_PER_FRAME pas : l'affichage reste fluide et
+        montre la balle progresser jusqu'au repos au fil des images.
+        """
+        simulator = self.simulator
+        end_time = simulator.time + MAX_JUMP_STEPS_PER_FRAME * simulator.dt
+        sample_every = self.jump_sample_interval()
+
+        if simulator.step_count == 0:
+            # Passage en mode instantané avant le premier pas
+            self.resume_fall_prefix(end_time - simulator.time)
+
+        while simulator.time < end_time and not simulator.physics_engine.simulation_stopped:
+            self.physics_step(record=(simulator.step_count % sample_every == 0))
+        self.accumulator.reset()
+
+    def jump_sample_interval(self) -> int:
+        """Nombre de pas entre deux échantillons en mode instantané (~50 par seconde simulée)"""
+        return max(1, int(0.02 / self.simulator.dt))
+
+    def resume_fall_prefix(self, max_duration: float):
+        """
+        Amène une simulation à son début jusqu'au pas du premier impact
+
+        La chute jusqu'au premier impact ne dépend pas du sol : elle est reprise
+        d'un run précédent via self.snapshot_store, ou calculée puis mémorisée.
+        Ses échantillons sont enregistrés par le simulateur, donc gardés dans
+        l'instantané : un début repris donne les mêmes données qu'un début calculé.
+
+        Args:
+            max_duration: Durée simulée maximale si l'impact n'est pas atteint
+        """
+        simulator = self.simulator
+        if simulator.step_count != 0 or not simulator.objects:
+            return
+        obj = simulator.objects[0]
+        self.record_sample()
+        start = len(obj.history)
+        simulator.set_recording_policy(RecordEveryNthStep(self.jump_sample_interval()))
+        self.snapshot_store.advance(simulator, simulator.time + max_duration)
+        simulator.set_recording_policy(RecordNothing())
+        self.record_history_samples(obj, start)
+
+    def set_time_scale(self, index: int):
+        """Change la vitesse de simulation"""
+        self.selected_time_scale = index % len(TIME_SCALES)
+        factor = TIME_SCALES[self.selected_time_scale]["factor"]
+        if factor is not None:
+            self.accumulator.time_scale = factor
+        self.accumulator.reset()
+
+    def physics_step(self, record: bool = True):
+        """
+        Effectue un pas physique et met à jour les statistiques de rebonds
+
+        Args:
+            record: Enregistre l'historique et l'énergie après ce pas (toujours fait
+                au sommet d'un rebond et à l'arrêt)
+        """
+        if self.simulator.objects:
+            obj = self.simulator.objects[0]
+            self.previous_position = (obj.x, obj.y)
+        self.simulator.step()
 
-            # Vérifier s'il y a eu un nouveau rebond (collision avec le sol)
-            current_rebounds = self.simulator.physics_engine.total_rebounds
-            if current_rebounds > previous_rebounds:
+        peak_reached = False
+        for event in self.simulator.last_events:
+            if event.kind == IMPACT:
                 # Un nouveau rebond s'est produit, on attend la hauteur max
-                obj = self.simulator.objects[0]
-                self.bounce_times.append(self.simulator.time)
-
-            # Vérifier si on a atteint une hauteur maximale après un rebond
-            if peak_height > 0:
-                self.bounce_heights.append(peak_height)
-                print(f"Rebond {len(self.bounce_heights)}: hauteur max = {peak_height:.3f}m")
-
-            # Mise à jour de l'historique de l'objet
-            if self.simulator.objects:
-                obj = self.simulator.objects[0]
-                obj.update_history(self.simulator.time, self.simulator.physics_engine.ground_level)
-
-            # Mise à jour des données d'énergie
-            if self.simulator.objects:
-                obj = self.simulator.objects[0]
-                ke = obj.kinetic_energy
-                pe = obj.potential_energy(0)
-                total = ke + pe
-
-                self.energy_data['time'].append(self.simulator.time)
-                self.energy_data['kinetic'].append(ke)
-                self.energy_data['potential'].append(pe)
-                self.energy_data['total'].append(total)
-
-                # Marquer les rebonds (quand on atteint la hauteur max)
-                if peak_height > 0:
-                    self.energy_data['rebounds'].append(len(self.energy_data['time']) - 1)
-
-                # Limiter la taille des données
-                max_points = 1000
-                if len(self.energy_data['time']) > max_points:
-                    # Garder les derniers points
-                    for key in ['time', 'kinetic', 'potential', 'total']:
-                        self.energy_data[key] = self.energy_data[key][-max_points:]
+                self.bounce_times.append(event.time)
+            elif event.kind == APEX:
+                peak_reached = True
+                self.bounce_heights.append(event.value)
+                print(f"Rebond {len(self.bounce_heights)}: hauteur max = {event.value:.3f}m")
+            elif event.kind == REST:
+                record = True
+
+        if record or peak_reached:
+            self.record_sample(peak_reached)
+
+    def record_sample(self, peak_reached: bool = False):
+        """Ajoute l'état courant à l'historique de l'objet et aux données d'énergie"""
+        if not self.simulator.objects:
+            return
 
-                    # Ajuster les indices de rebonds
-                    self.energy_data['rebounds'] = [idx - (len(self.energy_data['time']) - max_points)
-                                                    for idx in self.energy_data['rebounds']
-                                                    if idx >= len(self.energy_data['time']) - max_points]
+        # Mise à jour de l'historique de l'objet
+        obj = self.simulator.objects[0]
+        obj.update_history(self.simulator.time, self.simulator.physics_engine.ground_level)
+
+        self.append_energy(self.simulator.time, obj.kinetic_energy, obj.potential_energy(0), peak_reached)
+
+    def record_history_samples(self, obj: PhysicsObject, start: int):
+        """Ajoute aux données d'énergie les états enregistrés par le simulateur depuis l'indice start"""
+        history = obj.history
+        # Le simulateur date chaque état du début de son pas, l'application de sa fin
+        times = history['time'][start:] + self.simulator.dt
+        for time, ke, pe in zip(times.tolist(), history['kinetic_energy'][start:].tolist(),
+                                history['potential_energy'][start:].tolist()):
+            self.append_energy(time, ke, pe)
+
+    def append_energy(self, time: float, ke: float, pe: float, peak_reached: bool = False):
+        """Ajoute un point aux données d'énergie"""
+        self.energy_data['time'].append(time)
+        self.energy_data['kinetic'].append(ke)
+        self.energy_data['potential'].append(pe)
+        self.energy_data['total'].append(ke + pe)
+
+        # Marquer les rebonds (quand on atteint la hauteur max)
+        if peak_reached:
+            self.energy_data['rebounds'].append(len(self.energy_data['time']) - 1)
+
+        # Limiter la taille des données
+        max_points = 1000
+        if len(self.energy_data['time']) > max_points:
+            # Garder les derniers points
+            for key in ['time', 'kinetic', 'potential', 'total']:
+                self.energy_data[key] = self.energy_data[key][-max_points:]
+
+            # Ajuster les indices de rebonds
+            self.energy_data['rebounds'] = [idx - (len(self.energy_data['time']) - max_points)
+                                            for idx in self.energy_data['rebounds']
+                                            if idx >= len(self.energy_data['time']) - max_points]
+
+    def display_position(self, obj: PhysicsObject) -> tuple:
+        """Position (x, y) à afficher pour l'objet"""
+        if (self.previous_position is None or self.paused or
+                self.simulator.physics_engine.simulation_stopped or
+                TIME_SCALES[self.selected_time_scale]["factor"] is None):
+            return obj.x, obj.y
+        return self.accumulator.interpolate(self.previous_position, (obj.x, obj.y))
+
+    def fill_frame(self, frame: SimulationFrame):
+        """Recopie dans l'image tout ce que l'affichage lit"""
+        frame.time = self.simulator.time
+        if self.simulator.objects:
+            source = self.simulator.objects[0]
+            frame.copy_object(source)
+            frame.display_position = self.display_position(source)
+            frame.copy_trail(source.history['x'], source.history['y'])
+        else:
+            frame.copy_object(None)
+            frame.display_position = (0.0, 0.0)
+            frame.trail = frame._trail[:0]
+
+        for key, values in self.energy_data.items():
+            frame.energy_data[key][:] = values
+        frame.bounce_heights[:] = self.bounce_heights
+        frame.bounce_times[:] = self.bounce_times
+        frame.physics_info.clear()
+        frame.physics_info.update(self.simulator.physics_engine.get_physics_info())
+
+    def run_physics(self, command):
+        """Exécute une commande qui modifie la simulation, dans le thread physique s'il existe"""
+        if self.physics_worker is not None:
+            self.physics_worker.submit(command)
+        else:
+            command()
 
+    def start_physics_worker(self):
+        """Lance la physique dans un thread qui recopie l'état dans le double tampon"""
+        self.physics_worker = PhysicsWorker(self.update_simulation, self.fill_frame, self.frames)
+        self.physics_worker.start()
 
+    def stop_physics_worker(self):
+        """Arrête le thread physique"""
+        if self.physics_worker is not None:
+            self.physics_worker.stop()
+            self.physics_worker = None
 
     def draw_header(self, title: str):
         """Dessine l'en-tête moderne"""
@@ -164,10 +377,11 @@ class SingleBallSimulationApp:
 
     def draw_bounce_table(self, x: int, y: int, width: int, height: int):
         """Dessine le tableau des hauteurs de rebonds"""
+        frame = self.frame
         table_card = ModernCard(x, y, width, height, "Hauteurs des Rebonds")
         table_card.draw(self.screen)
 
-        if not self.bounce_heights:
+        if not frame.bounce_heights:
             no_data_text = pygame.font.SysFont("Arial", 14).render("Aucun rebond pour le moment", True, ModernColors.TEXT_LIGHT)
             text_rect = no_data_text.get_rect(center=(x + width // 2, y + height // 2))
             self.screen.blit(no_data_text, text_rect)
@@ -197,23 +411,23 @@ class SingleBallSimulationApp:
 
         # Données
         initial_height = INITIAL_HEIGHTS[self.selected_height]
-        visible_rows = min(len(self.bounce_heights), (height - 90) // row_height)
-        start_idx = max(0, len(self.bounce_heights) - visible_rows)
+        visible_rows = min(len(frame.bounce_heights), (height - 90) // row_height)
+        start_idx = max(0, len(frame.bounce_heights) - visible_rows)
 
         for i in range(visible_rows):
             data_idx = start_idx + i
-            if data_idx >= len(self.bounce_heights):
+            if data_idx >= len(frame.bounce_heights):
                 break
 
             bounce_num = data_idx + 1
-            bounce_height = self.bounce_heights[data_idx]
-            bounce_time = self.bounce_times[data_idx]
+            bounce_height = frame.bounce_heights[data_idx]
+            bounce_time = frame.bounce_times[data_idx]
 
             # Calcul de la perte (par rapport à la hauteur précédente)
             if data_idx == 0:
                 previous_height = initial_height
             else:
-                previous_height = self.bounce_heights[data_idx - 1]
+                previous_height = frame.bounce_heights[data_idx - 1]
 
             height_loss = ((previous_height - bounce_height) / previous_height) * 100 if previous_height > 0 else 0
 
@@ -247,15 +461,15 @@ class SingleBallSimulationApp:
                 col_x += col_width
 
         # Indicateur s'il y a plus de rebonds
-        if len(self.bounce_heights) > visible_rows:
-            more_text = f"... et {len(self.bounce_heights) - visible_rows} rebonds précédents"
+        if len(frame.bounce_heights) > visible_rows:
+            more_text = f"... et {len(frame.bounce_heights) - visible_rows} rebonds précédents"
             more_surface = pygame.font.SysFont("Arial", 10).render(more_text, True, ModernColors.TEXT_LIGHT)
             self.screen.blit(more_surface, (x + 20, y + height - 25))
 
         # Statistiques rapides du tableau
-        if len(self.bounce_heights) >= 2:
-            avg_loss = sum((self.bounce_heights[i-1] - self.bounce_heights[i]) / self.bounce_heights[i-1] * 100
-                           for i in range(1, len(self.bounce_heights))) / (len(self.bounce_heights) - 1)
+        if len(frame.bounce_heights) >= 2:
+            avg_loss = sum((frame.bounce_heights[i-1] - frame.bounce_heights[i]) / frame.bounce_heights[i-1] * 100
+                           for i in range(1, len(frame.bounce_heights))) / (len(frame.bounce_heights) - 1)
 
             stats_y = y + height - 45
             stats_text = f"Perte moyenne par rebond: {avg_loss:.1f}%"
@@ -264,10 +478,11 @@ class SingleBallSimulationApp:
 
     def draw_energy_graph(self, x: int, y: int, width: int, height: int):
         """Dessine le graphique d'énergie avec dissipation"""
+        frame = self.frame
         graph_card = ModernCard(x, y, width, height, "Dissipation d'Énergie au Fil du Temps")
         graph_card.draw(self.screen)
 
-        if len(self.energy_data['time']) < 2:
+        if len(frame.energy_data['time']) < 2:
             return
 
         # Zone de dessin
@@ -277,8 +492,8 @@ class SingleBallSimulationApp:
         plot_height = height - 90
 
         # Valeurs min/max pour normalisation
-        max_energy = max(max(self.energy_data['total'], default=[1]), 1)
-        max_time = max(self.energy_data['time']) if self.energy_data['time'] else 1
+        max_energy = max(max(frame.energy_data['total'], default=[1]), 1)
+        max_time = max(frame.energy_data['time']) if frame.energy_data['time'] else 1
 
         # Grille horizontale (énergie)
         for i in range(1, 6):
@@ -331,16 +546,16 @@ class SingleBallSimulationApp:
             self.screen.blit(text, (legend_x + 15, legend_y))
 
         # Courbes d'énergie
-        if len(self.energy_data['time']) > 1:
+        if len(frame.energy_data['time']) > 1:
             curves = [
-                (self.energy_data['kinetic'], ModernColors.DANGER, 2),
-                (self.energy_data['potential'], ModernColors.SECONDARY, 2),
-                (self.energy_data['total'], ModernColors.BALL2, 3)
+                (frame.energy_data['kinetic'], ModernColors.DANGER, 2),
+                (frame.energy_data['potential'], ModernColors.SECONDARY, 2),
+                (frame.energy_data['total'], ModernColors.BALL2, 3)
             ]
 
             for data, color, thickness in curves:
                 points = []
-                for i, (time_val, energy_val) in enumerate(zip(self.energy_data['time'], data)):
+                for i, (time_val, energy_val) in enumerate(zip(frame.energy_data['time'], data)):
                     px = plot_x + int(time_val / max_time * plot_width)
                     py = plot_y + plot_height - int(energy_val / max_energy * plot_height)
                     points.append((px, py))
@@ -349,10 +564,10 @@ class SingleBallSimulationApp:
                     pygame.draw.lines(self.screen, color, False, points, thickness)
 
             # Marquer les rebonds
-            for rebound_idx in self.energy_data['rebounds']:
-                if rebound_idx < len(self.energy_data['time']):
-                    time_val = self.energy_data['time'][rebound_idx]
-                    energy_val = self.energy_data['total'][rebound_idx]
+            for rebound_idx in frame.energy_data['rebounds']:
+                if rebound_idx < len(frame.energy_data['time']):
+                    time_val = frame.energy_data['time'][rebound_idx]
+                    energy_val = frame.energy_data['total'][rebound_idx]
 
                     px = plot_x + int(time_val / max_time * plot_width)
                     py = plot_y + plot_height - int(energy_val / max_energy * plot_height)
@@ -365,9 +580,9 @@ class SingleBallSimulationApp:
                     pygame.draw.circle(self.screen, ModernColors.WARNING, (px, py), 4)
 
         # Affichage de la perte d'énergie
-        if len(self.energy_data['total']) > 1:
-            initial_energy = self.energy_data['total'][0]
-            current_energy = self.energy_data['total'][-1]
+        if len(frame.energy_data['total']) > 1:
+            initial_energy = frame.energy_data['total'][0]
+            current_energy = frame.energy_data['total'][-1]
             energy_loss = initial_energy - current_energy
             loss_percentage = (energy_loss / initial_energy) * 100 if initial_energy > 0 else 0
 
@@ -377,6 +592,7 @@ class SingleBallSimulationApp:
 
     def draw_simulation_area(self, x: int, y: int, width: int, height: int):
         """Dessine la zone de simulation"""
+        frame = self.frame
         sim_card = ModernCard(x, y, width, height, "Zone de Simulation")
         sim_card.draw(self.screen)
 
@@ -419,20 +635,22 @@ class SingleBallSimulationApp:
                                  (grid_x, sim_y), (grid_x, ground_y), 1)
 
         # Objet en simulation
-        if self.simulator.objects:
-            obj = self.simulator.objects[0]
+        if frame.obj is not None:
+            obj = frame.obj
+
+            # Position affichée, interpolée entre les deux derniers états physiques
+            obj_x, obj_y = frame.display_position
 
             # Position à l'écran
-            ball_x = origin_x + int(obj.x * SCALE * 0.5)  # Facteur pour centrer
-            ball_y = ground_y - int(obj.y * SCALE)
+            ball_x = origin_x + int(obj_x * SCALE * 0.5)  # Facteur pour centrer
+            ball_y = ground_y - int(obj_y * SCALE)
 
             # Trajectoire (trace des dernières positions)
-            if len(obj.history['x']) > 1:
+            if len(frame.trail) > 1:
                 trail_points = []
-                trail_length = min(50, len(obj.history['x']))
-                for i in range(len(obj.history['x']) - trail_length, len(obj.history['x'])):
-                    trail_x = origin_x + int(obj.history['x'][i] * SCALE * 0.5)
-                    trail_y = ground_y - int(obj.history['y'][i] * SCALE)
+                for trail_position_x, trail_position_y in frame.trail:
+                    trail_x = origin_x + int(trail_position_x * SCALE * 0.5)
+                    trail_y = ground_y - int(trail_position_y * SCALE)
                     trail_points.append((trail_x, trail_y))
 
                 # Dessiner la trace avec transparence décroissante
@@ -444,8 +662,8 @@ class SingleBallSimulationApp:
                                          trail_points[i], trail_points[i+1], 1)
 
             # Ombre de la balle
-            shadow_radius = max(3, BALL_RADIUS - int(obj.y * 1.5))
-            shadow_alpha = max(30, 120 - int(obj.y * 10))
+            shadow_radius = max(3, BALL_RADIUS - int(obj_y * 1.5))
+            shadow_alpha = max(30, 120 - int(obj_y * 10))
             pygame.draw.ellipse(self.screen, (0, 0, 0, shadow_alpha),
                                 (ball_x - shadow_radius, ground_y - 3, shadow_radius * 2, 8))
 
@@ -475,7 +693,7 @@ class SingleBallSimulationApp:
 
         # Indicateur d'état de simulation
         status_y = sim_y + sim_height - 20
-        if self.simulator.physics_engine.simulation_stopped:
+        if frame.physics_info['simulation_stopped']:
             status_text = "🛑 SIMULATION TERMINÉE - Balle arrêtée"
             status_color = ModernColors.DANGER
         elif self.paused:
@@ -493,11 +711,12 @@ class SingleBallSimulationApp:
         stats_card = ModernCard(x, y, width, height, "Statistiques Détaillées")
         stats_card.draw(self.screen)
 
-        if not self.simulator.objects:
+        frame = self.frame
+        if frame.obj is None:
             return
 
-        obj = self.simulator.objects[0]
-        physics_info = self.simulator.physics_engine.get_physics_info()
+        obj = frame.obj
+        physics_info = frame.physics_info
         font = pygame.font.SysFont("Arial", 13)
         title_font = pygame.font.SysFont("Arial", 14, bold=True)
         y_offset = 50
@@ -544,7 +763,7 @@ class SingleBallSimulationApp:
         y_offset += 25
 
         current_stats = [
-            ("Temps", f"{self.simulator.time:.2f} s"),
+            ("Temps", f"{frame.time:.2f} s"),
             ("Position Y", f"{obj.y:.3f} m"),
             ("Vitesse", f"{obj.speed:.3f} m/s"),
             ("Vitesse X", f"{obj.vx:.3f} m/s"),
@@ -566,8 +785,8 @@ class SingleBallSimulationApp:
         pe = obj.potential_energy(0)
         total_energy = ke + pe
 
-        if len(self.energy_data['total']) > 0:
-            initial_energy = self.energy_data['total'][0]
+        if len(frame.energy_data['total']) > 0:
+            initial_energy = frame.energy_data['total'][0]
             energy_loss = initial_energy - total_energy
             loss_percentage = (energy_loss / initial_energy) * 100 if initial_energy > 0 else 0
         else:
@@ -595,7 +814,7 @@ class SingleBallSimulationApp:
         y_offset += 25
 
         # Calcul de la hauteur max du dernier rebond
-        last_bounce_height = max(self.bounce_heights) if self.bounce_heights else 0
+        last_bounce_height = max(frame.bounce_heights) if frame.bounce_heights else 0
 
         bounce_stats = [
             ("Nombre total", f"{physics_info['total_rebounds']}"),
@@ -685,6 +904,7 @@ class SingleBallSimulationApp:
 
     def draw_simulation_screen(self):
         """Dessine l'écran de simulation"""
+        frame = self.frame
         self.screen.fill(ModernColors.BACKGROUND)
         self.draw_header("Simulation de Dissipation d'Énergie")
 
@@ -693,21 +913,25 @@ class SingleBallSimulationApp:
         mouse_pos = pygame.mouse.get_pos()
 
         pause_text = "Reprendre" if self.paused else "Pause"
+        speed_button = ModernButton(SCREEN_WIDTH - 690, 15, 150, 50,
+                                    f"Vitesse: {TIME_SCALES[self.selected_time_scale]['name']}", 'primary', 14)
         pause_button = ModernButton(SCREEN_WIDTH - 530, 15, 120, 50, pause_text, 'warning')
         reset_button = ModernButton(SCREEN_WIDTH - 400, 15, 120, 50, "Reset", 'danger')
         config_button = ModernButton(SCREEN_WIDTH - 270, 15, 120, 50, "Config", 'secondary')
 
         # Affichage du nombre de rebonds dans l'en-tête
-        if self.simulator:
-            rebounds_text = f"Rebonds: {self.simulator.physics_engine.total_rebounds}"
+        if frame.physics_info:
+            rebounds_text = f"Rebonds: {frame.physics_info['total_rebounds']}"
             rebounds_font = pygame.font.SysFont("Arial", 20, bold=True)
             rebounds_surface = rebounds_font.render(rebounds_text, True, (255, 255, 255))
             self.screen.blit(rebounds_surface, (50, 30))
 
+        speed_button.update(mouse_pos, dt)
         pause_button.update(mouse_pos, dt)
         reset_button.update(mouse_pos, dt)
         config_button.update(mouse_pos, dt)
 
+        speed_button.draw(self.screen)
         pause_button.draw(self.screen)
         reset_button.draw(self.screen)
         config_button.draw(self.screen)
@@ -735,30 +959,30 @@ class SingleBallSimulationApp:
         info_card.draw(self.screen)
 
         # Affichage des statistiques de rebonds
-        if len(self.bounce_heights) > 0:
+        if len(frame.bounce_heights) > 0:
             info_y = 650
             info_font = pygame.font.SysFont("Arial", 13)
             title_font = pygame.font.SysFont("Arial", 14, bold=True)
 
             # Calculs statistiques
             initial_height = INITIAL_HEIGHTS[self.selected_height]
-            total_bounces = len(self.bounce_heights)
+            total_bounces = len(frame.bounce_heights)
 
             if total_bounces > 0:
-                highest_bounce = max(self.bounce_heights)
-                lowest_bounce = min(self.bounce_heights)
-                avg_height = sum(self.bounce_heights) / total_bounces
+                highest_bounce = max(frame.bounce_heights)
+                lowest_bounce = min(frame.bounce_heights)
+                avg_height = sum(frame.bounce_heights) / total_bounces
 
                 # Perte d'énergie totale
-                if len(self.energy_data['total']) > 0:
-                    initial_energy = self.energy_data['total'][0]
-                    current_energy = self.energy_data['total'][-1]
+                if len(frame.energy_data['total']) > 0:
+                    initial_energy = frame.energy_data['total'][0]
+                    current_energy = frame.energy_data['total'][-1]
                     total_energy_loss = ((initial_energy - current_energy) / initial_energy) * 100
                 else:
                     total_energy_loss = 0
 
                 # Temps total de simulation
-                total_time = self.simulator.time
+                total_time = frame.time
 
                 info_stats = [
                     f"Nombre total de rebonds: {total_bounces}",
@@ -787,15 +1011,17 @@ class SingleBallSimulationApp:
             text_rect = no_bounce_surface.get_rect(center=(col1_width + 40 + (col2_width + col3_width) // 2, 740))
             self.screen.blit(no_bounce_surface, text_rect)
 
-        return pause_button, reset_button, config_button
+        return pause_button, reset_button, config_button, speed_button
 
     async def run(self):
         """Boucle principale de l'application"""
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
 
-            # Mise à jour de la simulation
-            self.update_simulation()
+            # Mise à jour de la simulation (sauf si un thread s'en charge)
+            if self.physics_worker is None:
+                self.update_simulation(dt)
+                self.frames.write(self.fill_frame)
 
             # Gestion des événements
             for event in pygame.event.get():
@@ -809,24 +1035,33 @@ class SingleBallSimulationApp:
                     if event.key == pygame.K_SPACE:
                         self.paused = not self.paused
                     elif event.key == pygame.K_r:
-                        self.reset_simulation()
+                        self.run_physics(self.reset_simulation)
+                    elif event.key == pygame.K_t:
+                        self.run_physics(lambda: self.set_time_scale(self.selected_time_scale + 1))
+                    elif pygame.K_1 <= event.key < pygame.K_1 + len(TIME_SCALES):
+                        index = event.key - pygame.K_1
+                        self.run_physics(lambda: self.set_time_scale(index))
                     elif event.key == pygame.K_ESCAPE:
                         if self.state == "simulation":
                             self.state = "config"
 
-            # Rendu
-            if self.state == "config":
-                ui_elements = self.draw_config_screen()
-                self.config_ui_elements = ui_elements
-            else:
-                ui_elements = self.draw_simulation_screen()
-                self.sim_ui_elements = ui_elements
+            # Rendu à partir de la dernière image publiée (non réécrite pendant le dessin)
+            with self.frames.read() as frame:
+                self.frame = frame
+                if self.state == "config":
+                    ui_elements = self.draw_config_screen()
+                    self.config_ui_elements = ui_elements
+                else:
+                    ui_elements = self.draw_simulation_screen()
+                    self.sim_ui_elements = ui_elements
 
             pygame.display.flip()
 
             # Nécessaire pour la compatibilité web
             await asyncio.sleep(0)
 
+        self.stop_physics_worker()
+
     async def handle_click(self, pos):
         """Gère les clics de souris"""
         if self.state == "config":
@@ -835,7 +1070,7 @@ class SingleBallSimulationApp:
             if start_button.rect.collidepoint(pos):
                 start_button.click()
                 self.state = "simulation"
-                self.reset_simulation()
+                self.run_physics(self.reset_simulation)
 
             elif ball_selector.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos)):
                 self.selected_ball = ball_selector.selected_index
@@ -850,7 +1085,7 @@ class SingleBallSimulationApp:
                 self.selected_height = height_selector.selected_index
 
         else:  # simulation
-            pause_button, reset_button, config_button = self.sim_ui_elements
+            pause_button, reset_button, config_button, speed_button = self.sim_ui_elements
 
             if pause_button.rect.collidepoint(pos):
                 pause_button.click()
@@ -858,15 +1093,19 @@ class SingleBallSimulationApp:
 
             elif reset_button.rect.collidepoint(pos):
                 reset_button.click()
-                self.reset_simulation()
+                self.run_physics(self.reset_simulation)
 
             elif config_button.rect.collidepoint(pos):
                 config_button.click()
                 self.state = "config"
 
+            elif speed_button.rect.collidepoint(pos):
+                speed_button.click()
+                self.run_physics(lambda: self.set_time_scale(self.selected_time_scale + 1))
+
 async def main():
     """Point d'entrée principal"""
-    app = SingleBallSimulationApp()
+    app = SingleBallSimulationApp(threaded='--threaded' in sys.argv)
     await app.run()
 
 if __name__ == "__main__":
@@ -1,9 +1,79 @@
 import numpy as np
 
+# Solution exacte du vol libre avec frottement linéaire : dv/dt = -g - c·v (c = k/m).
+# Les fonctions acceptent des scalaires ou des tableaux (un scénario par élément).
+
+def _series_or_exact(x, exact, series):
+    """Évalue exact(x), remplacé par son développement limité pour x petit"""
+    x = np.asarray(x, dtype=float)
+    small = x < 1e-3
+    safe = np.where(small, 1.0, x)
+    return np.where(small, series(x), exact(safe))
+
+def _flight_state(y0, v0, c, tau, g):
+    """
+    Position et vitesse après une durée tau de vol libre
+
+    Écriture sans soustraction de termes voisins, précise pour les vols très
+    courts et valable sans frottement (c = 0 donne la parabole).
+    """
+    x = c * tau
+    # (1 - e^-x) / x et (x + e^-x - 1) / x², qui valent 1 et 1/2 sans frottement
+    decay = _series_or_exact(x, lambda x: -np.expm1(-x) / x,
+                             lambda x: 1 - x / 2 + x ** 2 / 6 - x ** 3 / 24)
+    drag = _series_or_exact(x, lambda x: (x + np.expm1(-x)) / x ** 2,
+                            lambda x: 0.5 - x / 6 + x ** 2 / 24 - x ** 3 / 120)
+    y = y0 + v0 * tau * decay - g * tau ** 2 * drag
+    v = v0 * np.exp(-x) - g * tau * decay
+    return y, v
+
+def _apex_time(v0, c, g):
+    """Durée jusqu'au sommet (0 si la balle descend déjà)"""
+    rise = np.maximum(v0, 0.0) / g
+    # ln(1 + c·v0/g) / c, qui vaut v0/g sans frottement
+    return rise * _series_or_exact(c * rise, lambda x: np.log1p(x) / x,
+                                   lambda x: 1 - x / 2 + x ** 2 / 3 - x ** 3 / 4)
+
+def _impact_time(y0, v0, c, g):
+    """Durée de vol jusqu'au sol (méthode de Newton encadrée, menée en parallèle)"""
+    y0, v0, c = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (y0, v0, c)))
+    lo = _apex_time(v0, c, g)
+    apex = _flight_state(y0, v0, c, lo, g)[0]
+
+    # Borne supérieure : chute sans frottement depuis le sommet, allongée si besoin
+    hi = lo + np.sqrt(2 * np.maximum(apex, 0.0) / g)
+    above = _flight_state(y0, v0, c, hi, g)[0] > 0
+    while above.any():
+        hi = np.where(above, lo + 2 * (hi - lo), hi)
+        above = _flight_state(y0, v0, c, hi, g)[0] > 0
+
+    t = hi
+    converged = apex <= 0
+    for _ in range(60):
+        y, v = _flight_state(y0, v0, c, t, g)
+        lo = np.where(y > 0, t, lo)
+        hi = np.where(y > 0, hi, t)
+        t_next = t - np.divide(y, v, out=np.zeros_like(y), where=v != 0)
+        bisect = (v == 0) | (t_next <= lo) | (t_next >= hi)
+        t_next = np.where(bisect, 0.5 * (lo + hi), t_next)
+        # Critère relatif : les derniers vols ne durent qu'une fraction de pas
+        converged |= (y == 0) | (np.abs(t_next - t) <= 1e-14 * t)
+        if converged.all():
+            break
+        t = np.where(converged, t, t_next)
+    return np.where(apex <= 0, lo, t)
+
 class ChuteLibre:
     g = 9.81  # Accélération due à la gravité (m/s^2)
+    result_cache = None  # Cache disque optionnel (src.utils.result_cache.ResultCache)
 
-    def __init__(self, m, y0, v0, dt, T, k, e):
+    def __init__(self, m, y0, v0, dt, T, k, e, lazy=False, chunk_size=4096):
+        """
+        Args:
+            lazy: Ne calcule la trajectoire que par blocs, au fur et à mesure que
+                current_step avance (voir ensure_computed) ; sans cache de résultats
+            chunk_size: Nombre d'instants calculés par bloc en mode paresseux
+        """
         self.m = m
         self.y0 = y0
         self.v0 = v0
@@ -11,6 +81,8 @@ class ChuteLibre:
         self.T = T
         self.k = k
         self.e = e
+        self.lazy = lazy
+        self.chunk_size = chunk_size
 
         self.n_steps = int(T / dt)
         self.t = np.linspace(0, T, self.n_steps)
@@ -33,12 +105,13 @@ class ChuteLibre:
         self.current_step = 0
         self.time = 0
 
-        # Exécute la simulation immédiatement
-        self.simulate()
-
-    def calcul_speed(self, current_speed):
-        acceleration = -self.g - (self.k / self.m) * current_speed
-        return current_speed + acceleration * self.dt
+        # Exécute la simulation immédiatement, ou seulement le premier bloc
+        if lazy:
+            self._reset_schedule()
+            self.computed_steps = 0
+            self.ensure_computed(0)
+        else:
+            self.simulate()
 
     def kinetic_energy(self, speed):
         return 0.5 * self.m * speed ** 2
@@ -49,40 +122,140 @@ class ChuteLibre:
     def total_energy(self, kinetic, potential):
         return kinetic + potential
 
+    # Tableaux sauvegardés dans le cache de résultats
+    CACHED_ARRAYS = ('y', 'v', 'Ec', 'Ep', 'E_total', 'rebound_indices', 'max_heights', 'max_times')
+
+    def parameters(self):
+        """Retourne les paramètres qui déterminent entièrement la simulation"""
+        return {'m': self.m, 'y0': self.y0, 'v0': self.v0, 'dt': self.dt, 'T': self.T,
+                'k': self.k, 'e': self.e, 'g': self.g}
+
     def simulate(self):
-        # Simulation avec méthode d'Euler explicite
-        self.rebound_indices = []  # Pour stocker les indices des rebonds
-        for i in range(1, self.n_steps):
-            # Mise à jour de la vitesse
-            self.v[i] = self.calcul_speed(self.v[i-1])
-            # Mise à jour de la position
-            self.y[i] = self.y[i-1] + self.v[i-1] * self.dt
-            # Gestion du rebond
-            if self.y[i] <= 0 and self.v[i] < 0:
-                self.y[i] = 0
-                self.v[i] = -self.e * self.v[i]
-                self.rebound_indices.append(i)
-            # Calcul des énergies
-            self.Ec[i] = self.kinetic_energy(self.v[i])
-            self.Ep[i] = self.potential_energy(self.y[i])
-            self.E_total[i] = self.total_energy(self.Ec[i], self.Ep[i])
+        # Réutilise un résultat déjà calculé pour les mêmes paramètres
+        cache = self.result_cache
+        if cache is not None:
+            key = cache.key('ChuteLibre.simulate', self.parameters())
+            cached = cache.get(key)
+            if cached is not None:
+                self.y, self.v, self.Ec, self.Ep, self.E_total = (
+                    cached.arrays[name] for name in self.CACHED_ARRAYS[:5])
+                self.rebound_indices = cached.arrays['rebound_indices'].tolist()
+                self.max_heights = cached.arrays['max_heights'].tolist()
+                self.max_times = cached.arrays['max_times'].tolist()
+                self.computed_steps = self.n_steps
+                return
 
-        # Calcul des hauteurs maximales après chaque rebond
+        self._integrate()
+
+        if cache is not None:
+            cache.put(key, {name: np.asarray(getattr(self, name)) for name in self.CACHED_ARRAYS})
+
+    def _position(self, y0, v0, tau):
+        """Position et vitesse exactes après une durée tau de vol libre (vectorisé)"""
+        return _flight_state(y0, v0, self.k / self.m, tau, self.g)
+
+    def _apex_time(self, v0):
+        """Durée jusqu'au sommet (0 si la balle descend déjà)"""
+        return float(_apex_time(v0, self.k / self.m, self.g))
+
+    def _impact_time(self, y0, v0):
+        """Durée de vol jusqu'au sol"""
+        return float(_impact_time(y0, v0, self.k / self.m, self.g))
+
+    def _integrate(self):
+        # Solution exacte du modèle à frottement linéaire, morceau par morceau entre les rebonds
+        self._reset_schedule()
+        self._extend_schedule(self.T)
+        self._fill(0, self.n_steps)
+        self.computed_steps = self.n_steps
+
+    def _reset_schedule(self):
+        """Oublie les vols calculés (seul le vol initial est connu)"""
+        self._starts, self._heights, self._speeds = [0.0], [self.y0], [self.v0]
+        self._rest_time = None
+        self._schedule_done = False
+        self.rebound_indices = []  # Premier instant de la grille après chaque impact
         self.max_heights = [self.y0]  # Hauteur initiale comme premier maximum
         self.max_times = [0]  # Temps initial
-        for i in self.rebound_indices:
-            j = i
-            while j < self.n_steps - 1 and self.y[j] < self.y[j + 1]:
-                j += 1
-            if j < self.n_steps:
-                self.max_heights.append(self.y[j])
-                self.max_times.append(self.t[j])
+
+    def _truncate_schedule(self, flights):
+        """Ne garde que les `flights` premiers vols (0 : repart des conditions initiales)"""
+        if flights == 0:
+            self._reset_schedule()
+            return
+        del self._starts[flights:], self._heights[flights:], self._speeds[flights:]
+        del self.rebound_indices[flights - 1:], self.max_heights[flights:], self.max_times[flights:]
+        self._rest_time = None
+        self._schedule_done = False
+
+    def _extend_schedule(self, until):
+        """Calcule les rebonds successifs jusqu'à connaître le vol en cours à l'instant until"""
+        while not self._schedule_done and self._starts[-1] <= until:
+            y_start, v_start = self._heights[-1], self._speeds[-1]
+            if y_start <= 0 and v_start <= 0:
+                self._rest_time = self._starts[-1]
+                self._schedule_done = True
+                break
+            flight = self._impact_time(y_start, v_start)
+            if self.rebound_indices and flight < self.dt:
+                # Vol plus court qu'un pas de temps : la balle est considérée arrêtée
+                self._rest_time = self._starts[-1]
+                self._schedule_done = True
+                break
+            t_impact = self._starts[-1] + flight
+            if t_impact >= self.T:
+                self._schedule_done = True
+                break
+            v_impact = self._position(y_start, v_start, flight)[1]
+            speed = -self.e * v_impact
+            self._starts.append(t_impact)
+            self._heights.append(0.0)
+            self._speeds.append(speed)
+            self.rebound_indices.append(int(np.searchsorted(self.t, t_impact)))
+
+            # Sommet exact du rebond
+            apex_time = self._apex_time(speed)
+            self.max_heights.append(float(self._position(0.0, speed, apex_time)[0]))
+            self.max_times.append(float(t_impact + apex_time))
+
+    def _fill(self, start, end):
+        """Évalue les instants start..end-1 (chaque instant utilise le vol qui le contient)"""
+        t = self.t[start:end]
+        starts, heights, speeds = np.array(self._starts), np.array(self._heights), np.array(self._speeds)
+        flight = np.searchsorted(starts, t, side='right') - 1
+        y, v = self._position(heights[flight], speeds[flight], t - starts[flight])
+        if self._rest_time is not None:
+            resting = t >= self._rest_time
+            y[resting] = 0.0
+            v[resting] = 0.0
+        self.y[start:end] = np.maximum(y, 0.0)
+        self.v[start:end] = v
+
+        # Calcul des énergies
+        self.Ec[start:end] = self.kinetic_energy(self.v[start:end])
+        self.Ep[start:end] = self.potential_energy(self.y[start:end])
+        self.E_total[start:end] = self.total_energy(self.Ec[start:end], self.Ep[start:end])
+
+    def ensure_computed(self, step):
+        """
+        Mode paresseux : calcule la trajectoire jusqu'à l'indice step inclus
+
+        Le calcul avance par blocs de chunk_size instants ; sans effet si
+        l'indice est déjà calculé.
+        """
+        if step < self.computed_steps:
+            return
+        end = min(self.n_steps, (step // self.chunk_size + 1) * self.chunk_size)
+        self._extend_schedule(self.t[end - 1])
+        self._fill(self.computed_steps, end)
+        self.computed_steps = end
 
     def update(self, paused=False):
         """Met à jour la simulation si elle n'est pas en pause"""
         if not paused and self.current_step < self.n_steps - 1:
             self.current_step += 1
             self.time = self.t[self.current_step]
+            self.ensure_computed(self.current_step)
 
     def reset(self):
         """Réinitialise la simulation"""
@@ -90,7 +263,18 @@ class ChuteLibre:
         self.time = 0
 
     def update_parameters(self, **kwargs):
-        """Met à jour les paramètres de simulation et réinitialise"""
+        """
+        Met à jour les paramètres de simulation et réinitialise
+
+        En mode paresseux, seule la partie affectée est oubliée : un changement
+        de restitution garde tout ce qui précède le premier rebond, les autres
+        paramètres repartent de t=0 (dt et T changent la grille de temps).
+        L'instant affiché est conservé et recalculé à la demande ; si la
+        grille change, c'est le pas le plus proche du même instant, ramené
+        à la nouvelle durée. En mode complet, la simulation repart de t=0.
+        """
+        previous = self.parameters()
+
         # Mettre à jour les paramètres avec les valeurs fournies
         for key, value in kwargs.items():
             if hasattr(self, key):
@@ -100,41 +284,205 @@ class ChuteLibre:
         if 'h0' in kwargs:
             self.y0 = kwargs['h0']
 
-        # Réexécute la simulation avec les nouveaux paramètres
-        self.__init__(self.m, self.y0, self.v0, self.dt, self.T, self.k, self.e)
+        changed = {name for name, value in self.parameters().items() if previous[name] != value}
+        if not self.lazy or changed & {'dt', 'T'}:
+            # Réexécute la simulation avec les nouveaux paramètres (__init__ remet le pas à 0)
+            displayed_time = self.t[self.current_step]
+            self.__init__(self.m, self.y0, self.v0, self.dt, self.T, self.k, self.e,
+                          lazy=self.lazy, chunk_size=self.chunk_size)
+            if self.lazy:
+                self.current_step = int(np.abs(self.t - displayed_time).argmin())
+                self.time = self.t[self.current_step]
+        elif changed - {'e'}:
+            self._reset_schedule()
+            self.computed_steps = 0
+        elif changed:
+            first_rebound = self.rebound_indices[0] if self.rebound_indices else self.computed_steps
+            self._truncate_schedule(1)
+            self.computed_steps = min(self.computed_steps, first_rebound)
+        self.ensure_computed(self.current_step)
 
     # Méthodes pour accéder aux données actuelles
     @property
     def position(self):
         """Retourne la position actuelle"""
+        self.ensure_computed(self.current_step)
         return self.y[self.current_step]
 
     @property
     def velocity(self):
         """Retourne la vitesse actuelle"""
+        self.ensure_computed(self.current_step)
         return self.v[self.current_step]
 
-    # Méthodes pour accéder aux données historiques complètes
+    # Méthodes pour accéder aux données historiques complètes (calculées en entier si besoin)
     def get_time_data(self):
         """Retourne toutes les données temporelles"""
         return self.t
 
     def get_position_data(self):
         """Retourne toutes les données de position"""
+        self.ensure_computed(self.n_steps - 1)
         return self.y
 
     def get_velocity_data(self):
         """Retourne toutes les données de vitesse"""
+        self.ensure_computed(self.n_steps - 1)
         return self.v
 
     def get_energy_data(self):
         """Retourne toutes les données d'énergie"""
+        self.ensure_computed(self.n_steps - 1)
         return self.Ec, self.Ep, self.E_total
 
     def get_max_heights(self):
         """Retourne les hauteurs maximales après chaque rebond"""
+        self.ensure_computed(self.n_steps - 1)
         return self.max_heights, self.max_times
 
     def get_rebound_indices(self):
         """Retourne les indices des rebonds"""
-        return self.rebound_indices
\ No newline at end of file
+        self.ensure_computed(self.n_steps - 1)
+        return self.rebound_indices
+
+class ChuteLibreBatch:
+    """
+    Plusieurs chutes libres (une par jeu de paramètres m, k, e, y0) calculées ensemble
+
+    Même modèle que ChuteLibre, mais les rebonds de tous les scénarios sont
+    cherchés en parallèle et les trajectoires remplies dans des tableaux 2D
+    (n_scenarios, n_steps).
+    """
+    g = ChuteLibre.g
+
+    def __init__(self, m, y0, v0, dt, T, k, e, dtype=np.float64, labels=None):
+        """
+        Args:
+            m, y0, v0, k, e: Scalaires ou tableaux (diffusés à la même longueur)
+            dt, T: Pas et durée, communs à tous les scénarios
+            dtype: Type de stockage des trajectoires (np.float32 divise la mémoire
+                par deux ; les calculs restent en float64)
+            labels: Description de chaque scénario (facultatif)
+        """
+        self.m, self.y0, self.v0, self.k, self.e = (
+            np.array(value, dtype=float) for value in np.broadcast_arrays(
+                *(np.atleast_1d(value) for value in (m, y0, v0, k, e))))
+        self.dt = dt
+        self.T = T
+        self.dtype = np.dtype(dtype)
+        self.n_scenarios = len(self.m)
+        self.labels = list(labels) if labels is not None else list(range(self.n_scenarios))
+
+        self.n_steps = int(T / dt)
+        self.t = np.linspace(0, T, self.n_steps)
+        shape = (self.n_scenarios, self.n_steps)
+        self.y = np.zeros(shape, dtype=self.dtype)
+        self.v = np.zeros(shape, dtype=self.dtype)
+        self.Ec = np.zeros(shape, dtype=self.dtype)  # Énergie cinétique
+        self.Ep = np.zeros(shape, dtype=self.dtype)  # Énergie potentielle
+        self.E_total = np.zeros(shape, dtype=self.dtype)  # Énergie totale
+
+        self.simulate()
+
+    @classmethod
+    def from_grid(cls, ball_types=None, ground_types=None, heights=None, dt=0.001, T=10.0, **kwargs):
+        """
+        Toutes les combinaisons balles × sols × hauteurs (listes de config.py par défaut)
+
+        Les étiquettes sont des tuples (nom de balle, nom de sol, hauteur).
+        """
+        if ball_types is None or ground_types is None or heights is None:
+            import config
+            ball_types = config.ball_types if ball_types is None else ball_types
+            ground_types = config.ground_types if ground_types is None else ground_types
+            heights = config.heights if heights is None else heights
+
+        combinations = [(ball, ground, height) for ball in ball_types
+                        for ground in ground_types for height in heights]
+        return cls(m=[ball["m"] for ball, _, _ in combinations],
+                   y0=[height for _, _, height in combinations],
+                   v0=0.0, dt=dt, T=T,
+                   k=[ball["k"] for ball, _, _ in combinations],
+                   e=[ground["e"] for _, ground, _ in combinations],
+                   labels=[(ball["name"], ground["name"], height) for ball, ground, height in combinations],
+                   **kwargs)
+
+    def simulate(self):
+        """Calcule les rebonds de tous les scénarios, puis remplit les trajectoires"""
+        c = self.k / self.m
+        starts, heights, speeds = [np.zeros(self.n_scenarios)], [self.y0], [self.v0]
+        rest_time = np.full(self.n_scenarios, np.inf)
+        active = np.ones(self.n_scenarios, dtype=bool)
+        y_start, v_start, t_start = self.y0, self.v0, np.zeros(self.n_scenarios)
+
+        # Un rebond de chaque scénario encore actif par itération
+        while active.any():
+            flight = _impact_time(y_start, v_start, c, self.g)
+            resting = (y_start <= 0) & (v_start <= 0)
+            if len(starts) > 1:
+                # Vol plus court qu'un pas de temps : la balle est considérée arrêtée
+                resting |= flight < self.dt
+            resting &= active
+            rest_time = np.where(resting, t_start, rest_time)
+            t_impact = t_start + flight
+            active &= ~resting & (t_impact < self.T)
+            if not active.any():
+                break
+
+            v_impact = _flight_state(y_start, v_start, c, flight, self.g)[1]
+            y_start = np.zeros(self.n_scenarios)
+            v_start = np.where(active, -self.e * v_impact, 0.0)
+            t_start = np.where(active, t_impact, np.inf)
+            starts.append(t_start)
+            heights.append(y_start)
+            speeds.append(v_start)
+
+        self._fill(np.stack(starts, axis=1), np.stack(heights, axis=1),
+                   np.stack(speeds, axis=1), rest_time)
+
+        # Rebonds et sommets exacts, par scénario (les vols inexistants valent inf)
+        impacts = np.stack(starts[1:], axis=1) if len(starts) > 1 else np.zeros((self.n_scenarios, 0))
+        rebound_speeds = np.stack(speeds[1:], axis=1) if len(speeds) > 1 else impacts
+        apex_times = _apex_time(rebound_speeds, c[:, None], self.g)
+        apex_heights = _flight_state(0.0, rebound_speeds, c[:, None], apex_times, self.g)[0]
+        indices = np.searchsorted(self.t, impacts)
+        self.bounce_counts = np.isfinite(impacts).sum(axis=1)
+        self.rebound_indices = [indices[i, :count].tolist() for i, count in enumerate(self.bounce_counts)]
+        self.max_heights = [[float(self.y0[i])] + apex_heights[i, :count].tolist()
+                            for i, count in enumerate(self.bounce_counts)]
+        self.max_times = [[0] + (impacts[i, :count] + apex_times[i, :count]).tolist()
+                          for i, count in enumerate(self.bounce_counts)]
+
+    def _fill(self, starts, heights, speeds, rest_time, max_elements=1 << 20):
+        """Évalue les trajectoires sur la grille de temps, par blocs de scénarios"""
+        # Premier instant de chaque vol ; le vol en cours s'obtient par somme cumulée
+        first_steps = np.searchsorted(self.t, starts)
+        rows = max(1, max_elements // max(self.n_steps, 1))
+        for begin in range(0, self.n_scenarios, rows):
+            block = slice(begin, begin + rows)
+            count = len(self.m[block])
+            marks = np.zeros((count, self.n_steps + 1), dtype=np.int32)
+            np.add.at(marks, (np.arange(count)[:, None], first_steps[block, 1:]), 1)
+            flight = np.cumsum(marks[:, :-1], axis=1)
+
+            row = np.arange(count)[:, None]
+            tau = self.t - starts[block][row, flight]
+            c = (self.k[block] / self.m[block])[:, None]
+            y, v = _flight_state(heights[block][row, flight], speeds[block][row, flight], c, tau, self.g)
+            resting = self.t >= rest_time[block, None]
+            y[resting] = 0.0
+            v[resting] = 0.0
+            y = np.maximum(y, 0.0)
+
+            # Calcul des énergies
+            m = self.m[block, None]
+            self.y[block] = y
+            self.v[block] = v
+            self.Ec[block] = 0.5 * m * v ** 2
+            self.Ep[block] = m * self.g * y
+            self.E_total[block] = self.Ec[block] + self.Ep[block]
+
+    def scenario(self, index):
+        """Retourne les tableaux d'un scénario (t, y, v, Ec, Ep, E_total)"""
+        return (self.t, self.y[index], self.v[index],
+                self.Ec[index], self.Ep[index], self.E_total[index])
@@ -0,0 +1,82 @@
+"""États de contact et de suivi des rebonds, par objet"""
+
+from typing import Dict
+from .physics_object import PhysicsObject
+
+class ContactState:
+    """États de contact et de suivi des rebonds d'un objet"""
+
+    __slots__ = ('total_rebounds', 'stopped', 'just_bounced', 'ascending', 'max_height_after_bounce',
+                 'impact_offset', 'impact_speed')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Remet tous les champs à zéro"""
+        self.total_rebounds = 0
+        self.stopped = False
+        self.just_bounced = False
+        self.ascending = False
+        self.max_height_after_bounce = 0.0
+        self.impact_offset = 0.0  # Durée entre le début du pas et le dernier impact du pas
+        self.impact_speed = 0.0  # Vitesse verticale (positive) juste avant le dernier impact
+
+class ContactStateTable:
+    """
+    États de contact des objets pilotés par un même moteur
+
+    Chaque objet suivi reçoit un ContactState, créé au premier accès ; le
+    moteur le récupère une fois par pas et lit ensuite de simples attributs.
+    """
+
+    FIELDS = ContactState.__slots__
+
+    def __init__(self):
+        self._states: Dict[int, ContactState] = {}
+        self._objects: Dict[int, PhysicsObject] = {}  # Références gardées pour que id(obj) reste unique
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, obj: PhysicsObject) -> bool:
+        return id(obj) in self._states
+
+    def get(self, obj: PhysicsObject) -> ContactState:
+        """Retourne l'état de contact de l'objet (créé au premier accès)"""
+        state = self._states.get(id(obj))
+        if state is None:
+            state = ContactState()
+            self._states[id(obj)] = state
+            self._objects[id(obj)] = obj
+        return state
+
+    def release(self, obj: PhysicsObject):
+        """Retire un objet de la table"""
+        self._states.pop(id(obj), None)
+        self._objects.pop(id(obj), None)
+
+    def row(self, obj: PhysicsObject) -> dict:
+        """Retourne une copie des champs de l'objet"""
+        state = self.get(obj)
+        return {name: getattr(state, name) for name in self.FIELDS}
+
+    def restore_row(self, obj: PhysicsObject, values: dict):
+        """Réécrit les champs de l'objet à partir d'une copie"""
+        state = self.get(obj)
+        for name in self.FIELDS:
+            if name in values:
+                setattr(state, name, values[name])
+
+    def reset(self):
+        """Remet tous les champs à zéro (les objets restent suivis)"""
+        for state in self._states.values():
+            state.reset()
+
+    def count_rebounds(self) -> int:
+        """Nombre total de rebonds, tous objets confondus"""
+        return sum(state.total_rebounds for state in self._states.values())
+
+    def all_stopped(self) -> bool:
+        """Vrai si au moins un objet est suivi et que tous sont arrêtés"""
+        return bool(self._states) and all(state.stopped for state in self._states.values())
@@ -0,0 +1,339 @@
+"""Historique des états d'un objet, stocké en colonnes NumPy"""
+
+import os
+import tempfile
+import weakref
+import numpy as np
+from typing import Iterator, Optional, Tuple
+from ..utils.constants import GRAVITY
+
+class HistoryBuffer:
+    """
+    Historique en colonnes pré-allouées (une ligne NumPy par champ)
+
+    Deux modes :
+    - extensible (par défaut) : la capacité double quand le tampon est plein ;
+    - anneau (ring=True) : seuls les `capacity` derniers états sont gardés.
+      Chaque valeur est écrite deux fois (indices i et i + capacity), si bien
+      que la fenêtre courante est toujours une tranche contiguë.
+
+    Les lectures renvoient des vues sans copie ; les énergies ne sont pas
+    stockées mais calculées à la lecture à partir des colonnes d'état, avec
+    la masse et la hauteur de référence en vigueur lors de chaque ajout.
+    L'interface reste celle d'un dictionnaire : history['y'][-1], len(history['x'])...
+    """
+
+    FIELDS = ('time', 'x', 'y', 'vx', 'vy')
+    DERIVED = ('kinetic_energy', 'potential_energy')
+
+    def __init__(self, capacity: int = 1024, ring: bool = False):
+        """
+        Initialise l'historique
+
+        Args:
+            capacity: Nombre d'états pré-alloués (taille de la fenêtre en mode anneau)
+            ring: Garde seulement les `capacity` derniers états
+        """
+        self.capacity = max(1, capacity)
+        self.ring = ring
+        # Paramètres des énergies par plage d'états : (premier état, masse, hauteur de référence)
+        self._energy_parameters = [(0, 1.0, 0.0)]
+        self._appended = 0  # États ajoutés depuis le dernier clear (fenêtre glissante comprise)
+        self._data = np.empty((len(self.FIELDS), 2 * self.capacity if ring else self.capacity))
+        self._count = 0
+        self._head = 0  # Prochaine position d'écriture
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def mass(self) -> float:
+        """Masse utilisée pour l'énergie cinétique des prochains états"""
+        return self._energy_parameters[-1][1]
+
+    @mass.setter
+    def mass(self, value: float):
+        self.set_energy_parameters(value, self.reference_height)
+
+    @property
+    def reference_height(self) -> float:
+        """Hauteur de référence de l'énergie potentielle des prochains états"""
+        return self._energy_parameters[-1][2]
+
+    @reference_height.setter
+    def reference_height(self, value: float):
+        self.set_energy_parameters(self.mass, value)
+
+    def set_energy_parameters(self, mass: float, reference_height: float):
+        """
+        Fixe la masse et la hauteur de référence des états ajoutés ensuite
+
+        Les énergies des états déjà enregistrés gardent les valeurs en vigueur
+        lors de leur ajout.
+        """
+        start, current_mass, current_reference = self._energy_parameters[-1]
+        if mass == current_mass and reference_height == current_reference:
+            return
+        if start == self._appended:
+            # Aucun état n'utilise encore les paramètres courants
+            self._energy_parameters[-1] = (start, mass, reference_height)
+        else:
+            self._energy_parameters.append((self._appended, mass, reference_height))
+
+    def _energy_parameter_columns(self):
+        """Masse et hauteur de référence de chaque état lu (scalaires si elles n'ont pas changé)"""
+        first = self._appended - len(self)
+        parameters = self._energy_parameters
+        # Plages entièrement sorties de la fenêtre (mode anneau)
+        while len(parameters) > 1 and parameters[1][0] <= first:
+            parameters.pop(0)
+        if len(parameters) == 1:
+            return parameters[0][1], parameters[0][2]
+
+        starts = np.array([start for start, _, _ in parameters])
+        rows = np.searchsorted(starts, np.arange(first, self._appended), side='right') - 1
+        masses = np.array([mass for _, mass, _ in parameters])[rows]
+        references = np.array([reference for _, _, reference in parameters])[rows]
+        return masses, references
+
+    def _truncate_energy_parameters(self):
+        """Oublie les plages qui ne concernent que des états supprimés"""
+        kept = [entry for entry in self._energy_parameters if entry[0] < self._appended]
+        latest = self._energy_parameters[-1]
+        if latest[0] >= self._appended:
+            kept.append((self._appended, latest[1], latest[2]))
+        self._energy_parameters = kept
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS or key in self.DERIVED
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def keys(self) -> Tuple[str, ...]:
+        """Noms des colonnes disponibles"""
+        return self.FIELDS + self.DERIVED
+
+    def items(self):
+        """Couples (nom, colonne)"""
+        return [(key, self[key]) for key in self.keys()]
+
+    def append(self, time: float, x: float, y: float, vx: float, vy: float):
+        """Ajoute un état à la fin de l'historique"""
+        if self.ring:
+            head = self._head
+            self._data[:, head] = self._data[:, head + self.capacity] = (time, x, y, vx, vy)
+            self._head = (head + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            self._appended += 1
+            return
+
+        if self._count == self.capacity:
+            self._grow(2 * self.capacity)
+        self._data[:, self._count] = (time, x, y, vx, vy)
+        self._count += 1
+        self._appended += 1
+
+    def extend(self, columns: np.ndarray):
+        """Ajoute un bloc d'états de forme (len(FIELDS), n)"""
+        columns = np.asarray(columns, dtype=float)
+        count = columns.shape[1]
+        if self.ring:
+            for row in columns.T:
+                self.append(*row)
+            return
+
+        if self._count + count > self.capacity:
+            self._grow(max(self._count + count, 2 * self.capacity))
+        self._data[:, self._count:self._count + count] = columns
+        self._count += count
+        self._appended += count
+
+    def _grow(self, capacity: int):
+        """Agrandit le tampon en conservant les états existants"""
+        data = np.empty((len(self.FIELDS), capacity))
+        data[:, :self._count] = self._data[:, :self._count]
+        self._data = data
+        self.capacity = capacity
+
+    def as_array(self) -> np.ndarray:
+        """Vue (len(FIELDS), n) sur les états, du plus ancien au plus récent"""
+        start = (self._head - self._count) % self.capacity if self.ring else 0
+        return self._data[:, start:start + self._count]
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        """Colonne demandée (vue pour les champs d'état, calculée pour les énergies)"""
+        if key in self.FIELDS:
+            return self.as_array()[self.FIELDS.index(key)]
+
+        if key == 'kinetic_energy':
+            vx, vy = self['vx'], self['vy']
+            mass, _ = self._energy_parameter_columns()
+            return 0.5 * mass * (vx * vx + vy * vy)
+        if key == 'potential_energy':
+            mass, reference_height = self._energy_parameter_columns()
+            return mass * GRAVITY * (self['y'] - reference_height)
+        raise KeyError(key)
+
+    def truncate(self, length: int):
+        """Ne garde que les `length` premiers états (mode extensible uniquement)"""
+        if self.ring:
+            raise ValueError("Un historique en anneau ne peut pas être tronqué")
+        self._count = min(self._count, max(0, length))
+        self._appended = self._count
+        self._truncate_energy_parameters()
+
+    def close(self):
+        """Libère les ressources de l'historique (rien à faire en mémoire)"""
+
+    def clear(self):
+        """Vide l'historique (la capacité allouée est conservée)"""
+        self._count = 0
+        self._head = 0
+        self._appended = 0
+        _, mass, reference_height = self._energy_parameters[-1]
+        self._energy_parameters = [(0, mass, reference_height)]
+
+def _remove_spill_file(path, directory):
+    """Supprime le fichier d'un historique déversé temporaire (appelée une seule fois)"""
+    if os.path.exists(path):
+        os.remove(path)
+    if os.path.isdir(directory) and not os.listdir(directory):
+        os.rmdir(directory)
+
+class SpillingHistoryBuffer(HistoryBuffer):
+    """
+    Historique à mémoire bornée qui déverse ses états sur disque
+
+    Les états s'accumulent dans un bloc en mémoire de `chunk_size` lignes ;
+    quand il est plein, il est recopié dans un unique fichier brut (float64)
+    projeté une seule fois en mémoire (numpy.memmap) avec une capacité
+    d'avance. Le fichier est organisé par colonne, de forme (len(FIELDS),
+    capacité) : la lecture d'un champ renvoie une vue contiguë, sans copie.
+
+    Le fichier n'est créé qu'au premier déversement ; tant qu'il n'existe
+    pas, les lectures se font directement dans le bloc en mémoire. Ensuite,
+    une lecture recopie dans la projection les seules lignes du bloc qui n'y
+    sont pas encore, sans écriture explicite sur disque. Quand la capacité
+    est atteinte, les états sont recopiés dans un nouveau fichier deux fois
+    plus grand : les vues déjà lues restent valides.
+
+    Un fichier temporaire est supprimé par close(), ou à défaut quand
+    l'historique est détruit. Dans un répertoire choisi, close() ramène le
+    fichier à la forme (len(FIELDS), len(historique)).
+    """
+
+    FILE_NAME = 'history.f64'
+
+    def __init__(self, path: Optional[str] = None, chunk_size: int = 65536):
+        """
+        Args:
+            path: Répertoire de stockage du fichier history.f64
+                (répertoire temporaire supprimé à la fermeture si None)
+            chunk_size: Nombre d'états gardés en mémoire avant écriture sur disque
+        """
+        super().__init__(chunk_size)
+        temporary = path is None
+        if temporary:
+            path = tempfile.mkdtemp(suffix='.history')
+        else:
+            os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.file = os.path.join(path, self.FILE_NAME)
+        self.temporary = temporary
+        self._map: Optional[np.memmap] = None  # Projection (len(FIELDS), capacité du fichier)
+        self._spilled = 0  # Nombre d'états déjà recopiés dans le fichier
+        self._mirrored = 0  # Lignes du bloc en mémoire déjà recopiées dans la projection
+        self._finalizer = weakref.finalize(self, _remove_spill_file, self.file, path) if temporary else None
+
+    def __len__(self) -> int:
+        return self._spilled + self._count
+
+    @property
+    def file_capacity(self) -> int:
+        """Nombre d'états que le fichier peut contenir sans être réalloué"""
+        return 0 if self._map is None else self._map.shape[1]
+
+    def append(self, time: float, x: float, y: float, vx: float, vy: float):
+        """Ajoute un état ; le bloc est recopié dans le fichier dès qu'il est plein"""
+        super().append(time, x, y, vx, vy)
+        if self._count == self.capacity:
+            self.flush()
+
+    def extend(self, columns: np.ndarray):
+        """Ajoute un bloc d'états, recopié dans le fichier par blocs de chunk_size"""
+        for row in np.asarray(columns, dtype=float).T:
+            self.append(*row)
+
+    def _grow(self, capacity: int):
+        # Le bloc ne grandit jamais : il est vidé dans le fichier dès qu'il est plein
+        self.flush()
+
+    def _reallocate(self, capacity: int):
+        """Recopie les états déjà déversés dans un nouveau fichier de `capacity` lignes"""
+        staging = self.file + '.new'
+        data = np.memmap(staging, dtype=np.float64, mode='w+', shape=(len(self.FIELDS), capacity))
+        if self._map is not None:
+            data[:, :self._spilled] = self._map[:, :self._spilled]
+        os.replace(staging, self.file)
+        self._map = data
+
+    def _mirror(self):
+        """Recopie dans la projection les lignes du bloc en mémoire qui n'y sont pas encore"""
+        end = self._spilled + self._count
+        if end > self.file_capacity:
+            self._reallocate(max(2 * self.file_capacity, end + self.capacity))
+        if self._mirrored < self._count:
+            self._map[:, self._spilled + self._mirrored:end] = self._data[:, self._mirrored:self._count]
+            self._mirrored = self._count
+
+    def flush(self):
+        """Recopie le bloc en mémoire à la suite des états déjà déversés"""
+        if not self._count:
+            return
+        self._mirror()
+        self._spilled += self._count
+        self._count = 0
+        self._mirrored = 0
+
+    def as_array(self) -> np.ndarray:
+        """Vue (len(FIELDS), n) sur les états, chaque champ étant contigu"""
+        if not self._spilled:
+            return super().as_array()
+        self._mirror()
+        return self._map[:, :len(self)]
+
+    def truncate(self, length: int):
+        """Ne garde que les `length` premiers états (la capacité du fichier est conservée)"""
+        length = max(0, length)
+        if length >= self._spilled:
+            self._count = min(self._count, length - self._spilled)
+            self._mirrored = min(self._mirrored, self._count)
+        else:
+            self._count = 0
+            self._mirrored = 0
+            self._spilled = length
+        self._appended = len(self)
+        self._truncate_energy_parameters()
+
+    def clear(self):
+        """Vide l'historique (le fichier et sa capacité sont conservés)"""
+        super().clear()
+        self._spilled = 0
+        self._mirrored = 0
+
+    def close(self):
+        """Libère la projection (et supprime le fichier s'il est temporaire)"""
+        if self.temporary:
+            self._map = None
+            self._finalizer()
+            return
+        if self._map is None:
+            return
+        self.flush()
+        if self._spilled:
+            self._reallocate(self._spilled)
+            self._map.flush()
+        else:
+            os.truncate(self.file, 0)
+        self._map = None
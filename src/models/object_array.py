@@ -0,0 +1,105 @@
+"""Tableau d'objets physiques partageant un même tableau d'état NumPy"""
+
+import numpy as np
+from typing import Iterable, List, Optional
+from .physics_object import PhysicsObject, SlottedPhysicsObject
+
+# Colonnes du tableau d'état (une ligne par objet)
+STATE_FIELDS = ('x', 'y', 'vx', 'vy', 'mass', 'radius', 'drag_coefficient', 'restitution_coefficient')
+COLUMNS = {name: index for index, name in enumerate(STATE_FIELDS)}
+
+def _column_property(index: int) -> property:
+    """Propriété lisant et écrivant une colonne de la ligne de l'objet"""
+    def getter(self):
+        return float(self._state[self._row, index])
+
+    def setter(self, value):
+        self._state[self._row, index] = value
+
+    return property(getter, setter)
+
+class PhysicsObjectView(SlottedPhysicsObject):
+    """
+    Objet physique dont les champs sont une ligne d'un tableau NumPy partagé
+
+    S'utilise partout où un PhysicsObject est attendu ; toute modification
+    est visible immédiatement dans le tableau, et inversement.
+    """
+
+    __slots__ = ('_state', '_row')
+
+    x = _column_property(COLUMNS['x'])
+    y = _column_property(COLUMNS['y'])
+    vx = _column_property(COLUMNS['vx'])
+    vy = _column_property(COLUMNS['vy'])
+    mass = _column_property(COLUMNS['mass'])
+    radius = _column_property(COLUMNS['radius'])
+    drag_coefficient = _column_property(COLUMNS['drag_coefficient'])
+    restitution_coefficient = _column_property(COLUMNS['restitution_coefficient'])
+
+    def __init__(self, state: np.ndarray, row: int, color: str = 'BLUE'):
+        """
+        Args:
+            state: Tableau d'état partagé, de forme (n, len(STATE_FIELDS))
+            row: Ligne de cet objet
+            color: Couleur pour l'affichage
+        """
+        self._state = state
+        self._row = row
+        self.derivatives_cache = None
+        self.color = color
+        self.history = self._empty_history()
+
+    @property
+    def row(self) -> int:
+        """Ligne de l'objet dans le tableau d'état"""
+        return self._row
+
+class PhysicsObjectArray:
+    """Ensemble d'objets dont l'état tient dans un seul tableau (n, 8)"""
+
+    def __init__(self, count: int, color: str = 'BLUE', **defaults):
+        """
+        Args:
+            count: Nombre d'objets
+            color: Couleur commune pour l'affichage
+            **defaults: Valeurs initiales des champs (scalaires ou tableaux de taille count)
+        """
+        reference = PhysicsObject()
+        self.state = np.empty((count, len(STATE_FIELDS)))
+        for name in STATE_FIELDS:
+            self.state[:, COLUMNS[name]] = defaults.pop(name, getattr(reference, name))
+        if defaults:
+            raise TypeError(f"Champs inconnus: {', '.join(defaults)}")
+
+        self.color = color
+        self._views: List[Optional[PhysicsObjectView]] = [None] * count
+
+    @classmethod
+    def from_objects(cls, objects: Iterable[PhysicsObject]) -> 'PhysicsObjectArray':
+        """Copie un ensemble d'objets existants dans un tableau partagé"""
+        objects = list(objects)
+        array = cls(len(objects))
+        for row, obj in enumerate(objects):
+            array.state[row] = [getattr(obj, name) for name in STATE_FIELDS]
+            array.view(row).color = obj.color
+        return array
+
+    def __len__(self) -> int:
+        return self.state.shape[0]
+
+    def column(self, name: str) -> np.ndarray:
+        """Vue (sans copie) sur une colonne de l'état"""
+        return self.state[:, COLUMNS[name]]
+
+    def view(self, row: int) -> PhysicsObjectView:
+        """Objet adossé à la ligne donnée (créé au premier accès)"""
+        view = self._views[row]
+        if view is None:
+            view = PhysicsObjectView(self.state, row, self.color)
+            self._views[row] = view
+        return view
+
+    def views(self) -> List[PhysicsObjectView]:
+        """Tous les objets du tableau"""
+        return [self.view(row) for row in range(len(self))]
@@ -1,14 +1,16 @@
 """Moteur physique pour calculer les forces et accélérations"""
 
 import math
-from typing import Tuple
+from typing import Callable, Tuple
 from .physics_object import PhysicsObject
+from .contact_state import ContactState, ContactStateTable
 from ..utils.constants import GRAVITY, AIR_DENSITY
 
 class PhysicsEngine:
     """Moteur physique pour la simulation de chute libre avec frottement"""
 
-    def __init__(self, air_resistance: bool = True, ground_level: float = 0.0, air_density_factor: float = 1.0):
+    def __init__(self, air_resistance: bool = True, ground_level: float = 0.0, air_density_factor: float = 1.0,
+                 event_location: bool = False):
         """
         Initialise le moteur physique
 
@@ -16,20 +18,58 @@ class PhysicsEngine:
             air_resistance: Active/désactive la résistance de l'air
             ground_level: Hauteur du sol
             air_density_factor: Facteur multiplicateur pour la densité de l'air (1.0 = normal, 2.0 = air dense)
+            event_location: Localise l'instant exact d'impact à l'intérieur du pas
         """
         self.air_resistance = air_resistance
         self.ground_level = ground_level
         self.air_density_factor = air_density_factor
-        self.total_rebounds = 0
-        self.simulation_stopped = False
+        self.event_location = event_location
+        self.event_tolerance = 1e-9  # m - tolérance sur la hauteur d'impact
+        self.max_impacts_per_step = 16
         self.stop_threshold_speed = 0.05  # m/s - vitesse en dessous de laquelle on considère l'arrêt
         self.stop_threshold_height = 0.01  # m - hauteur en dessous de laquelle on considère l'arrêt
 
-        # Variables pour suivre la hauteur maximale après chaque rebond
-        self.just_bounced = False
-        self.max_height_after_bounce = 0.0
-        self.previous_y = 0.0
-        self.ascending = False
+        # États de contact et suivi de la hauteur maximale après rebond, par objet
+        self.contacts = ContactStateTable()
+
+    @property
+    def total_rebounds(self) -> int:
+        """Nombre total de rebonds, tous objets confondus"""
+        return self.contacts.count_rebounds()
+
+    @property
+    def simulation_stopped(self) -> bool:
+        """Vrai si tous les objets suivis sont arrêtés"""
+        return self.contacts.all_stopped()
+
+    def is_stopped(self, obj: PhysicsObject) -> bool:
+        """Vrai si cet objet est arrêté"""
+        return self.contacts.get(obj).stopped
+
+    def get_rebounds(self, obj: PhysicsObject) -> int:
+        """Nombre de rebonds de cet objet"""
+        return self.contacts.get(obj).total_rebounds
+
+    def impact_offset(self, obj: PhysicsObject) -> float:
+        """
+        Durée entre le début du dernier pas et l'impact de cet objet
+
+        Vaut la durée du pas si l'impact n'a pas été localisé (détecté en fin de pas).
+        """
+        return self.contacts.get(obj).impact_offset
+
+    def impact_speed(self, obj: PhysicsObject) -> float:
+        """Vitesse verticale (positive) de cet objet juste avant son dernier impact"""
+        return self.contacts.get(obj).impact_speed
+
+    def wake_object(self, obj: PhysicsObject):
+        """Lève l'état d'arrêt d'un objet pour qu'il soit de nouveau mis à jour"""
+        self.contacts.get(obj).stopped = False
+
+    def forget_object(self, obj: PhysicsObject):
+        """Oublie l'état de contact d'un objet retiré de la simulation"""
+        self.contacts.release(obj)
+        obj.derivatives_cache = None
 
     @property
     def effective_air_density(self) -> float:
@@ -51,13 +91,12 @@ class PhysicsEngine:
         force_drag_x = 0.0
         force_drag_y = 0.0
 
-        if self.air_resistance and obj.speed > 0:
-            # F_drag = 0.5 * ρ * Cd * A * v²
-            drag_magnitude = 0.5 * self.effective_air_density * obj.drag_coefficient * obj.area * obj.speed ** 2
-
-            # Direction opposée à la vitesse
-            force_drag_x = -drag_magnitude * obj.vx / obj.speed
-            force_drag_y = -drag_magnitude * obj.vy / obj.speed
+        speed = obj.speed
+        if self.air_resistance and speed > 0:
+            # F_drag = 0.5 * ρ * Cd * A * v², dirigée à l'opposé de la vitesse
+            drag_factor = 0.5 * self.effective_air_density * obj.drag_coefficient * obj.area * speed
+            force_drag_x = -drag_factor * obj.vx
+            force_drag_y = -drag_factor * obj.vy
 
         total_force_x = force_gravity_x + force_drag_x
         total_force_y = force_gravity_y + force_drag_y
@@ -73,6 +112,42 @@ class PhysicsEngine:
         """
         self.air_density_factor = max(0.1, min(10.0, factor))  # Limiter entre 0.1x et 10x
 
+    def drag_constant(self, obj: PhysicsObject) -> float:
+        """Constante de traînée k = 0.5 * ρ * Cd * A / m de l'objet"""
+        return 0.5 * self.effective_air_density * obj.drag_coefficient * obj.area / obj.mass
+
+    def derivatives_kernel(self, obj: PhysicsObject) -> Callable:
+        """
+        Retourne la fonction de dérivées (x, y, vx, vy) -> (dx/dt, dy/dt, dvx/dt, dvy/dt)
+
+        La fonction est pure : elle ne lit ni ne modifie l'objet, les constantes
+        étant capturées une fois pour toutes, et calcule la vitesse une seule fois.
+        Elle est mise en cache sur l'objet avec les paramètres qui la déterminent
+        (masse, rayon, coefficient de traînée, résistance et densité de l'air) ;
+        le cache n'est réutilisé que si ces paramètres n'ont pas changé.
+        """
+        cached = obj.derivatives_cache
+        if (cached is not None and cached[0] is self and cached[1] == self.air_resistance and
+                cached[2] == self.air_density_factor and cached[3] == obj.mass and
+                cached[4] == obj.radius and cached[5] == obj.drag_coefficient):
+            return cached[6]
+
+        if not self.air_resistance:
+            def derivatives(x, y, vx, vy):
+                return vx, vy, 0.0, -GRAVITY
+        else:
+            drag_constant = self.drag_constant(obj)
+            sqrt = math.sqrt
+
+            def derivatives(x, y, vx, vy):
+                # a_drag = -k * |v| * v
+                drag = drag_constant * sqrt(vx * vx + vy * vy)
+                return vx, vy, -drag * vx, -GRAVITY - drag * vy
+
+        obj.derivatives_cache = (self, self.air_resistance, self.air_density_factor,
+                                 obj.mass, obj.radius, obj.drag_coefficient, derivatives)
+        return derivatives
+
     def calculate_derivatives(self, x: float, y: float, vx: float, vy: float, obj: PhysicsObject) -> Tuple[float, float, float, float]:
         """
         Calcule les dérivées pour l'intégration numérique
@@ -80,23 +155,7 @@ class PhysicsEngine:
         Returns:
             (dx/dt, dy/dt, dvx/dt, dvy/dt)
         """
-        # Mise à jour temporaire de la position/vitesse pour le calcul des forces
-        old_x, old_y, old_vx, old_vy = obj.x, obj.y, obj.vx, obj.vy
-        obj.x, obj.y, obj.vx, obj.vy = x, y, vx, vy
-
-        # Calcul des forces
-        force_x, force_y = self.calculate_forces(obj)
-
-        # Restauration de l'état original
-        obj.x, obj.y, obj.vx, obj.vy = old_x, old_y, old_vx, old_vy
-
-        # Dérivées
-        dx_dt = vx
-        dy_dt = vy
-        dvx_dt = force_x / obj.mass
-        dvy_dt = force_y / obj.mass
-
-        return dx_dt, dy_dt, dvx_dt, dvy_dt
+        return self.derivatives_kernel(obj)(x, y, vx, vy)
 
     def handle_ground_collision(self, obj: PhysicsObject) -> bool:
         """
@@ -105,6 +164,10 @@ class PhysicsEngine:
         Returns:
             True si collision détectée
         """
+        return self._handle_ground_collision(obj, self.contacts.get(obj))
+
+    def _handle_ground_collision(self, obj: PhysicsObject, contact: ContactState) -> bool:
+        """handle_ground_collision avec l'état de contact déjà récupéré"""
         if obj.y - obj.radius <= self.ground_level and obj.vy < 0:
             # Repositionner l'objet au-dessus du sol
             obj.y = self.ground_level + obj.radius
@@ -113,16 +176,18 @@ class PhysicsEngine:
             new_vy = -obj.vy * obj.restitution_coefficient
             new_vx = obj.vx * obj.restitution_coefficient  # Réduction de la vitesse horizontale
 
+            contact.impact_speed = -obj.vy
+
             # Vérifier si le rebond est significatif
             if abs(new_vy) > self.stop_threshold_speed:
                 obj.vy = new_vy
                 obj.vx = new_vx
-                self.total_rebounds += 1
+                contact.total_rebounds += 1
 
                 # Marquer qu'il vient de rebondir
-                self.just_bounced = True
-                self.max_height_after_bounce = obj.y
-                self.ascending = True
+                contact.just_bounced = True
+                contact.max_height_after_bounce = obj.y
+                contact.ascending = True
 
                 return True
             else:
@@ -130,7 +195,7 @@ class PhysicsEngine:
                 obj.vy = 0
                 obj.vx = 0
                 obj.y = self.ground_level + obj.radius
-                self.simulation_stopped = True
+                contact.stopped = True
                 return True
 
         return False
@@ -142,19 +207,23 @@ class PhysicsEngine:
         Returns:
             Hauteur maximale atteinte si on vient de passer le pic, sinon 0
         """
-        if not self.just_bounced:
+        return self._track_max_height(obj, self.contacts.get(obj))
+
+    def _track_max_height(self, obj: PhysicsObject, contact: ContactState) -> float:
+        """track_max_height avec l'état de contact déjà récupéré"""
+        if not contact.just_bounced:
             return 0.0
 
         # Vérifier si on monte ou on descend
-        if self.ascending and obj.vy <= 0:
+        if contact.ascending and obj.vy <= 0:
             # On vient d'atteindre le pic
-            self.ascending = False
+            contact.ascending = False
             peak_height = obj.y
-            self.just_bounced = False
+            contact.just_bounced = False
             return peak_height
-        elif self.ascending:
+        elif contact.ascending:
             # On continue de monter, mettre à jour la hauteur max
-            self.max_height_after_bounce = max(self.max_height_after_bounce, obj.y)
+            contact.max_height_after_bounce = max(contact.max_height_after_bounce, obj.y)
 
         return 0.0
 
@@ -162,12 +231,16 @@ class PhysicsEngine:
         """
         Vérifie si la balle doit s'arrêter (vitesse et hauteur très faibles)
         """
+        return self._check_stop_condition(obj, self.contacts.get(obj))
+
+    def _check_stop_condition(self, obj: PhysicsObject, contact: ContactState) -> bool:
+        """check_stop_condition avec l'état de contact déjà récupéré"""
         if (obj.speed < self.stop_threshold_speed and
                 obj.y - obj.radius <= self.ground_level + self.stop_threshold_height):
             obj.vx = 0
             obj.vy = 0
             obj.y = self.ground_level + obj.radius
-            self.simulation_stopped = True
+            contact.stopped = True
             return True
         return False
 
@@ -178,43 +251,141 @@ class PhysicsEngine:
         Returns:
             (collision_detected, peak_height_if_reached)
         """
-        if self.simulation_stopped:
+        contact = self.contacts.get(obj)
+        if contact.stopped:
             return False, 0.0
+        contact.impact_offset = dt
 
-        # Sauvegarder la position précédente
-        self.previous_y = obj.y
-
-        # Fonction pour calculer les dérivées
-        def derivatives(x, y, vx, vy):
-            return self.calculate_derivatives(x, y, vx, vy, obj)
+        # Fonction pour calculer les dérivées (mise en cache sur l'objet)
+        derivatives = self.derivatives_kernel(obj)
 
         # État actuel
         state = (obj.x, obj.y, obj.vx, obj.vy)
 
         # Calcul du nouvel état
-        new_state = numerical_method.step(state, derivatives, dt)
-        obj.x, obj.y, obj.vx, obj.vy = new_state
+        located_collision = False
+        if self.event_location:
+            located_collision = self._integrate_with_impacts(obj, contact, state, derivatives, dt,
+                                                             numerical_method)
+            if contact.stopped:
+                return True, 0.0
+        else:
+            new_state = numerical_method.step(state, derivatives, dt)
+            obj.x, obj.y, obj.vx, obj.vy = new_state
 
         # Vérification des conditions d'arrêt
-        if self.check_stop_condition(obj):
+        if self._check_stop_condition(obj, contact):
             return False, 0.0
 
         # Suivi de la hauteur maximale
-        peak_height = self.track_max_height(obj)
+        peak_height = self._track_max_height(obj, contact)
 
         # Vérification collision avec le sol
-        collision = self.handle_ground_collision(obj)
+        collision = self._handle_ground_collision(obj, contact) or located_collision
 
         return collision, peak_height
 
+    def _ground_gap(self, state: Tuple[float, float, float, float], radius: float) -> float:
+        """Distance entre le bas de l'objet et le sol (négative si pénétration)"""
+        return state[1] - radius - self.ground_level
+
+    def locate_ground_impact(self, state: Tuple[float, float, float, float], derivatives, dt: float,
+                             numerical_method, radius: float) -> float:
+        """
+        Trouve l'instant d'impact dans le pas par la méthode de Illinois (fausse position)
+
+        Args:
+            state: État au début du pas, au-dessus du sol
+            derivatives: Fonction calculant les dérivées
+            dt: Durée du pas, à la fin duquel l'objet a pénétré le sol
+            numerical_method: Méthode numérique utilisée pour les sous-pas
+            radius: Rayon de l'objet
+
+        Returns:
+            Durée entre le début du pas et l'impact (0 si l'objet touche déjà le sol)
+        """
+        # Sous-pas d'essai : le pas suggéré et les statistiques de la méthode restent intacts
+        def gap(tau):
+            return self._ground_gap(numerical_method.trial_step(state, derivatives, tau), radius)
+
+        lo, f_lo = 0.0, self._ground_gap(state, radius)
+        hi, f_hi = dt, gap(dt)
+
+        if f_lo <= self.event_tolerance:
+            # Objet posé au sol (typiquement juste après un rebond) : chercher un instant en vol
+            lo = dt
+            for _ in range(30):
+                lo *= 0.5
+                f_lo = gap(lo)
+                if f_lo > self.event_tolerance:
+                    break
+            else:
+                return 0.0
+
+        side = 0
+        tau = hi
+        for _ in range(60):
+            tau = hi - f_hi * (hi - lo) / (f_hi - f_lo)
+            f_tau = gap(tau)
+            if abs(f_tau) <= self.event_tolerance or hi - lo <= 1e-12:
+                break
+            if f_tau < 0:
+                hi, f_hi = tau, f_tau
+                if side == -1:
+                    f_lo *= 0.5
+                side = -1
+            else:
+                lo, f_lo = tau, f_tau
+                if side == 1:
+                    f_hi *= 0.5
+                side = 1
+
+        return tau
+
+    def _integrate_with_impacts(self, obj: PhysicsObject, contact: ContactState,
+                                state: Tuple[float, float, float, float],
+                                derivatives, dt: float, numerical_method) -> bool:
+        """
+        Intègre sur dt en découpant le pas à chaque impact avec le sol
+
+        Returns:
+            True si au moins un impact a été traité
+        """
+        collided = False
+        remaining = dt
+        new_state = state
+
+        for _ in range(self.max_impacts_per_step):
+            new_state = numerical_method.step(state, derivatives, remaining)
+            if not (self._ground_gap(new_state, obj.radius) <= 0 and new_state[3] < 0):
+                break
+
+            tau = self.locate_ground_impact(state, derivatives, remaining, numerical_method, obj.radius)
+            impact_state = numerical_method.step(state, derivatives, tau) if tau > 0 else state
+            obj.x, _, obj.vx, obj.vy = impact_state
+            obj.y = self.ground_level + obj.radius
+
+            if not self._handle_ground_collision(obj, contact):
+                # Pas d'impact exploitable : l'état final sera traité comme sans localisation
+                break
+
+            collided = True
+            contact.impact_offset = dt - remaining + tau
+            if contact.stopped:
+                return True
+
+            state = (obj.x, obj.y, obj.vx, obj.vy)
+            remaining -= tau
+            new_state = state
+            if remaining <= 0:
+                break
+
+        obj.x, obj.y, obj.vx, obj.vy = new_state
+        return collided
+
     def reset(self):
         """Remet le moteur physique à zéro"""
-        self.total_rebounds = 0
-        self.simulation_stopped = False
-        self.just_bounced = False
-        self.max_height_after_bounce = 0.0
-        self.previous_y = 0.0
-        self.ascending = False
+        self.contacts.reset()
 
     def get_physics_info(self) -> dict:
         """Retourne les informations physiques"""
@@ -3,9 +3,12 @@
 import math
 from src.utils.constants import DRAG_COEFFICIENTS
 from ..utils.constants import GRAVITY
+from .history import HistoryBuffer, SpillingHistoryBuffer
 
-class PhysicsObject:
-    """Objet physique avec propriétés pour la simulation de chute libre"""
+class PhysicsObjectBase:
+    """Comportement commun à PhysicsObject et SlottedPhysicsObject (sans champ propre)"""
+
+    __slots__ = ()
 
     def __init__(self,
                  x: float = 0.0,
@@ -29,6 +32,9 @@ class PhysicsObject:
             restitution_coefficient: Coefficient de restitution (0-1)
             color: Couleur pour l'affichage
         """
+        # Fonction de dérivées mise en cache par le moteur, avec les paramètres de traînée utilisés
+        self.derivatives_cache = None
+
         self.x = x
         self.y = y
         self.vx = vx
@@ -40,15 +46,34 @@ class PhysicsObject:
         self.color = color
 
         # Historique pour les graphiques
-        self.history = {
-            'time': [],
-            'x': [],
-            'y': [],
-            'vx': [],
-            'vy': [],
-            'kinetic_energy': [],
-            'potential_energy': []
-        }
+        self.history = self._empty_history()
+
+    @staticmethod
+    def _empty_history() -> HistoryBuffer:
+        """Crée un historique vide"""
+        return HistoryBuffer()
+
+    def set_history_capacity(self, capacity: int, ring: bool = False):
+        """
+        Remplace l'historique par un tampon de capacité donnée
+
+        Args:
+            capacity: Nombre d'états pré-alloués
+            ring: Garde seulement les `capacity` derniers états
+        """
+        self.history.close()
+        self.history = HistoryBuffer(capacity, ring)
+
+    def spill_history(self, path: str = None, chunk_size: int = 65536):
+        """
+        Remplace l'historique par un stockage sur disque à mémoire bornée
+
+        Args:
+            path: Répertoire de stockage (répertoire temporaire si None)
+            chunk_size: Nombre d'états gardés en mémoire avant écriture
+        """
+        self.history.close()
+        self.history = SpillingHistoryBuffer(path, chunk_size)
 
     @property
     def area(self) -> float:
@@ -71,20 +96,29 @@ class PhysicsObject:
         return self.mass * GRAVITY * (self.y - reference_height)
 
     def update_history(self, time: float, reference_height: float = 0.0):
-        """Met à jour l'historique des données"""
-        self.history['time'].append(time)
-        self.history['x'].append(self.x)
-        self.history['y'].append(self.y)
-        self.history['vx'].append(self.vx)
-        self.history['vy'].append(self.vy)
-        self.history['kinetic_energy'].append(self.kinetic_energy)
-        self.history['potential_energy'].append(self.potential_energy(reference_height))
+        """Met à jour l'historique des données (les énergies sont dérivées à la lecture)"""
+        history = self.history
+        history.set_energy_parameters(self.mass, reference_height)
+        history.append(time, self.x, self.y, self.vx, self.vy)
 
     def reset_history(self):
         """Remet à zéro l'historique"""
-        for key in self.history:
-            self.history[key].clear()
+        self.history.clear()
 
     def __str__(self) -> str:
-        return f"PhysicsObject(pos=({self.x:.2f}, {self.y:.2f}), " \
-               f"vel=({self.vx:.2f}, {self.vy:.2f}), mass={self.mass:.2f})"
\ No newline at end of file
+        return f"{type(self).__name__}(pos=({self.x:.2f}, {self.y:.2f}), " \
+               f"vel=({self.vx:.2f}, {self.vy:.2f}), mass={self.mass:.2f})"
+
+class PhysicsObject(PhysicsObjectBase):
+    """Objet physique avec propriétés pour la simulation de chute libre"""
+
+class SlottedPhysicsObject(PhysicsObjectBase):
+    """
+    Variante compacte de PhysicsObject, sans __dict__
+
+    Les champs sont des slots : moins de mémoire par objet pour les grands
+    ensembles, mais aucun attribut supplémentaire ne peut être ajouté.
+    """
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'mass', 'radius', 'drag_coefficient',
+                 'restitution_coefficient', 'color', 'history', 'derivatives_cache')
@@ -0,0 +1,377 @@
+"""
+Solutions analytiques de la chute libre avec rebonds
+
+API autonome : FreeFallSimulator intègre toujours pas à pas avec sa méthode
+numérique et n'utilise pas ces trajectoires. Elles servent de référence
+exacte (tests, affichage) et à compute_bounce_table.
+"""
+
+import math
+from abc import ABC, abstractmethod
+import numpy as np
+from typing import Dict, List, NamedTuple, Optional
+from ..models.physics_object import PhysicsObject
+from ..models.physics_engine import PhysicsEngine
+from ..simulation.numerical_methods import NumericalMethod, RK4Method
+from ..utils.constants import DEFAULT_DT, GRAVITY
+
+class BounceEvent(NamedTuple):
+    """Impact avec le sol et sommet qui le suit"""
+    time: float           # Instant de l'impact (s)
+    impact_speed: float   # Vitesse verticale juste avant l'impact (m/s, positive)
+    rebound_speed: float  # Vitesse verticale après rebond (m/s, 0 si arrêt)
+    apex_time: float      # Instant du sommet suivant (s)
+    apex_height: float    # Hauteur du centre au sommet suivant (m)
+
+class _Segment(ABC):
+    """Portion de trajectoire décrite par une formule fermée"""
+
+    def __init__(self, t_start: float, t_end: float):
+        self.t_start = t_start
+        self.t_end = t_end
+
+    @abstractmethod
+    def state(self, tau):
+        """Retourne (x, y, vx, vy) à l'instant t_start + tau (tau scalaire ou tableau)"""
+        pass
+
+class _ParabolicSegment(_Segment):
+    """Vol balistique sans frottement"""
+
+    def __init__(self, t_start, t_end, x, y, vx, vy):
+        super().__init__(t_start, t_end)
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+
+    def state(self, tau):
+        return (self.x + self.vx * tau,
+                self.y + self.vy * tau - 0.5 * GRAVITY * tau ** 2,
+                self.vx + 0.0 * tau,
+                self.vy - GRAVITY * tau)
+
+class _RestSegment(_Segment):
+    """Objet immobile au sol"""
+
+    def __init__(self, t_start, x, y):
+        super().__init__(t_start, math.inf)
+        self.x, self.y = x, y
+
+    def state(self, tau):
+        zero = 0.0 * np.asarray(tau)
+        return self.x + zero, self.y + zero, zero, zero
+
+def _log_cosh(a):
+    """ln(cosh(a)) sans dépassement pour les grands arguments"""
+    a = np.abs(a)
+    return a + np.log1p(np.exp(-2.0 * a)) - math.log(2.0)
+
+class _DragRiseSegment(_Segment):
+    """Montée verticale avec frottement quadratique (solution en tangente)"""
+
+    def __init__(self, t_start, t_end, x, y, vy, terminal_speed):
+        super().__init__(t_start, t_end)
+        self.x, self.y, self.vt = x, y, terminal_speed
+        self.phi = math.atan(vy / terminal_speed)
+
+    def state(self, tau):
+        vt = self.vt
+        angle = self.phi - GRAVITY * np.asarray(tau) / vt
+        y = self.y + (vt * vt / GRAVITY) * np.log(np.cos(angle) / math.cos(self.phi))
+        return self.x + 0.0 * angle, y, 0.0 * angle, vt * np.tan(angle)
+
+class _DragFallSegment(_Segment):
+    """Descente verticale avec frottement quadratique (solution en tangente hyperbolique)"""
+
+    def __init__(self, t_start, t_end, x, y, speed, terminal_speed):
+        super().__init__(t_start, t_end)
+        self.x, self.y, self.vt = x, y, terminal_speed
+        self.at_terminal = abs(speed - terminal_speed) <= 1e-12 * terminal_speed
+        self.above_terminal = speed > terminal_speed and not self.at_terminal
+        # u(t) = vt * tanh(g t / vt + phi), ou vt * coth(...) au-delà de la vitesse limite
+        ratio = terminal_speed / speed if self.above_terminal else speed / terminal_speed
+        self.phi = 0.0 if self.at_terminal else math.atanh(ratio)
+
+    def state(self, tau):
+        vt = self.vt
+        tau = np.asarray(tau)
+        if self.at_terminal:
+            return self.x + 0.0 * tau, self.y - vt * tau, 0.0 * tau, -vt + 0.0 * tau
+
+        arg = GRAVITY * tau / vt + self.phi
+        scale = vt * vt / GRAVITY
+        if self.above_terminal:
+            y = self.y - scale * (np.log(np.sinh(arg)) - math.log(math.sinh(self.phi)))
+            vy = -vt / np.tanh(arg)
+        else:
+            y = self.y - scale * (_log_cosh(arg) - _log_cosh(self.phi))
+            vy = -vt * np.tanh(arg)
+        return self.x + 0.0 * arg, y, 0.0 * arg, vy
+
+class AnalyticTrajectory(ABC):
+    """
+    Trajectoire complète calculée d'impact en impact sous forme fermée
+
+    Les instants d'impact, les vitesses de rebond et les sommets sont obtenus
+    directement ; la position et la vitesse sont évaluées à la demande, à
+    n'importe quel instant, sans intégration pas à pas. Les règles de rebond
+    sont celles de PhysicsEngine (vitesses multipliées par le coefficient de
+    restitution, arrêt si le rebond est trop faible).
+    """
+
+    def __init__(self,
+                 y: float,
+                 vy: float = 0.0,
+                 x: float = 0.0,
+                 vx: float = 0.0,
+                 radius: float = 0.0,
+                 restitution_coefficient: float = 0.8,
+                 ground_level: float = 0.0,
+                 stop_threshold_speed: float = 0.05,
+                 max_bounces: int = 10000):
+        """
+        Initialise et calcule la trajectoire
+
+        Args:
+            x, y: Position initiale du centre (m)
+            vx, vy: Vitesse initiale (m/s)
+            radius: Rayon (m)
+            restitution_coefficient: Coefficient de restitution (0-1)
+            ground_level: Hauteur du sol
+            stop_threshold_speed: Vitesse de rebond en dessous de laquelle l'objet s'arrête
+            max_bounces: Nombre maximal de rebonds calculés
+        """
+        self.restitution_coefficient = restitution_coefficient
+        self.contact_height = ground_level + radius
+        self.ground_level = ground_level
+        self.stop_threshold_speed = stop_threshold_speed
+        self.max_bounces = max_bounces
+
+        self.segments: List[_Segment] = []
+        self.bounces: List[BounceEvent] = []
+        self._build(x, y, vx, vy)
+        self._starts = np.array([segment.t_start for segment in self.segments])
+
+    @abstractmethod
+    def _build(self, x: float, y: float, vx: float, vy: float):
+        """Construit la liste des segments (à définir par les sous-classes)"""
+        pass
+
+    def _bounce(self, time: float, impact_speed: float, vx: float):
+        """
+        Applique la règle de rebond
+
+        Returns:
+            (vitesse_verticale_après, vitesse_horizontale_après), ou None si l'objet s'arrête
+        """
+        rebound_speed = impact_speed * self.restitution_coefficient
+        if rebound_speed > self.stop_threshold_speed and len(self.bounces) < self.max_bounces:
+            return rebound_speed, vx * self.restitution_coefficient
+        self.bounces.append(BounceEvent(time, impact_speed, 0.0, time, self.contact_height))
+        return None
+
+    @property
+    def rest_time(self) -> float:
+        """Instant où l'objet s'immobilise"""
+        return self.segments[-1].t_start
+
+    @property
+    def bounce_count(self) -> int:
+        """Nombre de rebonds effectifs (hors arrêt final)"""
+        return sum(1 for bounce in self.bounces if bounce.rebound_speed > 0)
+
+    def state_at(self, t: float):
+        """Retourne (x, y, vx, vy) à l'instant t"""
+        index = max(0, int(np.searchsorted(self._starts, t, side='right')) - 1)
+        segment = self.segments[index]
+        return tuple(float(value) for value in segment.state(t - segment.t_start))
+
+    def sample(self, times) -> Dict[str, np.ndarray]:
+        """
+        Évalue la trajectoire sur un ensemble d'instants
+
+        Returns:
+            Dictionnaire de tableaux 'time', 'x', 'y', 'vx', 'vy'
+        """
+        times = np.asarray(times, dtype=float)
+        indices = np.maximum(np.searchsorted(self._starts, times, side='right') - 1, 0)
+        result = {'time': times}
+        columns = [np.empty_like(times) for _ in range(4)]
+
+        for index in np.unique(indices):
+            mask = indices == index
+            segment = self.segments[index]
+            for column, values in zip(columns, segment.state(times[mask] - segment.t_start)):
+                column[mask] = values
+
+        result['x'], result['y'], result['vx'], result['vy'] = columns
+        return result
+
+    def energy_at(self, t: float, mass: float) -> dict:
+        """Énergies cinétique, potentielle et totale à l'instant t"""
+        _, y, vx, vy = self.state_at(t)
+        kinetic = 0.5 * mass * (vx * vx + vy * vy)
+        potential = mass * GRAVITY * (y - self.ground_level)
+        return {'kinetic': kinetic, 'potential': potential, 'total': kinetic + potential}
+
+class ParabolicTrajectory(AnalyticTrajectory):
+    """Trajectoire exacte sans frottement : suite de paraboles"""
+
+    def _build(self, x, y, vx, vy):
+        t = 0.0
+        contact = self.contact_height
+        while True:
+            drop = max(0.0, y - contact)
+            impact_speed = math.sqrt(vy * vy + 2.0 * GRAVITY * drop)
+            duration = (vy + impact_speed) / GRAVITY
+            self.segments.append(_ParabolicSegment(t, t + duration, x, y, vx, vy))
+
+            t += duration
+            x += vx * duration
+            rebound = self._bounce(t, impact_speed, vx)
+            if rebound is None:
+                self.segments.append(_RestSegment(t, x, contact))
+                return
+
+            vy, vx = rebound
+            y = contact
+            apex_time = vy / GRAVITY
+            self.bounces.append(BounceEvent(t, impact_speed, vy, t + apex_time,
+                                            contact + vy * vy / (2.0 * GRAVITY)))
+
+class QuadraticDragVerticalTrajectory(AnalyticTrajectory):
+    """
+    Trajectoire verticale exacte avec frottement quadratique
+
+    Montées en tangente, descentes en tangente hyperbolique, pour une force
+    de traînée 0.5 * ρ * Cd * A * v² (celle de PhysicsEngine.calculate_forces).
+    """
+
+    def __init__(self, y: float, drag_constant: float, vy: float = 0.0, **kwargs):
+        """
+        Args:
+            y: Hauteur initiale du centre (m)
+            drag_constant: 0.5 * ρ * Cd * A / m (1/m)
+            vy: Vitesse verticale initiale (m/s)
+            **kwargs: Voir AnalyticTrajectory (la vitesse horizontale doit être nulle)
+        """
+        if kwargs.get('vx', 0.0) != 0.0:
+            raise ValueError("La solution analytique avec frottement n'existe que pour un mouvement vertical")
+        if drag_constant <= 0:
+            raise ValueError("drag_constant doit être strictement positif")
+        self.drag_constant = drag_constant
+        self.terminal_speed = math.sqrt(GRAVITY / drag_constant)
+        super().__init__(y, vy, **kwargs)
+
+    def _build(self, x, y, vx, vy):
+        t = 0.0
+        vt = self.terminal_speed
+        scale = vt * vt / GRAVITY
+        contact = self.contact_height
+
+        while True:
+            if vy > 0:
+                # Montée jusqu'au sommet
+                rise = vt / GRAVITY * math.atan(vy / vt)
+                apex = y + 0.5 * scale * math.log1p((vy / vt) ** 2)
+                self.segments.append(_DragRiseSegment(t, t + rise, x, y, vy, vt))
+                t += rise
+                y, vy = apex, 0.0
+
+            # Descente jusqu'au sol
+            speed = -vy
+            drop = max(0.0, y - contact)
+            impact_speed = math.sqrt(max(0.0, vt * vt - (vt * vt - speed * speed) * math.exp(-2.0 * drop / scale)))
+            segment = _DragFallSegment(t, t, x, y, speed, vt)
+            if segment.at_terminal:
+                duration = drop / vt
+            elif segment.above_terminal:
+                duration = vt / GRAVITY * (math.atanh(vt / impact_speed) - segment.phi)
+            else:
+                duration = vt / GRAVITY * (math.atanh(min(impact_speed / vt, 1.0 - 1e-16)) - segment.phi)
+            segment.t_end = t + duration
+            self.segments.append(segment)
+            t += duration
+
+            rebound = self._bounce(t, impact_speed, 0.0)
+            if rebound is None:
+                self.segments.append(_RestSegment(t, x, contact))
+                return
+
+            vy = rebound[0]
+            y = contact
+            rise = vt / GRAVITY * math.atan(vy / vt)
+            apex = contact + 0.5 * scale * math.log1p((vy / vt) ** 2)
+            self.bounces.append(BounceEvent(t, impact_speed, vy, t + rise, apex))
+
+def analytic_trajectory(obj: PhysicsObject, engine: PhysicsEngine) -> Optional[AnalyticTrajectory]:
+    """
+    Construit la solution analytique adaptée à l'objet, si elle existe
+
+    Returns:
+        ParabolicTrajectory sans résistance de l'air, QuadraticDragVerticalTrajectory
+        pour un mouvement vertical avec frottement, None sinon (mouvement 2D freiné)
+    """
+    common = dict(radius=obj.radius,
+                  restitution_coefficient=obj.restitution_coefficient,
+                  ground_level=engine.ground_level,
+                  stop_threshold_speed=engine.stop_threshold_speed)
+
+    if not engine.air_resistance:
+        return ParabolicTrajectory(obj.y, obj.vy, x=obj.x, vx=obj.vx, **common)
+
+    if obj.vx == 0:
+        drag_constant = 0.5 * engine.effective_air_density * obj.drag_coefficient * obj.area / obj.mass
+        return QuadraticDragVerticalTrajectory(obj.y, drag_constant, vy=obj.vy, x=obj.x, **common)
+
+    return None
+
+def compute_bounce_table(obj: PhysicsObject,
+                         engine: PhysicsEngine,
+                         dt: float = DEFAULT_DT,
+                         numerical_method: Optional[NumericalMethod] = None,
+                         max_duration: float = 120.0) -> List[BounceEvent]:
+    """
+    Table des rebonds d'un objet, analytique si possible
+
+    La solution exacte est utilisée dès qu'elle existe ; l'intégration
+    numérique ne sert de repli que pour le mouvement 2D avec frottement.
+
+    Args:
+        obj: Objet dans son état initial (non modifié)
+        engine: Moteur fournissant les paramètres du sol et de l'air
+        dt: Pas de temps du repli numérique
+        numerical_method: Méthode du repli numérique (RK4 par défaut)
+        max_duration: Durée maximale simulée par le repli numérique
+
+    Returns:
+        Liste des rebonds, le dernier ayant une vitesse de rebond nulle si l'objet s'arrête
+    """
+    trajectory = analytic_trajectory(obj, engine)
+    if trajectory is not None:
+        return list(trajectory.bounces)
+
+    # Repli numérique sur une copie de l'objet
+    body = PhysicsObject(obj.x, obj.y, obj.vx, obj.vy, obj.mass, obj.radius,
+                         obj.drag_coefficient, obj.restitution_coefficient, obj.color)
+    fallback = PhysicsEngine(engine.air_resistance, engine.ground_level, engine.air_density_factor,
+                             event_location=True)
+    fallback.stop_threshold_speed = engine.stop_threshold_speed
+    fallback.stop_threshold_height = engine.stop_threshold_height
+    method = numerical_method or RK4Method()
+
+    bounces: List[BounceEvent] = []
+    contact_height = engine.ground_level + body.radius
+    time = 0.0
+    while time < max_duration and not fallback.is_stopped(body):
+        collision, peak_height = fallback.update_object(body, dt, method)
+
+        if collision:
+            # Instant localisé dans le pas et vitesse avant la collision
+            impact_time = time + fallback.impact_offset(body)
+            impact_speed = fallback.impact_speed(body)
+            rebound_speed = 0.0 if fallback.is_stopped(body) else impact_speed * body.restitution_coefficient
+            bounces.append(BounceEvent(impact_time, impact_speed, rebound_speed, impact_time, contact_height))
+        elif peak_height > 0 and bounces:
+            bounces[-1] = bounces[-1]._replace(apex_time=time + dt, apex_height=peak_height)
+        time += dt
+
+    return bounces
@@ -0,0 +1,295 @@
+"""Simulateur vectorisé pour de grands ensembles d'objets"""
+
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+from ..models.physics_object import PhysicsObject
+from ..models.object_array import STATE_FIELDS, PhysicsObjectArray
+from ..simulation.numerical_methods import EulerMethod, NumericalMethod
+from ..utils.constants import DEFAULT_DT, GRAVITY, AIR_DENSITY
+
+class BatchFreeFallSimulator:
+    """
+    Simulateur de chute libre vectorisé
+
+    Tous les objets sont stockés dans des tampons NumPy (un par champ) et
+    avancés en une seule passe forces / intégration / collisions, sans boucle
+    Python par objet. Les règles physiques sont celles de PhysicsEngine.
+    """
+
+    def __init__(self,
+                 dt: float = DEFAULT_DT,
+                 air_resistance: bool = True,
+                 ground_level: float = 0.0,
+                 air_density_factor: float = 1.0,
+                 numerical_method: Optional[NumericalMethod] = None,
+                 capacity: int = 64):
+        """
+        Initialise le simulateur vectorisé
+
+        Args:
+            dt: Pas de temps
+            air_resistance: Active la résistance de l'air
+            ground_level: Hauteur du sol
+            air_density_factor: Facteur de densité de l'air (1.0 = normal)
+            numerical_method: Méthode numérique (doit accepter des tableaux NumPy)
+            capacity: Nombre d'objets pré-alloués
+        """
+        self.dt = dt
+        self.air_resistance = air_resistance
+        self.ground_level = ground_level
+        self.air_density_factor = air_density_factor
+        self.numerical_method = numerical_method or EulerMethod()
+        self.stop_threshold_speed = 0.05  # m/s
+        self.stop_threshold_height = 0.01  # m
+
+        self.objects: List[PhysicsObject] = []
+        self.count = 0
+        self.time = 0.0
+        self.running = False
+        self.paused = False
+
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._active_index = None  # Indices des objets éveillés (None = à recalculer)
+        self._allocate(max(1, capacity))
+
+    @classmethod
+    def from_object_array(cls, objects: PhysicsObjectArray, **kwargs) -> 'BatchFreeFallSimulator':
+        """
+        Crée un simulateur travaillant directement sur un PhysicsObjectArray
+
+        Les tampons d'état sont des vues sur les colonnes du tableau : aucune
+        copie n'est faite et les objets du tableau reflètent chaque pas. Ajouter
+        d'autres objets ensuite réalloue les tampons et rompt ce partage.
+
+        Args:
+            objects: Tableau d'objets partagé
+            **kwargs: Paramètres du constructeur
+        """
+        simulator = cls(capacity=len(objects), **kwargs)
+        for field in STATE_FIELDS:
+            simulator._buffers[field] = objects.column(field)
+        simulator.objects = objects.views()
+        simulator.count = len(objects)
+        simulator._update_drag_constants()
+        return simulator
+
+    def _allocate(self, capacity: int):
+        """(Ré)alloue les tampons en conservant les objets existants"""
+        old = self._buffers
+        buffers = {field: np.zeros(capacity) for field in STATE_FIELDS}
+        buffers['drag_constant'] = np.zeros(capacity)
+        buffers['peak_height'] = np.zeros(capacity)
+        buffers['rebounds'] = np.zeros(capacity, dtype=np.int64)
+        buffers['stopped'] = np.zeros(capacity, dtype=bool)
+        buffers['ascending'] = np.zeros(capacity, dtype=bool)
+
+        for name, array in old.items():
+            buffers[name][:self.count] = array[:self.count]
+
+        self._buffers = buffers
+        self.capacity = capacity
+
+    @property
+    def effective_air_density(self) -> float:
+        """Densité effective de l'air selon le facteur"""
+        return AIR_DENSITY * self.air_density_factor
+
+    def set_air_density_factor(self, factor: float):
+        """Modifie le facteur de densité de l'air"""
+        self.air_density_factor = max(0.1, min(10.0, factor))
+        self._update_drag_constants()
+        self.wake(slice(0, self.count))
+
+    def _update_drag_constants(self):
+        """Recalcule 0.5 * ρ * Cd * A / m pour tous les objets"""
+        n = self.count
+        b = self._buffers
+        area = np.pi * b['radius'][:n] ** 2
+        b['drag_constant'][:n] = 0.5 * self.effective_air_density * b['drag_coefficient'][:n] * area / b['mass'][:n]
+
+    def add_object(self, obj: PhysicsObject):
+        """Ajoute un objet à la simulation"""
+        self.add_objects([obj])
+
+    def add_objects(self, objects: Iterable[PhysicsObject]):
+        """Ajoute plusieurs objets en une seule copie vers les tampons"""
+        objects = list(objects)
+        required = self.count + len(objects)
+        if required > self.capacity:
+            self._allocate(max(required, 2 * self.capacity))
+
+        start = self.count
+        for field in STATE_FIELDS:
+            self._buffers[field][start:required] = [getattr(obj, field) for obj in objects]
+
+        self.objects.extend(objects)
+        self.count = required
+        self._active_index = None
+        self._update_drag_constants()
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Retourne des vues (sans copie) sur les tampons des objets actifs"""
+        return {name: array[:self.count] for name, array in self._buffers.items()}
+
+    def sync_objects(self):
+        """Recopie l'état des tampons dans les instances PhysicsObject"""
+        b = self._buffers
+        for i, obj in enumerate(self.objects):
+            obj.x = float(b['x'][i])
+            obj.y = float(b['y'][i])
+            obj.vx = float(b['vx'][i])
+            obj.vy = float(b['vy'][i])
+
+    def reset(self):
+        """Remet l'horloge et les compteurs de rebonds à zéro"""
+        self.time = 0.0
+        for name in ('rebounds', 'stopped', 'ascending', 'peak_height'):
+            self._buffers[name][:] = 0
+        self._active_index = None
+
+    def _active(self):
+        """Indices des objets éveillés (tranche complète si aucun ne dort)"""
+        if self._active_index is None:
+            stopped = self._buffers['stopped'][:self.count]
+            self._active_index = np.flatnonzero(~stopped) if stopped.any() else slice(0, self.count)
+        return self._active_index
+
+    @property
+    def sleeping_count(self) -> int:
+        """Nombre d'objets au repos (non intégrés)"""
+        return int(self._buffers['stopped'][:self.count].sum())
+
+    def wake(self, indices):
+        """Réveille les objets d'indices donnés"""
+        self._buffers['stopped'][indices] = False
+        self._active_index = None
+
+    def apply_impulse(self, indices, impulse_x, impulse_y):
+        """
+        Applique une impulsion extérieure (N·s) aux objets donnés et les réveille
+
+        Args:
+            indices: Indice(s) des objets
+            impulse_x, impulse_y: Impulsion(s), scalaires ou tableaux
+        """
+        b = self._buffers
+        b['vx'][indices] += impulse_x / b['mass'][indices]
+        b['vy'][indices] += impulse_y / b['mass'][indices]
+        self.wake(indices)
+
+    def _derivatives(self, drag_constant: np.ndarray):
+        """Construit la fonction de dérivées vectorisée pour la passe courante"""
+        air_resistance = self.air_resistance
+
+        def derivatives(x, y, vx, vy):
+            if air_resistance:
+                # a_drag = -k * |v| * v avec k = 0.5 * ρ * Cd * A / m
+                drag = drag_constant * np.sqrt(vx * vx + vy * vy)
+                return vx, vy, -drag * vx, -GRAVITY - drag * vy
+            return vx, vy, np.zeros_like(vx), np.full_like(vy, -GRAVITY)
+
+        return derivatives
+
+    def step(self):
+        """Effectue un pas de simulation vectorisé sur tous les objets"""
+        if self.paused:
+            return
+
+        b = self._buffers
+        index = self._active()
+        if isinstance(index, np.ndarray) and index.size == 0:
+            # Tous les objets dorment : aucun calcul
+            self.time += self.dt
+            return
+
+        x, y, vx, vy = (b[field][index] for field in ('x', 'y', 'vx', 'vy'))
+        radius = b['radius'][index]
+        restitution = b['restitution_coefficient'][index]
+        rebounds = b['rebounds'][index]
+        ascending = b['ascending'][index]
+        peak = b['peak_height'][index]
+
+        # Intégration
+        derivatives = self._derivatives(b['drag_constant'][index])
+        x, y, vx, vy = self.numerical_method.step((x, y, vx, vy), derivatives, self.dt)
+        x, y, vx, vy = (np.asarray(value, dtype=float) for value in (x, y, vx, vy))
+        rest_height = self.ground_level + radius
+
+        # Condition d'arrêt (vitesse et hauteur très faibles)
+        at_rest = ((vx * vx + vy * vy < self.stop_threshold_speed ** 2) &
+                   (y - radius <= self.ground_level + self.stop_threshold_height))
+
+        # Suivi du pic après rebond
+        reached_peak = ascending & (vy <= 0) & ~at_rest
+        peak = np.where(reached_peak, y, peak)
+        ascending = ascending & ~reached_peak
+
+        # Collision avec le sol
+        hit = ~at_rest & (y - radius <= self.ground_level) & (vy < 0)
+        new_vy = -vy * restitution
+        bounce = hit & (np.abs(new_vy) > self.stop_threshold_speed)
+        stop = at_rest | (hit & ~bounce)
+
+        y = np.where(hit | at_rest, rest_height, y)
+        vx = np.where(bounce, vx * restitution, vx)
+        vy = np.where(bounce, new_vy, vy)
+        vx = np.where(stop, 0.0, vx)
+        vy = np.where(stop, 0.0, vy)
+        rebounds = rebounds + bounce
+        ascending = ascending | bounce
+
+        # Écriture dans les tampons
+        b['x'][index] = x
+        b['y'][index] = y
+        b['vx'][index] = vx
+        b['vy'][index] = vy
+        b['rebounds'][index] = rebounds
+        if stop.any():
+            b['stopped'][index] = stop
+            self._active_index = None
+        b['ascending'][index] = ascending
+        b['peak_height'][index] = peak
+
+        self.time += self.dt
+
+    def run_for_duration(self, duration: float):
+        """Exécute la simulation pendant une durée donnée"""
+        end_time = self.time + duration
+        while self.time < end_time:
+            self.step()
+
+    @property
+    def total_rebounds(self) -> int:
+        """Nombre total de rebonds sur l'ensemble des objets"""
+        return int(self._buffers['rebounds'][:self.count].sum())
+
+    @property
+    def all_stopped(self) -> bool:
+        """Vrai si tous les objets sont arrêtés"""
+        return bool(self.count) and bool(self._buffers['stopped'][:self.count].all())
+
+    def start(self):
+        """Démarre la simulation"""
+        self.running = True
+        self.paused = False
+
+    def pause(self):
+        """Met en pause la simulation"""
+        self.paused = not self.paused
+
+    def stop(self):
+        """Arrête la simulation"""
+        self.running = False
+        self.paused = False
+
+    def get_simulation_info(self) -> dict:
+        """Retourne les informations générales de la simulation"""
+        return {
+            'time': self.time,
+            'paused': self.paused,
+            'objects': self.count,
+            'air_resistance': self.air_resistance,
+            'air_density_factor': self.air_density_factor,
+            'ground_level': self.ground_level,
+            'total_rebounds': self.total_rebounds
+        }
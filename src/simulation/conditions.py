@@ -0,0 +1,89 @@
+"""Conditions d'arrêt pour FreeFallSimulator.run_until"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..models.physics_object import PhysicsObject
+from ..simulation.events import APEX
+
+class StopCondition(ABC):
+    """
+    Condition évaluée après chaque pas ; la simulation s'arrête dès qu'elle est vraie
+
+    Toute fonction simulator -> bool peut aussi servir de condition.
+    """
+
+    def start(self, simulator):
+        """Appelée une fois au début de run_until (ex. pour mémoriser un état de référence)"""
+
+    @abstractmethod
+    def __call__(self, simulator) -> bool:
+        """Retourne True pour arrêter la simulation"""
+        pass
+
+class AllAtRest(StopCondition):
+    """Tous les objets sont au repos"""
+
+    def __call__(self, simulator) -> bool:
+        return not simulator.active_objects
+
+class BounceCount(StopCondition):
+    """Au moins `count` rebonds (d'un objet donné, ou de tous les objets confondus)"""
+
+    def __init__(self, count: int, obj: Optional[PhysicsObject] = None):
+        self.count = count
+        self.obj = obj
+
+    def __call__(self, simulator) -> bool:
+        engine = simulator.physics_engine
+        rebounds = engine.total_rebounds if self.obj is None else engine.get_rebounds(self.obj)
+        return rebounds >= self.count
+
+class EnergyBelow(StopCondition):
+    """
+    L'énergie mécanique totale est passée sous une fraction de sa valeur de départ
+
+    L'énergie potentielle est comptée à partir de la position de repos de
+    chaque objet (centre à un rayon du sol), si bien qu'elle tend vers 0.
+    """
+
+    def __init__(self, fraction: float):
+        """
+        Args:
+            fraction: Fraction de l'énergie de départ (ex. 0.01 pour 1 %)
+        """
+        self.fraction = fraction
+        self.threshold = 0.0
+
+    @staticmethod
+    def mechanical_energy(simulator) -> float:
+        """Énergie mécanique de tous les objets, relative à leur position de repos"""
+        ground_level = simulator.physics_engine.ground_level
+        return sum(obj.kinetic_energy + obj.potential_energy(ground_level + obj.radius)
+                   for obj in simulator.objects)
+
+    def start(self, simulator):
+        self.threshold = self.fraction * self.mechanical_energy(simulator)
+
+    def __call__(self, simulator) -> bool:
+        return self.mechanical_energy(simulator) < self.threshold
+
+class HeightReached(StopCondition):
+    """Un objet (ou l'objet donné) a atteint au moins la hauteur donnée"""
+
+    def __init__(self, height: float, obj: Optional[PhysicsObject] = None):
+        self.height = height
+        self.obj = obj
+
+    def __call__(self, simulator) -> bool:
+        objects = simulator.objects if self.obj is None else (self.obj,)
+        return any(obj.y >= self.height for obj in objects)
+
+class ApexReached(StopCondition):
+    """Un objet (ou l'objet donné) vient d'atteindre le sommet d'un rebond"""
+
+    def __init__(self, obj: Optional[PhysicsObject] = None):
+        self.obj = obj
+
+    def __call__(self, simulator) -> bool:
+        return any(event.kind == APEX and (self.obj is None or event.obj is self.obj)
+                   for event in simulator.last_events)
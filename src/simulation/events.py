@@ -0,0 +1,18 @@
+"""Événements émis pendant la simulation"""
+
+from typing import NamedTuple
+from ..models.physics_object import PhysicsObject
+
+# Types d'événements
+IMPACT = 'impact'  # Rebond sur le sol (value = vitesse verticale après rebond)
+APEX = 'apex'  # Sommet après un rebond (value = hauteur atteinte)
+REST = 'rest'  # Arrêt définitif au sol (value = hauteur de repos)
+
+EVENT_KINDS = (IMPACT, APEX, REST)
+
+class SimulationEvent(NamedTuple):
+    """Événement survenu sur un objet pendant un pas"""
+    kind: str
+    time: float
+    obj: PhysicsObject
+    value: float
@@ -0,0 +1,63 @@
+"""Accumulateur à pas fixe : découple la physique de la fréquence d'affichage"""
+
+from typing import Sequence, Tuple
+from ..utils.constants import MAX_SUBSTEPS_PER_FRAME
+
+class FixedTimestepAccumulator:
+    """
+    Convertit le temps réel écoulé en un nombre entier de pas physiques
+
+    Le temps écoulé (multiplié par l'échelle de temps) s'accumule ; chaque
+    appel à advance retourne le nombre de pas de durée dt qu'il contient et
+    garde le reste pour l'image suivante. Au-delà de max_substeps, le temps
+    en trop est abandonné pour éviter la spirale de ralentissement.
+    """
+
+    def __init__(self, dt: float, time_scale: float = 1.0, max_substeps: int = MAX_SUBSTEPS_PER_FRAME):
+        """
+        Args:
+            dt: Pas de temps physique (s)
+            time_scale: Secondes simulées par seconde réelle
+            max_substeps: Nombre maximal de pas par appel
+        """
+        self.dt = dt
+        self.time_scale = time_scale
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Temps simulé abandonné à cause de la limite
+
+    @property
+    def alpha(self) -> float:
+        """Fraction de pas restant dans l'accumulateur (0 <= alpha < 1)"""
+        return self.accumulator / self.dt
+
+    def reset(self):
+        """Vide l'accumulateur"""
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Ajoute le temps réel écoulé et retourne le nombre de pas à effectuer
+
+        Args:
+            elapsed: Temps réel écoulé depuis l'appel précédent (s)
+        """
+        self.accumulator += max(0.0, elapsed) * self.time_scale
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        if steps > self.max_substeps:
+            self.dropped_time += (steps - self.max_substeps) * self.dt
+            steps = self.max_substeps
+        return steps
+
+    def interpolate(self, previous: Sequence[float], current: Sequence[float]) -> Tuple[float, ...]:
+        """
+        État à afficher entre les deux derniers états physiques
+
+        L'affichage a un pas de retard : alpha = 0 donne l'état précédent,
+        alpha -> 1 l'état courant, ce qui lisse le mouvement quand dt est grand
+        devant la durée d'une image.
+        """
+        alpha = self.alpha
+        return tuple(p + (c - p) * alpha for p, c in zip(previous, current))
@@ -1,7 +1,7 @@
 """Méthodes numériques pour la résolution d'équations différentielles"""
 
 from abc import ABC, abstractmethod
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 class NumericalMethod(ABC):
     """Classe abstraite pour les méthodes numériques"""
@@ -11,6 +11,10 @@ class NumericalMethod(ABC):
         """Effectue un pas de calcul"""
         pass
 
+    def trial_step(self, state: Tuple[float, ...], derivatives: Callable, dt: float) -> Tuple[float, ...]:
+        """Comme step, sans modifier l'état interne de la méthode (pour les essais de localisation)"""
+        return self.step(state, derivatives, dt)
+
 class EulerMethod(NumericalMethod):
     """Méthode d'Euler pour la résolution numérique"""
 
@@ -34,4 +38,175 @@ class EulerMethod(NumericalMethod):
         new_vx = vx + dvx_dt * dt
         new_vy = vy + dvy_dt * dt
 
-        return new_x, new_y, new_vx, new_vy
\ No newline at end of file
+        return new_x, new_y, new_vx, new_vy
+
+def _advance(state: Tuple[float, ...], dt: float, terms) -> Tuple[float, ...]:
+    """
+    Combinaison linéaire : state + dt * Σ c_j * k_j
+
+    Args:
+        state: État de départ
+        dt: Pas de temps
+        terms: Couples (coefficient, dérivées)
+    """
+    result = list(state)
+    for coefficient, k in terms:
+        if coefficient:
+            factor = coefficient * dt
+            result = [value + factor * derivative for value, derivative in zip(result, k)]
+    return tuple(result)
+
+def _max_abs(value) -> float:
+    """Valeur absolue maximale d'un scalaire ou d'un tableau NumPy"""
+    magnitude = abs(value)
+    return float(magnitude.max()) if hasattr(magnitude, 'max') else float(magnitude)
+
+class RK4Method(NumericalMethod):
+    """Méthode de Runge-Kutta classique d'ordre 4"""
+
+    def step(self, state: Tuple[float, ...], derivatives: Callable, dt: float) -> Tuple[float, ...]:
+        """
+        Runge-Kutta 4 : y(t+dt) = y(t) + dt/6 * (k1 + 2*k2 + 2*k3 + k4)
+
+        Args:
+            state: État actuel (x, y, vx, vy)
+            derivatives: Fonction calculant les dérivées
+            dt: Pas de temps
+
+        Returns:
+            Nouvel état après un pas de temps
+        """
+        half = 0.5 * dt
+        k1 = derivatives(*state)
+        k2 = derivatives(*(s + half * k for s, k in zip(state, k1)))
+        k3 = derivatives(*(s + half * k for s, k in zip(state, k2)))
+        k4 = derivatives(*(s + dt * k for s, k in zip(state, k3)))
+
+        sixth = dt / 6.0
+        return tuple(s + sixth * (a + 2.0 * b + 2.0 * c + d)
+                     for s, a, b, c, d in zip(state, k1, k2, k3, k4))
+
+class DormandPrinceMethod(NumericalMethod):
+    """
+    Méthode de Dormand-Prince RK45 à pas adaptatif
+
+    Chaque appel à step() couvre exactement dt, en le découpant si besoin en
+    sous-pas dont la taille est pilotée par l'estimation d'erreur embarquée
+    (ordre 5 propagé, ordre 4 pour le contrôle). Le dernier sous-pas accepté
+    est mémorisé pour démarrer l'appel suivant.
+    """
+
+    # Tableau de Butcher de Dormand-Prince
+    C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+    A = (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84)
+    )
+    # Différence entre les solutions d'ordre 5 et d'ordre 4
+    E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+    def __init__(self,
+                 rtol: float = 1e-6,
+                 atol: float = 1e-9,
+                 min_step: float = 1e-9,
+                 max_step: float = float('inf'),
+                 safety: float = 0.9):
+        """
+        Initialise la méthode adaptative
+
+        Args:
+            rtol: Tolérance relative
+            atol: Tolérance absolue
+            min_step: Pas minimal (accepté même si la tolérance n'est pas atteinte)
+            max_step: Pas maximal
+            safety: Facteur de sécurité du contrôleur de pas
+        """
+        self.rtol = rtol
+        self.atol = atol
+        self.min_step = min_step
+        self.max_step = max_step
+        self.safety = safety
+        self.suggested_step: Optional[float] = None
+
+        # Statistiques du dernier appel à step()
+        self.accepted_steps = 0
+        self.rejected_steps = 0
+
+    def attempt_step(self, state: Tuple[float, ...], derivatives: Callable, h: float,
+                     k1: Optional[Tuple[float, ...]] = None):
+        """
+        Tente un sous-pas de taille h
+
+        Returns:
+            (nouvel_état, erreur_normalisée, dérivées_au_nouvel_état)
+            Une erreur <= 1 signifie que le sous-pas respecte les tolérances.
+        """
+        if k1 is None:
+            k1 = derivatives(*state)
+        stages = [k1]
+        for row in self.A[1:]:
+            stage_state = _advance(state, h, zip(row, stages))
+            stages.append(derivatives(*stage_state))
+            if len(row) == 6:
+                new_state = stage_state
+
+        error = 0.0
+        for i, (old, new) in enumerate(zip(state, new_state)):
+            local = h * sum(e * k[i] for e, k in zip(self.E, stages) if e)
+            scale = self.atol + self.rtol * max(_max_abs(old), _max_abs(new))
+            error = max(error, _max_abs(local) / scale)
+
+        return new_state, error, stages[-1]
+
+    def step(self, state: Tuple[float, ...], derivatives: Callable, dt: float) -> Tuple[float, ...]:
+        """
+        Intègre l'état sur exactement dt avec contrôle d'erreur
+
+        Args:
+            state: État actuel (x, y, vx, vy)
+            derivatives: Fonction calculant les dérivées
+            dt: Pas de temps total
+
+        Returns:
+            Nouvel état après dt
+        """
+        self.accepted_steps = 0
+        self.rejected_steps = 0
+
+        elapsed = 0.0
+        remaining = dt
+        h = min(self.suggested_step or dt, self.max_step)
+        k1 = None
+
+        while remaining > 1e-12 * dt:
+            step_size = min(h, remaining)
+            new_state, error, k_last = self.attempt_step(state, derivatives, step_size, k1)
+
+            if error <= 1.0 or step_size <= self.min_step:
+                # Sous-pas accepté (propriété FSAL : k7 devient le k1 suivant)
+                state, k1 = new_state, k_last
+                elapsed += step_size
+                remaining = dt - elapsed
+                self.accepted_steps += 1
+                if step_size == h:
+                    growth = 5.0 if error == 0.0 else min(5.0, self.safety * error ** -0.2)
+                    h = min(self.max_step, h * max(1.0, growth))
+            else:
+                self.rejected_steps += 1
+                h = max(self.min_step, step_size * max(0.2, self.safety * error ** -0.2))
+
+        self.suggested_step = h
+        return state
+
+    def trial_step(self, state: Tuple[float, ...], derivatives: Callable, dt: float) -> Tuple[float, ...]:
+        """Comme step, en laissant intacts le pas suggéré et les statistiques"""
+        saved = self.suggested_step, self.accepted_steps, self.rejected_steps
+        try:
+            return self.step(state, derivatives, dt)
+        finally:
+            self.suggested_step, self.accepted_steps, self.rejected_steps = saved
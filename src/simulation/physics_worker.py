@@ -0,0 +1,119 @@
+"""Physique dans un thread séparé, publiée à l'affichage par double tampon"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable
+
+class SnapshotBuffer:
+    """
+    Double tampon d'images
+
+    Les deux emplacements sont alloués une fois pour toutes (factory) : le
+    producteur recopie l'état dans l'emplacement arrière (write) puis échange
+    les deux emplacements. Le lecteur marque l'emplacement qu'il lit (read) ;
+    si le producteur le retrouve à l'arrière, il saute cette image plutôt que
+    de l'écraser. Le verrou ne protège que ces marques et l'échange, si bien
+    que ni le producteur ni le lecteur n'attendent jamais l'autre plus d'un
+    instant. Une image n'est lue que dans un bloc read : hors de ce bloc,
+    write peut la réécrire à tout moment.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Args:
+            factory: Crée un emplacement réutilisable
+        """
+        self._slots = [factory(), factory()]
+        self._front = 0
+        self._reading = None  # Emplacement en cours de lecture
+        self._lock = threading.Lock()
+        self.version = 0  # Nombre d'images publiées
+        self.skipped = 0  # Images sautées car l'emplacement arrière était encore lu
+
+    def write(self, fill: Callable[[Any], None]) -> bool:
+        """
+        Recopie une nouvelle image dans l'emplacement arrière puis la publie
+
+        Args:
+            fill: Remplit l'emplacement reçu avec l'état courant
+
+        Returns:
+            False si l'image a été sautée (emplacement arrière encore lu)
+        """
+        with self._lock:
+            back = 1 - self._front
+            if self._reading == back:
+                self.skipped += 1
+                return False
+        fill(self._slots[back])
+        with self._lock:
+            self._front = back
+            self.version += 1
+        return True
+
+    @contextmanager
+    def read(self):
+        """Dernière image publiée, protégée de write tant que le bloc with n'est pas terminé"""
+        with self._lock:
+            index = self._front
+            self._reading = index
+        try:
+            yield self._slots[index]
+        finally:
+            with self._lock:
+                self._reading = None
+
+class PhysicsWorker(threading.Thread):
+    """
+    Thread qui avance la simulation au rythme du temps réel et publie des images
+
+    Les commandes qui modifient la simulation (reset, changement de vitesse...)
+    sont transmises par submit et exécutées par le thread entre deux mises à
+    jour, jamais pendant un pas.
+    """
+
+    def __init__(self, advance: Callable[[float], None], fill: Callable[[Any], None],
+                 buffer: SnapshotBuffer, tick: float = 1.0 / 120):
+        """
+        Args:
+            advance: Avance la simulation du temps réel écoulé (s)
+            fill: Recopie l'état courant dans un emplacement du tampon
+            buffer: Double tampon où publier les images
+            tick: Période des mises à jour (s)
+        """
+        super().__init__(name="physics", daemon=True)
+        self.advance = advance
+        self.fill = fill
+        self.buffer = buffer
+        self.tick = tick
+        self._commands = queue.Queue()
+        self._stop_event = threading.Event()
+
+    def submit(self, command: Callable[[], None]):
+        """Demande l'exécution d'une commande dans le thread physique"""
+        self._commands.put(command)
+
+    def stop(self, timeout: float = 1.0):
+        """Arrête le thread et attend sa fin"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def run(self):
+        last = time.perf_counter()
+        while not self._stop_event.is_set():
+            while True:
+                try:
+                    command = self._commands.get_nowait()
+                except queue.Empty:
+                    break
+                command()
+
+            now = time.perf_counter()
+            self.advance(now - last)
+            last = now
+            self.buffer.write(self.fill)
+
+            self._stop_event.wait(max(0.0, self.tick - (time.perf_counter() - now)))
@@ -0,0 +1,236 @@
+"""Trajectoires d'Euler précalculées pour l'affichage de visuel.py, et leur cache"""
+
+from collections import OrderedDict
+import numpy as np
+from typing import NamedTuple, Tuple
+from ..utils.constants import GRAVITY
+
+class EulerBounceModel(NamedTuple):
+    """
+    Pas d'Euler de visuel.py : frottement linéaire, vent horizontal et rebond au sol
+
+    Le même pas sert aux trajectoires précalculées et à la boucle
+    d'affichage quand elle avance directement depuis l'état affiché.
+    """
+    m: float
+    k: float
+    e: float
+    wind_speed: float
+    time_step: float
+    gravity: float = GRAVITY
+
+    def step(self, x: float, y: float, vx: float, vy: float, rebounds: int) -> Tuple[float, float, float, float, int]:
+        """Retourne l'état (x, y, vx, vy, rebonds) après un pas"""
+        m, k, time_step = self.m, self.k, self.time_step
+        F_gravity = -m * self.gravity
+        F_friction_y = -k * vy
+        F_wind = k * self.wind_speed  # Force horizontale due au vent
+        ax = F_wind / m
+        ay = (F_gravity + F_friction_y) / m
+        vx += ax * time_step
+        vy += ay * time_step
+        x += vx * time_step
+        y += vy * time_step
+
+        # Vérification du rebond
+        if y <= 0 and vy < 0:
+            vy = -self.e * vy
+            vx *= self.e  # Réduction de la vitesse horizontale
+            y = 0.0
+            rebounds += 1
+        return x, y, vx, vy, rebounds
+
+    def energies(self, y: float, vx: float, vy: float) -> Tuple[float, float, float]:
+        """Retourne les énergies (cinétique, potentielle, totale) d'un état"""
+        kinetic_energy = 0.5 * self.m * (vx**2 + vy**2)
+        potential_energy = self.m * self.gravity * y
+        return kinetic_energy, potential_energy, kinetic_energy + potential_energy
+
+class PrecomputedTrajectory:
+    """
+    Trajectoire d'un EulerBounceModel lâché sans vitesse de la hauteur h0
+
+    Les pas sont calculés par blocs de chunk_steps, à la demande : rien
+    n'est calculé avant la première lecture, et la trajectoire n'a pas de
+    fin, comme la simulation affichée. Les états sont rangés dans des
+    tableaux NumPy : le premier bloc est gardé en permanence, si bien que
+    revenir au départ ne recalcule rien, puis au plus max_steps états
+    récents ; un pas plus ancien est recalculé depuis la fin du premier bloc.
+    """
+
+    def __init__(self, model: EulerBounceModel, h0: float, chunk_steps: int = 600, max_steps: int = 36000):
+        """
+        Args:
+            model: Paramètres physiques et pas de temps
+            h0: Hauteur initiale (m)
+            chunk_steps: Nombre de pas calculés à la fois
+            max_steps: Nombre d'états récents gardés en plus du premier bloc (40 octets chacun)
+        """
+        self.model = model
+        self.h0 = h0
+        self.chunk_steps = chunk_steps
+        self.max_steps = max(max_steps, chunk_steps)
+
+        # Premier bloc (pas 0 à chunk_steps), calculé à la première lecture puis jamais oublié
+        self._head = None
+        self._head_rebounds = None
+        self._head_end = chunk_steps + 1
+
+        # États récents au-delà du premier bloc, du pas start (inclus) au pas _end (exclu)
+        self._states = np.empty((0, 4))
+        self._rebounds = np.empty(0, dtype=np.int64)
+        self.start = self._end = self._head_end
+
+    def __len__(self) -> int:
+        """Nombre d'états calculés depuis l'état initial (gardés ou non)"""
+        return 0 if self._head is None else self._end
+
+    def time(self, step: int) -> float:
+        """Instant atteint après le pas donné (s)"""
+        return step * self.model.time_step
+
+    def ensure(self, step: int):
+        """Calcule la trajectoire au moins jusqu'au pas donné"""
+        if self._head is None:
+            self._head, self._head_rebounds = self._integrate((0.0, self.h0, 0.0, 0.0), 0, self.chunk_steps,
+                                                              include_start=True)
+        if self._head_end <= step < self.start:
+            # Pas oublié : reprise depuis la fin du premier bloc
+            self.start = self._end = self._head_end
+        while self._end <= step:
+            self._extend()
+
+    def state(self, step: int) -> Tuple[float, float, float, float, int]:
+        """Retourne (x, y, vx, vy, rebonds) après le pas donné"""
+        self.ensure(step)
+        if step < self._head_end:
+            states, rebounds, i = self._head, self._head_rebounds, step
+        else:
+            states, rebounds, i = self._states, self._rebounds, step - self.start
+        x, y, vx, vy = states[i].tolist()
+        return x, y, vx, vy, int(rebounds[i])
+
+    def energies(self, step: int) -> Tuple[float, float, float]:
+        """Retourne (cinétique, potentielle, totale) après le pas donné"""
+        _, y, vx, vy, _ = self.state(step)
+        return self.model.energies(y, vx, vy)
+
+    def _integrate(self, initial, rebounds, steps, include_start=False):
+        """
+        Intègre steps pas depuis l'état (x, y, vx, vy) donné
+
+        Returns:
+            (tableau (n, 4) des états, tableau des nombres de rebonds)
+        """
+        step = self.model.step
+        x, y, vx, vy = initial
+        states = [initial] if include_start else []
+        counts = [rebounds] if include_start else []
+        for _ in range(steps):
+            x, y, vx, vy, rebounds = step(x, y, vx, vy, rebounds)
+            states.append((x, y, vx, vy))
+            counts.append(rebounds)
+        return np.array(states, dtype=float).reshape(-1, 4), np.array(counts, dtype=np.int64)
+
+    def _extend(self):
+        """Calcule le bloc suivant à la fin de la trajectoire"""
+        last = self._end - 1
+        if last < self._head_end:
+            initial, rebounds = self._head[last], self._head_rebounds[last]
+        else:
+            initial, rebounds = self._states[last - self.start], self._rebounds[last - self.start]
+        states, counts = self._integrate(tuple(initial.tolist()), int(rebounds), self.chunk_steps)
+
+        used = self._end - self.start
+        if used + len(states) > len(self._states):
+            capacity = min(self.max_steps, max(2 * len(self._states), used + len(states)))
+            if capacity > len(self._states):
+                # Agrandissement progressif jusqu'à max_steps
+                grown = np.empty((capacity, 4))
+                grown_rebounds = np.empty(capacity, dtype=np.int64)
+                grown[:used] = self._states[:used]
+                grown_rebounds[:used] = self._rebounds[:used]
+                self._states, self._rebounds = grown, grown_rebounds
+            if used + len(states) > capacity:
+                # Oublie les états les plus anciens au-delà de max_steps
+                keep = capacity - len(states)
+                self._states[:keep] = self._states[used - keep:used]
+                self._rebounds[:keep] = self._rebounds[used - keep:used]
+                self.start += used - keep
+                used = keep
+
+        self._states[used:used + len(states)] = states
+        self._rebounds[used:used + len(states)] = counts
+        self._end += len(states)
+
+class SimulationCache:
+    """
+    Cache LRU en mémoire des trajectoires précalculées
+
+    Une trajectoire ne dépend que de ses paramètres physiques (m, k, e,
+    vent, h0). La clé arrondit e et h0 à la résolution des curseurs : un
+    curseur déplacé remplace l'entrée de son cran au lieu d'évincer les
+    autres configurations. Chaque entrée garde les valeurs exactes et n'est
+    réutilisée que si elles sont identiques, si bien qu'une trajectoire est
+    toujours calculée avec les valeurs demandées.
+    """
+    E_DECIMALS = 2  # Résolution des curseurs : 0.01 pour e, 0.1 m pour h0
+    H0_DECIMALS = 1
+
+    def __init__(self, time_step: float, gravity: float = GRAVITY, max_entries: int = 32, max_steps: int = 36000):
+        """
+        Args:
+            time_step: Pas de temps des trajectoires (s)
+            gravity: Accélération de la pesanteur (m/s²)
+            max_entries: Nombre de trajectoires gardées
+            max_steps: Nombre d'états récents gardés par trajectoire (voir PrecomputedTrajectory)
+        """
+        self.time_step = time_step
+        self.gravity = gravity
+        self.max_entries = max_entries
+        self.max_steps = max_steps
+        self._trajectories = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._trajectories)
+
+    @classmethod
+    def key(cls, parameters: dict) -> tuple:
+        """Clé d'une configuration (e et h0 arrondis à la résolution des curseurs)"""
+        return (parameters['m'], parameters['k'], round(parameters['e'], cls.E_DECIMALS),
+                parameters['wind_speed'], round(parameters['h0'], cls.H0_DECIMALS))
+
+    def get(self, parameters: dict) -> PrecomputedTrajectory:
+        """
+        Retourne la trajectoire de la configuration, calculée si besoin
+
+        Args:
+            parameters: Paramètres physiques m, k, e, wind_speed et h0
+                (SimulationData.get_physics_parameters(), e et h0 éventuellement modifiés)
+        """
+        model = EulerBounceModel(parameters['m'], parameters['k'], parameters['e'], parameters['wind_speed'],
+                                 self.time_step, self.gravity)
+        key = self.key(parameters)
+        trajectory = self._trajectories.get(key)
+        if trajectory is not None and trajectory.model == model and trajectory.h0 == parameters['h0']:
+            self._trajectories.move_to_end(key)
+            self.hits += 1
+            return trajectory
+
+        self.misses += 1
+        trajectory = PrecomputedTrajectory(model, parameters['h0'], max_steps=self.max_steps)
+        self._trajectories[key] = trajectory
+        self._trajectories.move_to_end(key)
+        if len(self._trajectories) > self.max_entries:
+            self._trajectories.popitem(last=False)
+        return trajectory
+
+    def get_for(self, data) -> PrecomputedTrajectory:
+        """Retourne la trajectoire correspondant à un SimulationData"""
+        return self.get(data.get_physics_parameters())
+
+    def clear(self):
+        """Oublie toutes les trajectoires"""
+        self._trajectories.clear()
@@ -0,0 +1,121 @@
+"""Réutilisation du début commun des trajectoires (avant le premier impact)"""
+
+import json
+from collections import OrderedDict
+from typing import List
+from ..simulation.simulator import FreeFallSimulator, SimulatorSnapshot
+from ..simulation.events import IMPACT, REST
+
+class ImpactSnapshotStore:
+    """
+    Instantanés pris juste avant le premier impact avec le sol
+
+    Avant le premier impact, la trajectoire ne dépend pas du coefficient de
+    restitution : des simulations qui ne diffèrent que par le sol partagent
+    ce début. La clé est l'ensemble des paramètres et de l'état de départ,
+    coefficients de restitution exclus ; une nouvelle simulation reprend
+    directement au début du pas de l'impact au lieu de repartir de t=0.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Nombre d'instantanés gardés (les moins récemment utilisés sont oubliés)
+        """
+        self.max_entries = max_entries
+        self._snapshots = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def clear(self):
+        """Oublie tous les instantanés"""
+        self._snapshots.clear()
+
+    @staticmethod
+    def key(simulator: FreeFallSimulator) -> str:
+        """Clé du début de trajectoire : paramètres et état de départ sans la restitution"""
+        parameters = simulator.state_parameters()
+        for description in parameters['objects']:
+            description['state'] = description['state'][:-1]  # restitution_coefficient
+        return json.dumps(parameters, sort_keys=True, default=repr)
+
+    def advance(self, simulator: FreeFallSimulator, end_time: float) -> bool:
+        """
+        Amène le simulateur au début du pas où survient le premier impact
+
+        Reprend l'instantané s'il existe ; sinon intègre jusqu'à l'impact,
+        enregistre l'instantané et revient au début de ce pas. Sans impact
+        avant end_time, le simulateur s'arrête simplement à end_time.
+
+        Args:
+            simulator: Simulateur à faire avancer
+            end_time: Temps à ne pas dépasser
+
+        Returns:
+            True si le début de trajectoire a été repris d'un instantané
+        """
+        if not simulator.supports_snapshots():
+            return False
+
+        key = self.key(simulator)
+        history_start = [len(obj.history) for obj in simulator.objects]
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.summary['time'] < end_time:
+            self._snapshots.move_to_end(key)
+            self.hits += 1
+            self._restore(simulator, snapshot, history_start)
+            return True
+
+        self.misses += 1
+        objects = simulator.objects
+        # Avant le premier impact, les états de contact et le sommeil ne changent pas :
+        # ils sont relevés une fois, seuls l'état des objets et le temps le sont à chaque pas
+        contacts = [simulator.physics_engine.contacts.row(obj) for obj in objects]
+        sleeping = [simulator.is_sleeping(obj) for obj in objects]
+        method_state = vars(simulator.numerical_method)
+        while simulator.time < end_time:
+            states = [(obj.x, obj.y, obj.vx, obj.vy) for obj in objects]
+            time, step_count = simulator.time, simulator.step_count
+            method = dict(method_state) if method_state else {}
+            simulator.step()
+            if any(event.kind in (IMPACT, REST) for event in simulator.last_events):
+                snapshot = self._freeze(simulator, (states, contacts, sleeping, time, step_count, method),
+                                        history_start)
+                self._snapshots[key] = snapshot
+                if len(self._snapshots) > self.max_entries:
+                    self._snapshots.popitem(last=False)
+                self._restore(simulator, snapshot, history_start)
+                break
+        return False
+
+    @staticmethod
+    def _freeze(simulator: FreeFallSimulator, captured: tuple, history_start: List[int]) -> SimulatorSnapshot:
+        """Convertit le relevé du début du pas d'impact en instantané du simulateur"""
+        states, contacts, sleeping, time, step_count, method = captured
+        arrays = {'state': [list(state) for state in states]}
+        for i, obj in enumerate(simulator.objects):
+            # L'état éventuellement enregistré pendant le pas d'impact (à l'instant time) est exclu
+            history = obj.history
+            length = len(history)
+            if length > history_start[i] and history['time'][-1] == time:
+                length -= 1
+            arrays[f'history_{i}'] = history.as_array()[:, history_start[i]:length].copy()
+        summary = {
+            'time': time,
+            'step_count': step_count,
+            'method': method,
+            'contacts': contacts,
+            'sleeping': sleeping,
+            'events': []
+        }
+        return SimulatorSnapshot(arrays, summary)
+
+    @staticmethod
+    def _restore(simulator: FreeFallSimulator, snapshot: SimulatorSnapshot, history_start: List[int]):
+        """Replace le simulateur dans l'état de l'instantané"""
+        for obj, start in zip(simulator.objects, history_start):
+            obj.history.truncate(start)
+        simulator.restore(snapshot)
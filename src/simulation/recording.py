@@ -0,0 +1,78 @@
+"""Politiques d'enregistrement de l'historique des objets"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Iterable, Sequence
+from .events import EVENT_KINDS, SimulationEvent
+
+class RecordingPolicy(ABC):
+    """Décide, à chaque pas, si l'état d'un objet est ajouté à son historique"""
+
+    @abstractmethod
+    def should_record(self, step_index: int, time: float, dt: float,
+                      events: Sequence[SimulationEvent]) -> bool:
+        """
+        Args:
+            step_index: Numéro du pas (0 pour le premier)
+            time: Temps au début du pas
+            dt: Durée du pas
+            events: Événements de l'objet pendant ce pas
+
+        Returns:
+            True si l'état doit être enregistré
+        """
+        pass
+
+class RecordEveryStep(RecordingPolicy):
+    """Enregistre à chaque pas (comportement historique)"""
+
+    def should_record(self, step_index, time, dt, events):
+        return True
+
+class RecordEveryNthStep(RecordingPolicy):
+    """Enregistre un pas sur N"""
+
+    def __init__(self, stride: int):
+        if stride < 1:
+            raise ValueError("Le pas d'enregistrement doit être au moins 1")
+        self.stride = stride
+
+    def should_record(self, step_index, time, dt, events):
+        return step_index % self.stride == 0
+
+class RecordAtSampleRate(RecordingPolicy):
+    """
+    Enregistre à fréquence fixe en temps simulé, indépendamment de dt
+
+    Un état est enregistré au premier pas, puis à chaque pas qui franchit
+    un multiple de 1 / sample_rate.
+    """
+
+    def __init__(self, sample_rate: float):
+        """
+        Args:
+            sample_rate: Nombre d'échantillons par seconde simulée
+        """
+        if sample_rate <= 0:
+            raise ValueError("La fréquence d'échantillonnage doit être positive")
+        self.sample_rate = sample_rate
+
+    def should_record(self, step_index, time, dt, events):
+        if step_index == 0:
+            return True
+        return math.floor((time + dt) * self.sample_rate + 1e-9) > math.floor(time * self.sample_rate + 1e-9)
+
+class RecordOnEvents(RecordingPolicy):
+    """Enregistre seulement lors des événements choisis (impact, sommet, arrêt)"""
+
+    def __init__(self, kinds: Iterable[str] = EVENT_KINDS):
+        self.kinds = frozenset(kinds)
+
+    def should_record(self, step_index, time, dt, events):
+        return any(event.kind in self.kinds for event in events)
+
+class RecordNothing(RecordingPolicy):
+    """N'enregistre rien"""
+
+    def should_record(self, step_index, time, dt, events):
+        return False
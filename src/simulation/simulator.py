@@ -1,11 +1,40 @@
 """Simulateur principal pour la chute libre"""
 
 import time
-from typing import List, Optional
+import math
+import numpy as np
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 from ..models.physics_object import PhysicsObject
 from ..models.physics_engine import PhysicsEngine
 from ..simulation.numerical_methods import EulerMethod, NumericalMethod
+from ..simulation.events import IMPACT, APEX, REST, SimulationEvent
+from ..simulation.recording import RecordingPolicy, RecordEveryStep
 from ..utils.constants import DEFAULT_DT
+from ..utils.result_cache import ResultCache
+
+class StepSnapshot(NamedTuple):
+    """État de tous les objets après un pas"""
+    time: float
+    step: int
+    states: Tuple[Tuple[float, float, float, float], ...]  # (x, y, vx, vy) par objet
+
+class StepChunk(NamedTuple):
+    """États de tous les objets sur plusieurs pas consécutifs"""
+    time: np.ndarray  # (n,)
+    states: np.ndarray  # (n, nombre d'objets, 4) : x, y, vx, vy
+
+class SimulatorSnapshot(NamedTuple):
+    """
+    État complet du simulateur, réappliqué par FreeFallSimulator.restore
+
+    arrays contient 'state' (x, y, vx, vy de chaque objet) et, pour chaque
+    objet i, 'history_i' : les colonnes d'historique enregistrées depuis le
+    début choisi à la prise de l'instantané. summary (sérialisable en JSON)
+    contient le temps, le nombre de pas, l'état de la méthode numérique, les
+    états de contact, le sommeil et les événements du dernier pas.
+    """
+    arrays: dict
+    summary: dict
 
 class FreeFallSimulator:
     """Simulateur de chute libre avec frottement"""
@@ -15,7 +44,10 @@ class FreeFallSimulator:
                  air_resistance: bool = True,
                  ground_level: float = 0.0,
                  air_density_factor: float = 1.0,
-                 numerical_method: Optional[NumericalMethod] = None):
+                 numerical_method: Optional[NumericalMethod] = None,
+                 event_location: bool = False,
+                 recording_policy: Optional[RecordingPolicy] = None,
+                 result_cache: Optional[ResultCache] = None):
         """
         Initialise le simulateur
 
@@ -25,56 +57,413 @@ class FreeFallSimulator:
             ground_level: Hauteur du sol
             air_density_factor: Facteur de densité de l'air (1.0 = normal)
             numerical_method: Méthode numérique à utiliser
+            event_location: Localise l'instant exact des impacts avec le sol
+            recording_policy: Politique d'enregistrement de l'historique (à chaque pas par défaut)
+            result_cache: Cache disque consulté par run_for_duration
         """
         self.dt = dt
-        self.physics_engine = PhysicsEngine(air_resistance, ground_level, air_density_factor)
+        self.physics_engine = PhysicsEngine(air_resistance, ground_level, air_density_factor, event_location)
         self.numerical_method = numerical_method or EulerMethod()
         self.objects: List[PhysicsObject] = []
+        # Objets intégrés à chaque pas ; les objets au repos dorment à part
+        self.active_objects: List[PhysicsObject] = []
+        self.sleeping_objects: List[PhysicsObject] = []
+        self.recording_policy = recording_policy or RecordEveryStep()
+        self._recording_policies: Dict[int, RecordingPolicy] = {}  # Politiques propres à certains objets
+        self.last_events: List[SimulationEvent] = []  # Événements du dernier pas
+        self.step_count = 0
+        self.result_cache = result_cache
         self.time = 0.0
         self.running = False
         self.paused = False
 
     def set_air_density_factor(self, factor: float):
-        """Modifie le facteur de densité de l'air"""
+        """Modifie le facteur de densité de l'air (réveille tous les objets)"""
         self.physics_engine.set_air_density_factor(factor)
+        self.wake_all()
 
     def get_air_density_factor(self) -> float:
         """Retourne le facteur de densité de l'air actuel"""
         return self.physics_engine.air_density_factor
 
-    def add_object(self, obj: PhysicsObject):
-        """Ajoute un objet à la simulation"""
+    def add_object(self, obj: PhysicsObject, recording_policy: Optional[RecordingPolicy] = None):
+        """
+        Ajoute un objet à la simulation
+
+        Args:
+            obj: Objet à ajouter
+            recording_policy: Politique d'enregistrement propre à cet objet (sinon celle du simulateur)
+        """
         self.objects.append(obj)
+        self.active_objects.append(obj)
+        if recording_policy is not None:
+            self._recording_policies[id(obj)] = recording_policy
+
+    def set_recording_policy(self, policy: RecordingPolicy, obj: Optional[PhysicsObject] = None):
+        """Change la politique d'enregistrement du simulateur, ou d'un seul objet"""
+        if obj is None:
+            self.recording_policy = policy
+        else:
+            self._recording_policies[id(obj)] = policy
+
+    def get_recording_policy(self, obj: PhysicsObject) -> RecordingPolicy:
+        """Politique d'enregistrement appliquée à l'objet"""
+        return self._recording_policies.get(id(obj), self.recording_policy)
 
     def remove_object(self, obj: PhysicsObject):
         """Retire un objet de la simulation"""
         if obj in self.objects:
             self.objects.remove(obj)
+            if obj in self.active_objects:
+                self.active_objects.remove(obj)
+            else:
+                self.sleeping_objects.remove(obj)
+            self.physics_engine.forget_object(obj)
+            self._recording_policies.pop(id(obj), None)
+
+    def is_sleeping(self, obj: PhysicsObject) -> bool:
+        """Vrai si l'objet est au repos et n'est plus intégré"""
+        return obj in self.sleeping_objects
+
+    def wake(self, obj: PhysicsObject):
+        """Réveille un objet au repos pour qu'il soit de nouveau intégré"""
+        if obj in self.sleeping_objects:
+            self.sleeping_objects.remove(obj)
+            self.active_objects.append(obj)
+        self.physics_engine.wake_object(obj)
+
+    def wake_all(self):
+        """Réveille tous les objets au repos"""
+        for obj in self.sleeping_objects:
+            self.physics_engine.wake_object(obj)
+        self.active_objects.extend(self.sleeping_objects)
+        self.sleeping_objects = []
+
+    def apply_impulse(self, obj: PhysicsObject, impulse_x: float, impulse_y: float):
+        """
+        Applique une impulsion extérieure à un objet et le réveille
+
+        Args:
+            obj: Objet concerné
+            impulse_x, impulse_y: Impulsion (N·s)
+        """
+        obj.vx += impulse_x / obj.mass
+        obj.vy += impulse_y / obj.mass
+        self.wake(obj)
+
+    def set_object_parameters(self, obj: PhysicsObject, **parameters):
+        """Modifie les paramètres d'un objet (masse, rayon, coefficients...) et le réveille"""
+        for name, value in parameters.items():
+            if not hasattr(obj, name):
+                raise AttributeError(f"Paramètre inconnu: {name}")
+            setattr(obj, name, value)
+        self.wake(obj)
 
     def reset(self):
         """Remet la simulation à zéro"""
         self.time = 0.0
+        self.step_count = 0
+        self.last_events = []
         for obj in self.objects:
             obj.reset_history()
+        self.wake_all()
 
     def step(self):
         """Effectue un pas de simulation"""
         if not self.paused:
-            for obj in self.objects:
+            engine = self.physics_engine
+            fell_asleep = False
+            self.last_events = []
+            for obj in self.active_objects:
                 # Mise à jour de la physique
-                collision, peak_height = self.physics_engine.update_object(obj, self.dt, self.numerical_method)
+                collision, peak_height = engine.update_object(obj, self.dt, self.numerical_method)
+                stopped = engine.is_stopped(obj)
+                events = self._collect_events(obj, collision, peak_height, stopped)
+
+                # Mise à jour de l'historique selon la politique d'enregistrement
+                policy = self._recording_policies.get(id(obj), self.recording_policy)
+                if policy.should_record(self.step_count, self.time, self.dt, events):
+                    obj.update_history(self.time, engine.ground_level)
 
-                # Mise à jour de l'historique
-                obj.update_history(self.time, self.physics_engine.ground_level)
+                if stopped:
+                    fell_asleep = True
+
+            if fell_asleep:
+                self._put_resting_objects_to_sleep()
 
             self.time += self.dt
+            self.step_count += 1
+
+    def _collect_events(self, obj: PhysicsObject, collision: bool, peak_height: float,
+                        stopped: bool) -> List[SimulationEvent]:
+        """Construit les événements de l'objet pour le pas courant et les ajoute à last_events"""
+        if not (collision or peak_height or stopped):
+            return []
+
+        event_time = self.time + self.dt
+        # Impacts datés à l'instant localisé dans le pas (fin du pas sans localisation)
+        impact_time = self.time + self.physics_engine.impact_offset(obj) if collision else event_time
+        events = []
+        if peak_height:
+            events.append(SimulationEvent(APEX, event_time, obj, peak_height))
+        if collision and not stopped:
+            events.append(SimulationEvent(IMPACT, impact_time, obj, obj.vy))
+        if stopped:
+            events.append(SimulationEvent(REST, impact_time, obj, obj.y))
+        self.last_events.extend(events)
+        return events
+
+    def _put_resting_objects_to_sleep(self):
+        """Déplace les objets arrêtés vers l'ensemble des objets au repos"""
+        engine = self.physics_engine
+        still_active = []
+        for obj in self.active_objects:
+            if engine.is_stopped(obj):
+                self.sleeping_objects.append(obj)
+            else:
+                still_active.append(obj)
+        self.active_objects = still_active
 
     def run_for_duration(self, duration: float):
-        """Exécute la simulation pendant une durée donnée"""
+        """
+        Exécute la simulation pendant une durée donnée
+
+        Si un cache de résultats est défini, un appel identique (mêmes paramètres,
+        même état de départ, même version du code) restaure directement l'état
+        final, les historiques et les compteurs au lieu de simuler.
+        """
+        cache = self.result_cache
+        if cache is None or not self.supports_snapshots():
+            self._run(duration)
+            return
+
+        parameters = dict(self.state_parameters(), duration=duration)
+        key = cache.key('FreeFallSimulator.run_for_duration', parameters)
+        cached = cache.get(key)
+        if cached is not None:
+            self.restore(SimulatorSnapshot(cached.arrays, cached.summary))
+            return
+
+        history_start = [len(obj.history) for obj in self.objects]
+        self._run(duration)
+        cache.put(key, *self.snapshot(history_start))
+
+    def iter_steps(self, max_duration: Optional[float] = None,
+                   chunk_size: Optional[int] = None) -> Iterator:
+        """
+        Avance la simulation à la demande en produisant l'état après chaque pas
+
+        Le générateur s'arrête quand tous les objets sont au repos, quand
+        max_duration est écoulée ou quand la simulation est en pause ; le
+        consommateur peut aussi l'abandonner à tout moment, la simulation
+        restant dans un état cohérent (entre deux pas).
+
+        Par blocs, un bloc n'est produit qu'une fois tous ses pas effectués :
+        à l'abandon, la simulation est exactement à la dernière ligne du
+        dernier bloc reçu, même si le consommateur n'en a lu qu'une partie.
+        Pour s'arrêter sur un pas précis, itérer sans chunk_size.
+
+        Args:
+            max_duration: Durée simulée maximale à partir du temps courant
+            chunk_size: Si donné, regroupe les pas par blocs de tableaux NumPy
+
+        Yields:
+            StepSnapshot par pas, ou StepChunk d'au plus chunk_size pas
+        """
+        end_time = None if max_duration is None else self.time + max_duration
+        if chunk_size is None:
+            while self._can_advance(end_time):
+                self.step()
+                yield StepSnapshot(self.time, self.step_count,
+                                   tuple((obj.x, obj.y, obj.vx, obj.vy) for obj in self.objects))
+            return
+
+        times = np.empty(chunk_size)
+        states = np.empty((chunk_size, len(self.objects), 4))
+        count = 0
+        while self._can_advance(end_time):
+            self.step()
+            times[count] = self.time
+            for i, obj in enumerate(self.objects):
+                states[count, i] = (obj.x, obj.y, obj.vx, obj.vy)
+            count += 1
+            if count == chunk_size:
+                yield StepChunk(times.copy(), states.copy())
+                count = 0
+        if count:
+            yield StepChunk(times[:count].copy(), states[:count].copy())
+
+    def iter_events(self, max_duration: Optional[float] = None) -> Iterator[SimulationEvent]:
+        """
+        Avance la simulation à la demande en produisant les événements (impact, sommet, arrêt)
+
+        Mêmes conditions d'arrêt que iter_steps.
+        """
+        end_time = None if max_duration is None else self.time + max_duration
+        while self._can_advance(end_time):
+            self.step()
+            yield from self.last_events
+
+    def _can_advance(self, end_time: Optional[float]) -> bool:
+        """Vrai s'il reste des objets éveillés et du temps à simuler"""
+        return (not self.paused and bool(self.active_objects) and
+                (end_time is None or self.time < end_time))
+
+    def _run(self, duration: float):
+        """Boucle de simulation jusqu'à time + duration"""
         end_time = self.time + duration
         while self.time < end_time:
+            if not self.active_objects and not self.paused:
+                # Tous les objets dorment : seule l'horloge avance
+                self._fast_forward(end_time)
+                if self.time >= end_time:
+                    break
             self.step()
 
+    def _fast_forward(self, end_time: float):
+        """Avance l'horloge d'un nombre entier de pas sans rien intégrer"""
+        steps = math.floor((end_time - self.time) / self.dt)
+        if steps > 0:
+            self.time += steps * self.dt
+            self.step_count += steps
+            self.last_events = []
+
+    def run_until(self, *conditions, max_duration: Optional[float] = None):
+        """
+        Exécute la simulation jusqu'à ce qu'une des conditions soit vraie
+
+        Les conditions sont évaluées au départ puis après chaque pas (voir
+        simulation.conditions : AllAtRest, BounceCount, EnergyBelow,
+        HeightReached, ApexReached, ou toute fonction simulator -> bool).
+
+        Args:
+            *conditions: Conditions d'arrêt (la première vraie arrête la simulation)
+            max_duration: Durée simulée maximale ; sans elle, la simulation
+                s'arrête aussi dès que plus aucun objet ne bouge
+
+        Returns:
+            La condition qui a arrêté la simulation, ou None si la durée maximale
+            est écoulée (ou si la simulation est en pause)
+        """
+        for condition in conditions:
+            start = getattr(condition, 'start', None)
+            if start is not None:
+                start(self)
+
+        end_time = None if max_duration is None else self.time + max_duration
+        while True:
+            for condition in conditions:
+                if condition(self):
+                    return condition
+            if self.paused or (end_time is not None and self.time >= end_time):
+                return None
+            if not self.active_objects:
+                # Plus rien ne bouge : seules les conditions portant sur le temps peuvent changer
+                if end_time is None:
+                    return None
+                self._fast_forward(end_time)
+                if self.time >= end_time:
+                    continue
+            self.step()
+
+    @staticmethod
+    def _describe(component) -> dict:
+        """Description déterministe d'un composant (méthode numérique, politique) pour les clés du cache"""
+        description = {'type': type(component).__name__}
+        for name, value in vars(component).items():
+            description[name] = sorted(value) if isinstance(value, (set, frozenset)) else value
+        return description
+
+    def supports_snapshots(self) -> bool:
+        """Vrai si restore peut compléter les historiques (impossible pour un historique en anneau)"""
+        return not any(getattr(obj.history, 'ring', False) for obj in self.objects)
+
+    def state_parameters(self) -> dict:
+        """
+        Paramètres et état courant qui déterminent entièrement la suite de la simulation
+
+        Le résultat est sérialisable en JSON et sert à construire des clés de cache.
+        """
+        engine = self.physics_engine
+        return {
+            'time': self.time,
+            'step_count': self.step_count,
+            'dt': self.dt,
+            'engine': {
+                'air_resistance': engine.air_resistance,
+                'ground_level': engine.ground_level,
+                'air_density_factor': engine.air_density_factor,
+                'event_location': engine.event_location,
+                'event_tolerance': engine.event_tolerance,
+                'max_impacts_per_step': engine.max_impacts_per_step,
+                'stop_threshold_speed': engine.stop_threshold_speed,
+                'stop_threshold_height': engine.stop_threshold_height
+            },
+            'method': self._describe(self.numerical_method),
+            'objects': [{
+                'state': [obj.x, obj.y, obj.vx, obj.vy, obj.mass, obj.radius,
+                          obj.drag_coefficient, obj.restitution_coefficient],
+                'contact': engine.contacts.row(obj),
+                'sleeping': self.is_sleeping(obj),
+                'policy': self._describe(self.get_recording_policy(obj))
+            } for obj in self.objects]
+        }
+
+    def snapshot(self, history_start: Optional[List[int]] = None) -> SimulatorSnapshot:
+        """
+        Capture l'état courant du simulateur
+
+        Args:
+            history_start: Longueur d'historique déjà présente par objet, exclue
+                de l'instantané (historiques entiers si None)
+
+        Returns:
+            Instantané que restore réapplique
+        """
+        if history_start is None:
+            history_start = [0] * len(self.objects)
+        arrays = {'state': np.array([[obj.x, obj.y, obj.vx, obj.vy] for obj in self.objects]).reshape(-1, 4)}
+        for i, obj in enumerate(self.objects):
+            arrays[f'history_{i}'] = obj.history.as_array()[:, history_start[i]:]
+
+        index = {id(obj): i for i, obj in enumerate(self.objects)}
+        summary = {
+            'time': self.time,
+            'step_count': self.step_count,
+            'method': vars(self.numerical_method),
+            'contacts': [self.physics_engine.contacts.row(obj) for obj in self.objects],
+            'sleeping': [self.is_sleeping(obj) for obj in self.objects],
+            'events': [[event.kind, event.time, index[id(event.obj)], event.value] for event in self.last_events]
+        }
+        return SimulatorSnapshot(arrays, summary)
+
+    def restore(self, snapshot: SimulatorSnapshot):
+        """
+        Replace le simulateur dans l'état d'un instantané
+
+        Les objets doivent être les mêmes, dans le même ordre, qu'à la prise
+        de l'instantané ; ses colonnes d'historique sont ajoutées à la suite
+        des historiques courants.
+        """
+        arrays, summary = snapshot
+        engine = self.physics_engine
+        for i, obj in enumerate(self.objects):
+            obj.x, obj.y, obj.vx, obj.vy = (float(value) for value in arrays['state'][i])
+            engine.contacts.restore_row(obj, summary['contacts'][i])
+            columns = arrays[f'history_{i}']
+            if columns.shape[1]:
+                obj.history.set_energy_parameters(obj.mass, engine.ground_level)
+                obj.history.extend(columns)
+
+        sleeping = summary['sleeping']
+        self.active_objects = [obj for obj, asleep in zip(self.objects, sleeping) if not asleep]
+        self.sleeping_objects = [obj for obj, asleep in zip(self.objects, sleeping) if asleep]
+        self.time = summary['time']
+        self.step_count = summary['step_count']
+        vars(self.numerical_method).update(summary['method'])
+        self.last_events = [SimulationEvent(kind, event_time, self.objects[i], value)
+                            for kind, event_time, i, value in summary['events']]
+
     def start(self):
         """Démarre la simulation"""
         self.running = True
@@ -100,6 +489,7 @@ class FreeFallSimulator:
                 'vy': obj.vy,
                 'radius': obj.radius,
                 'color': obj.color,
+                'sleeping': self.is_sleeping(obj),
                 'speed': obj.speed,
                 'kinetic_energy': obj.kinetic_energy,
                 'potential_energy': obj.potential_energy(self.physics_engine.ground_level)
@@ -113,5 +503,6 @@ class FreeFallSimulator:
             'paused': self.paused,
             'air_resistance': self.physics_engine.air_resistance,
             'air_density_factor': self.physics_engine.air_density_factor,
-            'ground_level': self.physics_engine.ground_level
+            'ground_level': self.physics_engine.ground_level,
+            'event_location': self.physics_engine.event_location
         }
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""Balayage de paramètres sur les grilles prédéfinies, réparti sur plusieurs processus"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+from ..models.physics_object import PhysicsObject
+from ..simulation.simulator import FreeFallSimulator
+from ..simulation.numerical_methods import EulerMethod, RK4Method, DormandPrinceMethod
+from ..simulation.events import APEX, REST
+from ..simulation.recording import RecordNothing
+from ..simulation.prefix_cache import ImpactSnapshotStore
+from ..utils.constants import BALL_TYPES, GROUND_TYPES, AIR_DENSITY_FACTORS, INITIAL_HEIGHTS
+
+# Méthodes numériques utilisables par nom (les scénarios doivent rester sérialisables)
+NUMERICAL_METHODS = {
+    'euler': EulerMethod,
+    'rk4': RK4Method,
+    'rk45': DormandPrinceMethod
+}
+
+# Colonnes du tableau de résultats
+RESULT_FIELDS = ('ball', 'ground', 'air', 'height', 'mass', 'radius', 'drag_coefficient',
+                 'restitution_coefficient', 'air_density_factor', 'bounce_count', 'bounce_heights',
+                 'max_bounce_height', 'time_to_rest', 'initial_energy', 'energy_dissipated',
+                 'dissipated_fraction')
+
+class SweepScenario(NamedTuple):
+    """Combinaison de paramètres simulée par un balayage"""
+    ball: str
+    ground: str
+    air: str
+    height: float
+    mass: float
+    radius: float
+    drag_coefficient: float
+    restitution_coefficient: float
+    air_density_factor: float
+
+def build_grid(balls: Sequence[dict] = BALL_TYPES,
+               grounds: Sequence[dict] = GROUND_TYPES,
+               air_densities: Sequence[dict] = AIR_DENSITY_FACTORS,
+               heights: Sequence[float] = INITIAL_HEIGHTS) -> List[SweepScenario]:
+    """
+    Construit le produit cartésien des paramètres
+
+    Les entrées ont la même forme que les constantes prédéfinies, ce qui
+    permet de construire des grilles plus fines (ex. {"name": "e=0.7", "restitution": 0.7}).
+
+    Returns:
+        Liste des scénarios, dans l'ordre balles × sols × densités × hauteurs
+    """
+    return [
+        SweepScenario(ball['name'], ground['name'], air['name'], float(height),
+                      ball['mass'], ball['radius'], ball['drag_coefficient'],
+                      ground['restitution'], air['factor'])
+        for ball, ground, air, height in itertools.product(balls, grounds, air_densities, heights)
+    ]
+
+def run_scenario(scenario: SweepScenario, dt: float = 0.002, max_duration: float = 60.0,
+                 method: str = 'euler', air_resistance: bool = True,
+                 snapshot_store: Optional[ImpactSnapshotStore] = None) -> dict:
+    """
+    Simule un scénario sans enregistrer d'historique et résume le résultat
+
+    Args:
+        scenario: Paramètres du scénario
+        dt: Pas de temps
+        max_duration: Durée simulée maximale si la balle ne s'arrête pas
+        method: Nom de la méthode numérique ('euler', 'rk4', 'rk45')
+        air_resistance: Active la résistance de l'air
+        snapshot_store: Instantanés avant premier impact ; s'il est donné, la chute
+            d'un scénario précédent ne différant que par le sol est reprise
+
+    Returns:
+        Ligne du tableau de résultats (clés RESULT_FIELDS) ; time_to_rest vaut None
+        si la balle n'est pas arrêtée à la fin de max_duration
+    """
+    simulator = FreeFallSimulator(dt=dt, air_resistance=air_resistance,
+                                  air_density_factor=scenario.air_density_factor,
+                                  numerical_method=NUMERICAL_METHODS[method](),
+                                  recording_policy=RecordNothing())
+    obj = PhysicsObject(y=scenario.height, mass=scenario.mass, radius=scenario.radius,
+                        drag_coefficient=scenario.drag_coefficient,
+                        restitution_coefficient=scenario.restitution_coefficient)
+    simulator.add_object(obj)
+
+    # Énergie mesurée par rapport à la position de repos (centre à un rayon du sol)
+    rest_height = simulator.physics_engine.ground_level + obj.radius
+    initial_energy = obj.kinetic_energy + obj.potential_energy(rest_height)
+
+    bounce_heights = []
+    time_to_rest = None
+    engine = simulator.physics_engine
+    if snapshot_store is not None:
+        snapshot_store.advance(simulator, max_duration)
+    while simulator.time < max_duration and time_to_rest is None:
+        simulator.step()
+        for event in simulator.last_events:
+            if event.kind == APEX:
+                bounce_heights.append(event.value)
+            elif event.kind == REST:
+                time_to_rest = event.time
+
+    final_energy = obj.kinetic_energy + obj.potential_energy(rest_height)
+    dissipated = initial_energy - final_energy
+
+    row = scenario._asdict()
+    row.update({
+        'bounce_count': engine.get_rebounds(obj),
+        'bounce_heights': tuple(bounce_heights),
+        'max_bounce_height': max(bounce_heights, default=0.0),
+        'time_to_rest': time_to_rest,
+        'initial_energy': initial_energy,
+        'energy_dissipated': dissipated,
+        'dissipated_fraction': dissipated / initial_energy if initial_energy > 0 else 0.0
+    })
+    return row
+
+def run_sweep(scenarios: Iterable[SweepScenario], workers: Optional[int] = None,
+              chunksize: Optional[int] = None, reuse_prefix: bool = True, **options) -> List[dict]:
+    """
+    Exécute les scénarios en parallèle sur un pool de processus
+
+    Args:
+        scenarios: Scénarios à simuler
+        workers: Nombre de processus (1 = exécution dans le processus courant)
+        chunksize: Scénarios envoyés par lot à chaque processus (par défaut,
+            environ quatre lots par processus pour amortir leur démarrage)
+        reuse_prefix: Reprend la chute jusqu'au premier impact des scénarios qui ne
+            diffèrent que par le sol (un magasin d'instantanés par appel et par processus)
+        **options: Paramètres transmis à run_scenario
+
+    Returns:
+        Lignes de résultats, dans l'ordre des scénarios
+    """
+    scenarios = list(scenarios)
+    workers = workers or os.cpu_count() or 1
+    store = ImpactSnapshotStore() if reuse_prefix else None
+
+    # Les scénarios qui ne diffèrent que par le sol sont envoyés ensemble pour
+    # que le même processus réutilise leur chute commune jusqu'au premier impact
+    order = sorted(range(len(scenarios)), key=lambda i: _prefix_group(scenarios[i]))
+    ordered = [scenarios[i] for i in order]
+
+    if workers == 1 or len(scenarios) <= 1:
+        rows = [run_scenario(scenario, snapshot_store=store, **options) for scenario in ordered]
+    else:
+        workers = min(workers, len(scenarios))
+        if chunksize is None:
+            group_size = max(Counter(map(_prefix_group, scenarios)).values())
+            chunksize = max(group_size, len(scenarios) // (4 * workers))
+        # Chaque processus reçoit sa propre copie (vide) du magasin à son démarrage
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(store,)) as executor:
+            rows = list(executor.map(partial(_run_in_worker, **options), ordered, chunksize=chunksize))
+
+    results = [None] * len(scenarios)
+    for position, i in enumerate(order):
+        results[i] = rows[position]
+    return results
+
+# Magasin d'instantanés du processus de travail courant (fixé par _init_worker)
+_worker_store: Optional[ImpactSnapshotStore] = None
+
+def _init_worker(store: Optional[ImpactSnapshotStore]):
+    """Initialise un processus du pool avec le magasin d'instantanés de son balayage"""
+    global _worker_store
+    _worker_store = store
+
+def _run_in_worker(scenario: SweepScenario, **options) -> dict:
+    """Simule un scénario dans un processus du pool"""
+    return run_scenario(scenario, snapshot_store=_worker_store, **options)
+
+def _prefix_group(scenario: SweepScenario) -> tuple:
+    """Paramètres qui déterminent la trajectoire jusqu'au premier impact"""
+    return (scenario.ball, scenario.air, scenario.height, scenario.mass, scenario.radius,
+            scenario.drag_coefficient, scenario.air_density_factor)
+
+def write_csv(rows: Iterable[dict], stream):
+    """Écrit les résultats au format CSV (hauteurs de rebond séparées par des ';')"""
+    writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        row = dict(row)
+        row['bounce_heights'] = ';'.join(f"{height:.6g}" for height in row['bounce_heights'])
+        writer.writerow(row)
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Point d'entrée en ligne de commande : python -m src.simulation.sweep"""
+    parser = argparse.ArgumentParser(description="Balayage de paramètres de chute libre")
+    parser.add_argument('--dt', type=float, default=0.002, help="Pas de temps (s)")
+    parser.add_argument('--max-duration', type=float, default=60.0, help="Durée simulée maximale (s)")
+    parser.add_argument('--method', choices=sorted(NUMERICAL_METHODS), default='euler')
+    parser.add_argument('--workers', type=int, default=None, help="Nombre de processus")
+    parser.add_argument('--chunksize', type=int, default=None, help="Scénarios par lot")
+    parser.add_argument('--heights', type=float, nargs='+', default=INITIAL_HEIGHTS,
+                        help="Hauteurs initiales (m)")
+    parser.add_argument('--restitutions', type=float, nargs='+', default=None,
+                        help="Coefficients de restitution (remplacent les sols prédéfinis)")
+    parser.add_argument('--output', default=None, help="Fichier CSV (sortie standard par défaut)")
+    args = parser.parse_args(argv)
+
+    grounds = GROUND_TYPES
+    if args.restitutions:
+        grounds = [{"name": f"e={value:g}", "restitution": value} for value in args.restitutions]
+
+    scenarios = build_grid(grounds=grounds, heights=args.heights)
+    rows = run_sweep(scenarios, workers=args.workers, chunksize=args.chunksize,
+                     dt=args.dt, max_duration=args.max_duration, method=args.method)
+
+    if args.output:
+        with open(args.output, 'w', newline='') as stream:
+            write_csv(rows, stream)
+    else:
+        write_csv(rows, sys.stdout)
+
+if __name__ == '__main__':
+    main()
@@ -59,4 +59,15 @@ AIR_DENSITY_FACTORS = [
     {"name": "Air très dense (3.0x)", "factor": 3.0}
 ]
 
-INITIAL_HEIGHTS = [3.0, 5.0, 8.0, 10.0, 15.0, 20.0]
\ No newline at end of file
+INITIAL_HEIGHTS = [3.0, 5.0, 8.0, 10.0, 15.0, 20.0]
+
+# Vitesses de simulation (facteur None = aller directement jusqu'à l'arrêt)
+TIME_SCALES = [
+    {"name": "1x", "factor": 1.0},
+    {"name": "5x", "factor": 5.0},
+    {"name": "50x", "factor": 50.0},
+    {"name": "Jusqu'au repos", "factor": None}
+]
+
+MAX_SUBSTEPS_PER_FRAME = 1000  # Limite de sous-pas physiques par image
+MAX_JUMP_STEPS_PER_FRAME = 1000  # Limite de pas physiques par image pour "Jusqu'au repos"
@@ -0,0 +1,134 @@
+"""Cache disque des résultats de simulation, adressé par le contenu des paramètres"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+from typing import Dict, Iterable, NamedTuple, Optional
+
+# Racine du dépôt (src/utils/ -> racine)
+_REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_code_versions: Dict[tuple, str] = {}
+
+def code_version(paths: Optional[Iterable[str]] = None) -> str:
+    """
+    Empreinte sha256 du code de simulation
+
+    Par défaut : tous les fichiers .py de src/ et physics.py. Toute modification
+    du code change l'empreinte, et donc les clés du cache.
+    """
+    if paths is None:
+        paths = glob.glob(os.path.join(_REPOSITORY_ROOT, 'src', '**', '*.py'), recursive=True)
+        paths.append(os.path.join(_REPOSITORY_ROOT, 'physics.py'))
+    paths = tuple(sorted(paths))
+
+    version = _code_versions.get(paths)
+    if version is None:
+        digest = hashlib.sha256()
+        for path in paths:
+            if os.path.exists(path):
+                digest.update(os.path.relpath(path, _REPOSITORY_ROOT).encode())
+                with open(path, 'rb') as source:
+                    digest.update(source.read())
+        version = digest.hexdigest()
+        _code_versions[paths] = version
+    return version
+
+class CachedResult(NamedTuple):
+    """Entrée du cache : tableaux (trajectoires) et résumé sérialisable en JSON"""
+    arrays: Dict[str, np.ndarray]
+    summary: dict
+
+class ResultCache:
+    """
+    Cache de résultats stockés en fichiers .npz compressés
+
+    - La clé est le sha256 des paramètres (JSON trié) et de la version du code.
+    - Les écritures passent par un fichier temporaire renommé avec os.replace :
+      plusieurs processus peuvent écrire en même temps, un lecteur ne voit
+      jamais de fichier partiel.
+    - Au-delà de max_bytes, les entrées les moins récemment utilisées (date de
+      modification, rafraîchie à chaque lecture) sont supprimées.
+    """
+
+    SUMMARY_KEY = '__summary__'
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 ** 2, version: Optional[str] = None):
+        """
+        Args:
+            directory: Répertoire du cache (créé si besoin)
+            max_bytes: Taille totale maximale des entrées
+            version: Version du code incluse dans les clés (empreinte des sources par défaut)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version or code_version()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, namespace: str, parameters: dict) -> str:
+        """Clé de contenu d'un jeu de paramètres"""
+        payload = json.dumps({'namespace': namespace, 'version': self.version, 'parameters': parameters},
+                             sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """Retourne l'entrée, ou None si absente (ou supprimée entre-temps par un autre processus)"""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files if name != self.SUMMARY_KEY}
+                summary = json.loads(str(data[self.SUMMARY_KEY])) if self.SUMMARY_KEY in data.files else {}
+            os.utime(path)  # Marque l'entrée comme récemment utilisée
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedResult(arrays, summary)
+
+    def put(self, key: str, arrays: Dict[str, np.ndarray], summary: Optional[dict] = None):
+        """Écrit une entrée de façon atomique puis applique la limite de taille"""
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as stream:
+                np.savez_compressed(stream, **arrays, **{self.SUMMARY_KEY: np.array(json.dumps(summary or {}))})
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.npz')):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Déjà supprimée par un autre processus
+            total -= size
+
+    def clear(self):
+        """Supprime toutes les entrées"""
+        for path in glob.glob(os.path.join(self.directory, '*.npz')):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,148 @@
+"""Tests unitaires pour les solutions analytiques"""
+
+import unittest
+import sys
+import os
+import math
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.simulation.analytic_solutions import (AnalyticTrajectory, ParabolicTrajectory,
+                                               QuadraticDragVerticalTrajectory,
+                                               analytic_trajectory, compute_bounce_table)
+from src.simulation.simulator import FreeFallSimulator
+from src.simulation.numerical_methods import RK4Method
+from src.models.physics_object import PhysicsObject
+from src.models.physics_engine import PhysicsEngine
+from src.utils.constants import GRAVITY
+
+class TestParabolicTrajectory(unittest.TestCase):
+    """Tests pour la trajectoire sans frottement"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.trajectory = ParabolicTrajectory(10.1, radius=0.1, restitution_coefficient=0.8)
+
+    def test_base_class_is_abstract(self):
+        """Test que la classe de base ne peut pas être instanciée"""
+        with self.assertRaises(TypeError):
+            AnalyticTrajectory(10.0)
+
+    def test_bounce_schedule(self):
+        """Test des instants d'impact et des hauteurs de rebond"""
+        first = self.trajectory.bounces[0]
+        self.assertAlmostEqual(first.time, math.sqrt(2 * 10.0 / GRAVITY), places=10)
+        self.assertAlmostEqual(first.impact_speed, math.sqrt(2 * GRAVITY * 10.0), places=10)
+        self.assertAlmostEqual(first.apex_height, 0.1 + 0.64 * 10.0, places=10)
+
+        second = self.trajectory.bounces[1]
+        self.assertAlmostEqual(second.apex_height, 0.1 + 0.64 ** 2 * 10.0, places=10)
+        self.assertAlmostEqual(second.time - first.time, 2 * first.rebound_speed / GRAVITY, places=10)
+
+    def test_state_and_energy_on_demand(self):
+        """Test de l'évaluation de l'état et de l'énergie à un instant quelconque"""
+        first = self.trajectory.bounces[0]
+        x, y, vx, vy = self.trajectory.state_at(first.apex_time)
+        self.assertAlmostEqual(y, first.apex_height, places=10)
+        self.assertAlmostEqual(vy, 0.0, places=10)
+
+        energy = self.trajectory.energy_at(first.apex_time, mass=2.0)
+        self.assertAlmostEqual(energy['kinetic'], 0.0, places=8)
+        self.assertAlmostEqual(energy['total'], 2.0 * GRAVITY * first.apex_height, places=8)
+
+    def test_rest_and_sampling(self):
+        """Test de l'arrêt final et de l'échantillonnage vectorisé"""
+        rest_time = self.trajectory.rest_time
+        self.assertEqual(self.trajectory.bounces[-1].rebound_speed, 0.0)
+        self.assertEqual(self.trajectory.state_at(rest_time + 100.0), (0.0, 0.1, 0.0, 0.0))
+
+        samples = self.trajectory.sample([0.0, 0.5, rest_time + 1.0])
+        self.assertAlmostEqual(samples['y'][0], 10.1)
+        self.assertAlmostEqual(samples['y'][1], 10.1 - 0.5 * GRAVITY * 0.25)
+        self.assertAlmostEqual(samples['y'][2], 0.1)
+
+    def test_matches_numerical_simulation(self):
+        """Test de la cohérence avec le simulateur numérique à localisation d'impact"""
+        simulator = FreeFallSimulator(dt=0.01, air_resistance=False,
+                                      numerical_method=RK4Method(), event_location=True)
+        obj = PhysicsObject(x=0, y=10.1, vx=1.0, vy=0, radius=0.1, restitution_coefficient=0.8)
+        trajectory = analytic_trajectory(obj, simulator.physics_engine)
+        simulator.add_object(obj)
+
+        simulator.run_for_duration(3.0)
+
+        x, y, vx, vy = trajectory.state_at(simulator.time)
+        self.assertAlmostEqual(obj.x, x, places=6)
+        self.assertAlmostEqual(obj.y, y, places=6)
+        self.assertAlmostEqual(obj.vy, vy, places=6)
+
+class TestQuadraticDragVerticalTrajectory(unittest.TestCase):
+    """Tests pour la trajectoire verticale avec frottement quadratique"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.obj = PhysicsObject(x=0, y=10.033, vx=0, vy=0, mass=0.058, radius=0.033,
+                                 drag_coefficient=0.508, restitution_coefficient=0.85)
+        self.engine = PhysicsEngine(air_resistance=True)
+        self.trajectory = analytic_trajectory(self.obj, self.engine)
+
+    def test_drop_from_rest(self):
+        """Test de la chute initiale (solution en tangente hyperbolique)"""
+        self.assertIsInstance(self.trajectory, QuadraticDragVerticalTrajectory)
+        vt = self.trajectory.terminal_speed
+        t = 0.7
+        x, y, vx, vy = self.trajectory.state_at(t)
+
+        self.assertAlmostEqual(vy, -vt * math.tanh(GRAVITY * t / vt), places=10)
+        self.assertAlmostEqual(y, 10.033 - vt ** 2 / GRAVITY * math.log(math.cosh(GRAVITY * t / vt)), places=10)
+
+    def test_rise_reaches_apex(self):
+        """Test que la montée (solution en tangente) s'arrête au sommet annoncé"""
+        first = self.trajectory.bounces[0]
+        self.assertLess(first.impact_speed, math.sqrt(2 * GRAVITY * 10.0))
+        self.assertAlmostEqual(first.rebound_speed, 0.85 * first.impact_speed, places=12)
+
+        x, y, vx, vy = self.trajectory.state_at(first.apex_time)
+        self.assertAlmostEqual(y, first.apex_height, places=10)
+        self.assertAlmostEqual(vy, 0.0, places=10)
+        self.assertLess(first.apex_height - 0.033, 0.85 ** 2 * 10.0)
+
+    def test_matches_numerical_simulation(self):
+        """Test de la cohérence avec une intégration RK4 fine"""
+        simulator = FreeFallSimulator(dt=0.001, air_resistance=True,
+                                      numerical_method=RK4Method(), event_location=True)
+        simulator.add_object(self.obj)
+        simulator.run_for_duration(2.5)
+
+        x, y, vx, vy = self.trajectory.state_at(simulator.time)
+        self.assertAlmostEqual(self.obj.y, y, places=6)
+        self.assertAlmostEqual(self.obj.vy, vy, places=6)
+
+    def test_numerical_fallback_for_2d_motion(self):
+        """Test du repli numérique pour le mouvement 2D avec frottement"""
+        obj = PhysicsObject(x=0, y=5, vx=2.0, vy=0, mass=0.058, radius=0.033)
+        self.assertIsNone(analytic_trajectory(obj, self.engine))
+
+        bounces = compute_bounce_table(obj, self.engine, dt=0.01, max_duration=3.0)
+        self.assertGreater(len(bounces), 0)
+        self.assertEqual(obj.y, 5)  # L'objet d'origine n'est pas modifié
+        self.assertLess(bounces[0].apex_height, 5)
+
+    def test_numerical_fallback_locates_impacts(self):
+        """Test que le repli numérique date les impacts dans le pas et garde la vitesse d'impact"""
+        def table(dt):
+            obj = PhysicsObject(x=0, y=5, vx=2.0, vy=0, mass=0.058, radius=0.033, restitution_coefficient=0.3)
+            return compute_bounce_table(obj, self.engine, dt=dt, max_duration=10.0)
+
+        coarse, fine = table(0.05), table(0.001)
+        self.assertAlmostEqual(coarse[0].time, fine[0].time, places=6)
+        self.assertAlmostEqual(coarse[0].impact_speed, fine[0].impact_speed, places=6)
+        self.assertAlmostEqual(coarse[0].rebound_speed, 0.3 * coarse[0].impact_speed, places=12)
+
+        # Impact final trop faible : rebond annulé mais vitesse d'impact connue
+        self.assertEqual(coarse[-1].rebound_speed, 0.0)
+        self.assertGreater(coarse[-1].impact_speed, 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
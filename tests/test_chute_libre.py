@@ -0,0 +1,183 @@
+"""Tests unitaires pour le modèle ChuteLibre (physics.py)"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Ajouter la racine du dépôt au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from physics import ChuteLibre, ChuteLibreBatch
+
+def euler_reference(model):
+    """Intégration d'Euler pas à pas de l'ancien ChuteLibre.simulate"""
+    y = np.zeros(model.n_steps)
+    v = np.zeros(model.n_steps)
+    y[0], v[0] = model.y0, model.v0
+    for i in range(1, model.n_steps):
+        acceleration = -model.g - (model.k / model.m) * v[i - 1]
+        v[i] = v[i - 1] + acceleration * model.dt
+        y[i] = y[i - 1] + v[i - 1] * model.dt
+        if y[i] <= 0 and v[i] < 0:
+            y[i] = 0
+            v[i] = -model.e * v[i]
+    return y, v
+
+class TestChuteLibre(unittest.TestCase):
+    """Tests pour la solution exacte par morceaux"""
+
+    def test_matches_euler_for_small_dt(self):
+        """Test que l'intégration d'Euler converge vers la solution exacte"""
+        errors = []
+        for dt in (1e-3, 1e-4):
+            model = ChuteLibre(0.5, 5.0, 0.0, dt, 3.0, 0.1, 0.8)
+            y, _ = euler_reference(model)
+            before_impact = np.arange(model.n_steps) < model.rebound_indices[0]
+            errors.append(np.max(np.abs(y[before_impact] - model.y[before_impact])))
+        self.assertLess(errors[1], errors[0] / 5)
+        self.assertLess(errors[1], 1e-3)
+
+    def test_rebound_structure_without_drag(self):
+        """Test des rebonds sans frottement : sommets en e² · h0, rebonds aux instants exacts"""
+        model = ChuteLibre(1.0, 5.0, 0.0, 1e-3, 4.0, 0.0, 0.8)
+        fall_time = np.sqrt(2 * 5.0 / model.g)
+
+        self.assertAlmostEqual(model.t[model.rebound_indices[0]], fall_time, delta=2 * model.dt)
+        for n, height in enumerate(model.max_heights[:4]):
+            self.assertAlmostEqual(height, 5.0 * 0.8 ** (2 * n), places=9)
+        self.assertAlmostEqual(model.max_times[1], fall_time * (1 + 0.8), places=9)
+        self.assertTrue(np.all(np.diff(model.rebound_indices) > 0))
+
+    def test_energy(self):
+        """Test des énergies : conservées sans frottement, décroissantes avec"""
+        elastic = ChuteLibre(1.0, 5.0, 0.0, 1e-3, 10.0, 0.0, 1.0)
+        np.testing.assert_allclose(elastic.E_total, elastic.E_total[0], rtol=1e-9)
+
+        damped = ChuteLibre(0.5, 5.0, 0.0, 1e-3, 10.0, 0.1, 0.8)
+        np.testing.assert_allclose(damped.E_total, damped.Ec + damped.Ep)
+        self.assertTrue(np.all(np.diff(damped.E_total) <= 1e-9))
+        self.assertTrue(np.all(damped.y >= 0))
+
+    def test_comes_to_rest(self):
+        """Test de l'arrêt : vitesse et hauteur nulles une fois les rebonds trop courts"""
+        model = ChuteLibre(0.5, 2.0, 0.0, 1e-3, 10.0, 0.1, 0.5)
+        self.assertEqual(model.y[-1], 0.0)
+        self.assertEqual(model.v[-1], 0.0)
+
+        inelastic = ChuteLibre(0.5, 2.0, 0.0, 1e-3, 3.0, 0.1, 0.0)
+        self.assertEqual(len(inelastic.rebound_indices), 1)
+        self.assertTrue(np.all(inelastic.y[inelastic.rebound_indices[0]:] == 0))
+
+    def test_large_step_count(self):
+        """Test qu'un million de pas reste rapide"""
+        model = ChuteLibre(0.5, 10.0, 0.0, 1e-5, 10.0, 0.1, 0.8)
+        self.assertEqual(len(model.y), model.n_steps)
+        self.assertGreater(len(model.rebound_indices), 10)
+
+class TestLazyChuteLibre(unittest.TestCase):
+    """Tests pour le calcul paresseux par blocs"""
+
+    ARGS = (0.5, 5.0, 0.0, 1e-3, 10.0, 0.1, 0.8)
+
+    def test_computes_on_demand(self):
+        """Test que seuls les blocs atteints sont calculés, à l'identique du calcul complet"""
+        eager = ChuteLibre(*self.ARGS)
+        lazy = ChuteLibre(*self.ARGS, lazy=True, chunk_size=500)
+        self.assertEqual(lazy.computed_steps, 500)
+
+        for _ in range(1200):
+            lazy.update()
+        self.assertEqual(lazy.computed_steps, 1500)
+        self.assertAlmostEqual(lazy.position, eager.y[1200])
+
+        np.testing.assert_allclose(lazy.get_position_data(), eager.y, atol=1e-12)
+        np.testing.assert_allclose(lazy.get_energy_data()[2], eager.E_total, atol=1e-12)
+        self.assertEqual(lazy.get_rebound_indices(), eager.rebound_indices)
+        self.assertEqual(lazy.get_max_heights(), eager.get_max_heights())
+
+    def test_restitution_change_keeps_prefix(self):
+        """Test qu'un changement de restitution ne recalcule qu'après le premier rebond"""
+        lazy = ChuteLibre(*self.ARGS, lazy=True, chunk_size=500)
+        lazy.current_step = 3000
+        lazy.ensure_computed(3000)
+        first_rebound = lazy.rebound_indices[0]
+        prefix = lazy.y[:first_rebound].copy()
+
+        lazy.current_step = 0
+        lazy.update_parameters(e=0.5)
+        self.assertEqual(lazy.computed_steps, first_rebound)
+        np.testing.assert_array_equal(lazy.y[:first_rebound], prefix)
+
+        expected = ChuteLibre(*self.ARGS[:-1], 0.5)
+        np.testing.assert_allclose(lazy.get_position_data(), expected.y, atol=1e-12)
+        self.assertEqual(lazy.get_rebound_indices(), expected.rebound_indices)
+
+    def test_other_changes_restart(self):
+        """Test que les autres paramètres invalident depuis le début"""
+        lazy = ChuteLibre(*self.ARGS, lazy=True, chunk_size=500)
+        lazy.current_step = 2200
+        lazy.update_parameters(h0=3.0)
+        self.assertEqual(lazy.current_step, 2200)
+        self.assertEqual(lazy.computed_steps, 2500)
+
+        expected = ChuteLibre(0.5, 3.0, 0.0, 1e-3, 10.0, 0.1, 0.8)
+        self.assertAlmostEqual(lazy.position, expected.y[2200])
+        np.testing.assert_allclose(lazy.get_position_data(), expected.y, atol=1e-12)
+
+    def test_time_grid_change_keeps_displayed_time(self):
+        """Test qu'un changement de dt ou de T garde l'instant affiché (ramené dans la durée)"""
+        model = ChuteLibre(*self.ARGS, lazy=True, chunk_size=500)
+        model.current_step = 2200
+        model.update_parameters(dt=5e-4)
+        self.assertAlmostEqual(model.time, 2.2, delta=model.dt)
+        self.assertEqual(model.time, model.t[model.current_step])
+
+        model.update_parameters(T=1.0)
+        self.assertEqual(model.current_step, model.n_steps - 1)
+        self.assertAlmostEqual(model.position, ChuteLibre(0.5, 5.0, 0.0, 5e-4, 1.0, 0.1, 0.8).y[-1])
+
+        model.update_parameters(k=0.2)
+        self.assertEqual(model.current_step, model.n_steps - 1)
+
+    def test_eager_update_resets_to_start(self):
+        """Test qu'en mode complet, update_parameters repart de t=0"""
+        model = ChuteLibre(*self.ARGS)
+        model.current_step = 2200
+        model.update_parameters(dt=5e-4)
+        self.assertEqual(model.current_step, 0)
+        self.assertEqual(model.time, 0.0)
+
+class TestChuteLibreBatch(unittest.TestCase):
+    """Tests pour le calcul groupé de plusieurs scénarios"""
+
+    BALLS = [{"name": "Léger", "m": 0.058, "k": 0.015}, {"name": "Lourd", "m": 7.0, "k": 0.0}]
+    GROUNDS = [{"name": "Dur", "e": 0.9}, {"name": "Mou", "e": 0.0}]
+    HEIGHTS = [2.0, 5.0]
+
+    def test_matches_single_scenarios(self):
+        """Test que chaque ligne reproduit ChuteLibre pour les mêmes paramètres"""
+        batch = ChuteLibreBatch.from_grid(self.BALLS, self.GROUNDS, self.HEIGHTS, dt=1e-3, T=5.0)
+        self.assertEqual(batch.y.shape, (8, batch.n_steps))
+        self.assertEqual(batch.labels[1], ("Léger", "Dur", 5.0))
+
+        for i, (ball, ground, height) in enumerate(
+                (b, g, h) for b in self.BALLS for g in self.GROUNDS for h in self.HEIGHTS):
+            single = ChuteLibre(ball["m"], height, 0.0, 1e-3, 5.0, ball["k"], ground["e"])
+            np.testing.assert_allclose(batch.y[i], single.y, atol=1e-12)
+            np.testing.assert_allclose(batch.E_total[i], single.E_total, rtol=1e-12, atol=1e-12)
+            self.assertEqual(batch.rebound_indices[i], single.rebound_indices)
+            np.testing.assert_allclose(batch.max_heights[i], single.max_heights)
+            np.testing.assert_allclose(batch.max_times[i], single.max_times)
+
+    def test_float32_storage(self):
+        """Test du stockage en float32"""
+        batch = ChuteLibreBatch(m=[0.5, 1.0], y0=[5.0, 3.0], v0=0.0, dt=1e-3, T=3.0,
+                                k=0.1, e=0.8, dtype=np.float32)
+        reference = ChuteLibreBatch(m=[0.5, 1.0], y0=[5.0, 3.0], v0=0.0, dt=1e-3, T=3.0, k=0.1, e=0.8)
+        self.assertEqual(batch.y.dtype, np.float32)
+        np.testing.assert_allclose(batch.y, reference.y, atol=1e-5)
+        self.assertEqual(batch.rebound_indices, reference.rebound_indices)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,14 +3,20 @@
 import unittest
 import sys
 import os
+import gc
 import math
+import shutil
+import tempfile
+import numpy as np
 
 # Ajouter le répertoire src au path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.models.physics_object import PhysicsObject
+from src.models.physics_object import PhysicsObject, SlottedPhysicsObject
+from src.models.object_array import PhysicsObjectArray, PhysicsObjectView
+from src.models.history import HistoryBuffer, SpillingHistoryBuffer
 from src.models.physics_engine import PhysicsEngine
-from src.simulation.numerical_methods import EulerMethod
+from src.simulation.numerical_methods import EulerMethod, RK4Method, DormandPrinceMethod
 from src.utils.constants import GRAVITY
 
 class TestPhysicsObject(unittest.TestCase):
@@ -50,6 +56,201 @@ class TestPhysicsObject(unittest.TestCase):
         expected_pe = 1.0 * GRAVITY * 10.0  # m * g * h
         self.assertAlmostEqual(self.obj.potential_energy(0), expected_pe, places=5)
 
+class TestHistoryBuffer(unittest.TestCase):
+    """Tests pour l'historique en colonnes"""
+
+    def test_growth_and_derived_energies(self):
+        """Test de l'agrandissement et des énergies calculées à la lecture"""
+        obj = PhysicsObject(y=5, vx=3, vy=4, mass=2.0)
+        obj.set_history_capacity(2)
+        for i in range(5):
+            obj.update_history(0.1 * i, reference_height=1.0)
+
+        history = obj.history
+        self.assertEqual(len(history['time']), 5)
+        self.assertGreaterEqual(history.capacity, 5)
+        self.assertAlmostEqual(history['time'][-1], 0.4)
+        self.assertAlmostEqual(history['kinetic_energy'][0], obj.kinetic_energy)
+        self.assertAlmostEqual(history['potential_energy'][0], obj.potential_energy(1.0))
+        self.assertIn('kinetic_energy', history)
+
+        obj.reset_history()
+        self.assertEqual(len(obj.history['y']), 0)
+
+    def test_mass_change_keeps_recorded_energies(self):
+        """Test qu'un changement de masse ne modifie pas les énergies déjà enregistrées"""
+        obj = PhysicsObject(y=5, vx=3, vy=4, mass=2.0)
+        for i in range(3):
+            obj.update_history(0.1 * i)
+        obj.mass = 4.0
+        for i in range(3, 5):
+            obj.update_history(0.1 * i, reference_height=1.0)
+
+        kinetic = obj.history['kinetic_energy']
+        potential = obj.history['potential_energy']
+        self.assertEqual(list(kinetic), [25.0, 25.0, 25.0, 50.0, 50.0])
+        self.assertAlmostEqual(potential[0], 2.0 * GRAVITY * 5)
+        self.assertAlmostEqual(potential[4], 4.0 * GRAVITY * 4)
+
+        # Troncature et mode anneau : les plages suivent les états gardés
+        obj.history.truncate(2)
+        obj.update_history(0.2)
+        self.assertEqual(list(obj.history['kinetic_energy']), [25.0, 25.0, 50.0])
+
+        ring = HistoryBuffer(capacity=2, ring=True)
+        ring.mass = 1.0
+        ring.append(0.0, 0.0, 0.0, 1.0, 0.0)
+        ring.mass = 2.0
+        for i in range(3):
+            ring.append(float(i), 0.0, 0.0, 1.0, 0.0)
+        self.assertEqual(list(ring['kinetic_energy']), [1.0, 1.0])
+
+    def test_ring_mode_is_contiguous(self):
+        """Test du mode anneau : derniers états, lus sans copie"""
+        history = HistoryBuffer(capacity=4, ring=True)
+        for i in range(10):
+            history.append(float(i), 0.0, float(i), 0.0, 0.0)
+
+        times = history['time']
+        self.assertEqual(list(times), [6.0, 7.0, 8.0, 9.0])
+        self.assertIsNotNone(times.base)
+        self.assertTrue(times.flags['C_CONTIGUOUS'])
+
+    def test_spilling_to_disk(self):
+        """Test du stockage sur disque par blocs, relu via memmap"""
+        obj = PhysicsObject(y=3.0, mass=0.5)
+        obj.spill_history(chunk_size=100)
+        history = obj.history
+        self.assertIsInstance(history, SpillingHistoryBuffer)
+
+        for i in range(1050):
+            obj.y = 3.0 - 0.001 * i
+            obj.update_history(0.001 * i)
+
+        self.assertEqual(history._data.shape[1], 100)  # Mémoire bornée au bloc
+        y = history['y']
+        self.assertEqual(len(y), 1050)
+        self.assertTrue(y.flags['C_CONTIGUOUS'])  # Stockage par colonne
+        self.assertAlmostEqual(y[1049], 3.0 - 1.049)
+        self.assertEqual(history._spilled, 1000)  # La lecture ne vide pas le bloc en cours
+        mapping = history._map
+        history.append(2.0, 0.0, -1.0, 0.0, 0.0)
+        self.assertEqual(history['y'][-1], -1.0)
+        self.assertIs(history._map, mapping)  # Projection réutilisée tant que la capacité suffit
+        self.assertAlmostEqual(history['potential_energy'][0], 0.5 * GRAVITY * 3.0)
+        self.assertEqual(history.as_array().shape, (5, 1051))
+
+        path = history.path
+        history.clear()
+        self.assertEqual(len(history), 0)
+        history.close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_spilling_growth_and_explicit_path(self):
+        """Test de l'agrandissement du fichier et de sa forme finale dans un répertoire choisi"""
+        directory = tempfile.mkdtemp()
+        history = SpillingHistoryBuffer(directory, chunk_size=10)
+        self.assertIsNone(history._map)  # Aucun fichier avant le premier déversement
+        history.append(0.0, 0.0, 5.0, 0.0, 0.0)
+        self.assertEqual(history['y'][0], 5.0)
+        self.assertFalse(os.path.exists(history.file))
+
+        for i in range(1, 200):
+            history.append(0.1 * i, 0.0, 5.0 - i, 0.0, 0.0)
+            if i == 15:
+                early = history['y']
+        self.assertGreaterEqual(history.file_capacity, 200)
+        self.assertEqual(list(early), [5.0 - i for i in range(16)])  # Vue antérieure intacte
+        self.assertEqual(history['y'][199], 5.0 - 199)
+
+        history.close()
+        stored = np.fromfile(history.file).reshape(len(SpillingHistoryBuffer.FIELDS), -1)
+        self.assertEqual(stored.shape[1], 200)
+        self.assertEqual(stored[2, 199], 5.0 - 199)
+        shutil.rmtree(directory)
+
+    def test_spilled_files_are_removed(self):
+        """Test de la suppression des fichiers temporaires sans appel explicite à close()"""
+        obj = PhysicsObject(y=3.0)
+        obj.spill_history(chunk_size=10)
+        for i in range(25):
+            obj.update_history(0.01 * i)
+        first = obj.history.path
+
+        # Remplacer l'historique ferme l'ancien
+        obj.spill_history(chunk_size=10)
+        self.assertFalse(os.path.exists(first))
+
+        second = obj.history.path
+        obj.update_history(0.0)
+        obj.history['y']
+        obj.history = None
+        gc.collect()
+        self.assertFalse(os.path.exists(second))
+
+class TestPhysicsObjectArray(unittest.TestCase):
+    """Tests pour les objets compacts et adossés à un tableau partagé"""
+
+    def test_slots(self):
+        """Test que la variante compacte n'a pas de __dict__, contrairement à PhysicsObject"""
+        obj = SlottedPhysicsObject(x=1, y=2)
+        self.assertFalse(hasattr(obj, '__dict__'))
+        with self.assertRaises(AttributeError):
+            obj.unknown_field = 1.0
+        self.assertEqual((obj.x, obj.y, obj.mass), (1, 2, 1.0))
+
+        regular = PhysicsObject(x=1, y=2)
+        regular.unknown_field = 1.0  # Attributs supplémentaires toujours permis
+        self.assertEqual(regular.unknown_field, 1.0)
+
+    def test_view_writes_through(self):
+        """Test que les vues lisent et écrivent la ligne du tableau"""
+        array = PhysicsObjectArray(3, y=[1.0, 2.0, 3.0], mass=0.5)
+        view = array.view(1)
+        self.assertIsInstance(view, PhysicsObjectView)
+        self.assertFalse(hasattr(view, '__dict__'))
+        self.assertIs(array.view(1), view)
+
+        self.assertEqual(view.y, 2.0)
+        self.assertEqual(view.mass, 0.5)
+        view.vy = -4.0
+        self.assertEqual(array.column('vy')[1], -4.0)
+        array.column('y')[1] = 7.0
+        self.assertEqual(view.y, 7.0)
+
+        with self.assertRaises(TypeError):
+            PhysicsObjectArray(1, unknown=1.0)
+
+    def test_view_in_engine(self):
+        """Test qu'une vue se comporte comme un objet ordinaire dans le moteur"""
+        engine = PhysicsEngine(air_resistance=True)
+        obj = PhysicsObject(x=0, y=10, vx=1, vy=0)
+        array = PhysicsObjectArray.from_objects([obj])
+        view = array.view(0)
+
+        for _ in range(100):
+            engine.update_object(obj, 0.01, EulerMethod())
+            engine.update_object(view, 0.01, EulerMethod())
+
+        self.assertEqual(view.y, obj.y)
+        self.assertEqual(array.state[0, 1], obj.y)
+
+    def test_view_derivatives_cache_invalidation(self):
+        """Test que les vues reconstruisent leur fonction de dérivées quand la traînée change"""
+        engine = PhysicsEngine(air_resistance=True)
+        array = PhysicsObjectArray(2, mass=1.0)
+        view = array.view(0)
+        kernel = engine.derivatives_kernel(view)
+
+        view.mass = 2.0
+        self.assertIsNot(engine.derivatives_kernel(view), kernel)
+
+        kernel = engine.derivatives_kernel(view)
+        array.column('radius')[:] = 0.3  # Écriture directe dans le tableau
+        self.assertIsNot(engine.derivatives_kernel(view), kernel)
+        self.assertAlmostEqual(engine.derivatives_kernel(view)(0, 0, 0, -1.0)[3],
+                               -GRAVITY + engine.drag_constant(view))
+
 class TestPhysicsEngine(unittest.TestCase):
     """Tests pour le moteur physique"""
 
@@ -150,6 +351,79 @@ class TestPhysicsEngine(unittest.TestCase):
         self.assertEqual(derivatives[2], 0)   # dvx/dt (pas de force horizontale)
         self.assertAlmostEqual(derivatives[3], -GRAVITY, places=5)  # dvy/dt
 
+    def test_derivatives_do_not_mutate_object(self):
+        """Test que le calcul des dérivées ne touche pas à l'objet"""
+        self.engine.air_resistance = True
+        derivatives = self.engine.calculate_derivatives(1, 2, 3, -4, self.obj)
+
+        self.assertEqual((self.obj.x, self.obj.y, self.obj.vx, self.obj.vy), (0, 10, 0, 0))
+        k = self.engine.drag_constant(self.obj)
+        self.assertAlmostEqual(derivatives[2], -k * 5.0 * 3, places=10)
+        self.assertAlmostEqual(derivatives[3], -GRAVITY + k * 5.0 * 4, places=10)
+
+    def test_drag_constant_cache_invalidation(self):
+        """Test que la constante de traînée suit les changements de paramètres"""
+        initial = self.engine.drag_constant(self.obj)
+        self.assertAlmostEqual(initial, 0.5 * 1.225 * self.obj.drag_coefficient * self.obj.area / self.obj.mass)
+
+        self.obj.mass = 2.0
+        self.assertAlmostEqual(self.engine.drag_constant(self.obj), initial / 2)
+
+        self.engine.set_air_density_factor(2.0)
+        self.assertAlmostEqual(self.engine.drag_constant(self.obj), initial)
+
+    def test_derivatives_kernel_is_cached(self):
+        """Test que la fonction de dérivées est réutilisée tant que la traînée ne change pas"""
+        self.engine.air_resistance = True
+        kernel = self.engine.derivatives_kernel(self.obj)
+        self.obj.y = 5.0
+        self.obj.vy = -3.0
+        self.assertIs(self.engine.derivatives_kernel(self.obj), kernel)
+
+        self.obj.radius = 0.2
+        resized = self.engine.derivatives_kernel(self.obj)
+        self.assertIsNot(resized, kernel)
+        self.assertAlmostEqual(resized(0, 0, 0, -1.0)[3], -GRAVITY + self.engine.drag_constant(self.obj))
+
+        self.engine.set_air_density_factor(2.0)
+        self.assertIsNot(self.engine.derivatives_kernel(self.obj), resized)
+        self.engine.air_resistance = False
+        self.assertEqual(self.engine.derivatives_kernel(self.obj)(0, 0, 1.0, -1.0), (1.0, -1.0, 0.0, -GRAVITY))
+
+    def test_contact_state_is_per_object(self):
+        """Test que l'arrêt d'un objet ne fige pas les autres"""
+        method = EulerMethod()
+        resting = PhysicsObject(x=0, y=0.1, vx=0, vy=0, mass=1.0, radius=0.1)
+        falling = PhysicsObject(x=0, y=0.5, vx=0, vy=-3.0, mass=1.0, radius=0.1)
+
+        self.engine.update_object(resting, 0.001, method)
+        self.assertTrue(self.engine.is_stopped(resting))
+
+        for _ in range(200):
+            self.engine.update_object(falling, 0.001, method)
+
+        self.assertFalse(self.engine.simulation_stopped)
+        self.assertFalse(self.engine.is_stopped(falling))
+        self.assertEqual(self.engine.get_rebounds(falling), 1)
+        self.assertEqual(self.engine.get_rebounds(resting), 0)
+        self.assertEqual(self.engine.total_rebounds, 1)
+
+    def test_forget_object_and_reset(self):
+        """Test de l'oubli d'un objet et de la remise à zéro de la table"""
+        other = PhysicsObject(y=0.1, radius=0.1)
+        self.engine.check_stop_condition(other)
+        self.obj.y = -0.05
+        self.obj.vy = -5.0
+        self.engine.handle_ground_collision(self.obj)
+
+        self.engine.forget_object(other)
+        self.assertNotIn(other, self.engine.contacts)
+        self.assertEqual(self.engine.get_rebounds(self.obj), 1)
+        self.assertFalse(self.engine.simulation_stopped)
+
+        self.engine.reset()
+        self.assertEqual(self.engine.total_rebounds, 0)
+
 class TestNumericalMethods(unittest.TestCase):
     """Tests pour les méthodes numériques"""
 
@@ -199,6 +473,57 @@ class TestNumericalMethods(unittest.TestCase):
         self.assertAlmostEqual(new_state[2], expected_vx, places=5)
         self.assertAlmostEqual(new_state[3], expected_vy, places=5)
 
+    def test_rk4_exact_for_constant_acceleration(self):
+        """Test que RK4 est exact pour une accélération constante"""
+        method = RK4Method()
+
+        def simple_derivatives(x, y, vx, vy):
+            return vx, vy, 0, -GRAVITY
+
+        new_state = method.step((0, 10, 2, 3), simple_derivatives, 0.5)
+
+        self.assertAlmostEqual(new_state[0], 1.0, places=10)
+        self.assertAlmostEqual(new_state[1], 10 + 3 * 0.5 - 0.5 * GRAVITY * 0.25, places=10)
+        self.assertAlmostEqual(new_state[2], 2.0, places=10)
+        self.assertAlmostEqual(new_state[3], 3 - GRAVITY * 0.5, places=10)
+
+    def test_dormand_prince_large_step_accuracy(self):
+        """Test que RK45 adaptatif reste précis avec un grand pas"""
+        method = DormandPrinceMethod(rtol=1e-8, atol=1e-10)
+        c = 0.8  # Frottement linéaire : dv/dt = -g - c*v
+
+        def linear_drag(x, y, vx, vy):
+            return vx, vy, -c * vx, -GRAVITY - c * vy
+
+        t = 2.0
+        new_state = method.step((0, 50, 4, 0), linear_drag, t)
+
+        terminal = GRAVITY / c
+        expected_vy = terminal * (math.exp(-c * t) - 1)
+        expected_y = 50 - terminal * t + terminal * (1 - math.exp(-c * t)) / c
+        expected_vx = 4 * math.exp(-c * t)
+
+        self.assertAlmostEqual(new_state[1], expected_y, places=6)
+        self.assertAlmostEqual(new_state[2], expected_vx, places=6)
+        self.assertAlmostEqual(new_state[3], expected_vy, places=6)
+        self.assertGreater(method.accepted_steps, 1)
+        self.assertIsNotNone(method.suggested_step)
+
+    def test_impact_location_leaves_adaptive_controller_untouched(self):
+        """Test que la recherche de l'impact ne modifie ni le pas suggéré ni les statistiques de RK45"""
+        engine = PhysicsEngine(air_resistance=True)
+        obj = PhysicsObject(y=0.12, vy=-3.0, radius=0.1)
+        derivatives = engine.derivatives_kernel(obj)
+        method = DormandPrinceMethod()
+        method.step((obj.x, obj.y, obj.vx, obj.vy), derivatives, 1e-3)
+        saved = method.suggested_step, method.accepted_steps, method.rejected_steps
+
+        tau = engine.locate_ground_impact((obj.x, obj.y, obj.vx, obj.vy), derivatives, 0.05, method, obj.radius)
+
+        self.assertGreater(tau, 0.0)
+        self.assertLess(tau, 0.05)
+        self.assertEqual((method.suggested_step, method.accepted_steps, method.rejected_steps), saved)
+
 class TestEdgeCases(unittest.TestCase):
     """Tests pour les cas limites"""
 
@@ -0,0 +1,117 @@
+"""Tests unitaires pour les trajectoires précalculées de visuel.py"""
+
+import gc
+import unittest
+import sys
+import os
+import weakref
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.simulation.precomputed_trajectory import EulerBounceModel, PrecomputedTrajectory, SimulationCache
+
+DT = 1.0 / 60
+G = 9.81
+
+def parameters(**changes):
+    """Paramètres d'une configuration de visuel.py (balle de tennis, vent, 10 m)"""
+    values = {'m': 0.058, 'k': 0.015, 'e': 0.9, 'wind_speed': 5.0, 'h0': 10.0}
+    values.update(changes)
+    return values
+
+class TestPrecomputedTrajectory(unittest.TestCase):
+    """Tests pour les trajectoires précalculées"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.model = EulerBounceModel(0.058, 0.015, 0.9, 5.0, DT, G)
+
+    def test_matches_euler_loop(self):
+        """Test que la trajectoire reproduit la boucle d'Euler d'origine de visuel.update_loop"""
+        m, k, e, wind_speed, h0 = 0.058, 0.015, 0.9, 5.0, 10.0
+        trajectory = PrecomputedTrajectory(self.model, h0, chunk_steps=100)
+        self.assertEqual(len(trajectory), 0)  # Rien n'est calculé avant la première lecture
+
+        x, y, vx, vy, rebounds = 0.0, h0, 0.0, 0.0, 0
+        for step in range(1, 1000):
+            vx += k * wind_speed / m * DT
+            vy += (-m * G - k * vy) / m * DT
+            x += vx * DT
+            y += vy * DT
+            if y <= 0 and vy < 0:
+                vy = -e * vy
+                vx *= e
+                y = 0
+                rebounds += 1
+            self.assertEqual(trajectory.state(step), (x, y, vx, vy, rebounds))
+
+        self.assertGreater(rebounds, 0)
+        self.assertEqual(len(trajectory), 1001)  # État initial et 10 blocs de 100 pas
+        kinetic, potential, total = trajectory.energies(999)
+        self.assertAlmostEqual(kinetic, 0.5 * m * (vx**2 + vy**2))
+        self.assertAlmostEqual(total, kinetic + m * G * y)
+
+    def test_live_steps_continue_trajectory(self):
+        """Test que le pas appliqué à l'état affiché prolonge exactement la trajectoire"""
+        trajectory = PrecomputedTrajectory(self.model, 10.0)
+        state = trajectory.state(0)
+        for step in range(1, 2000):
+            state = self.model.step(*state)
+        self.assertEqual(state, trajectory.state(1999))
+        self.assertEqual(self.model.energies(*state[1:4]), trajectory.energies(1999))
+
+    def test_bounded_trajectory(self):
+        """Test que seuls le premier bloc et les derniers états sont gardés, les autres étant recalculés"""
+        reference = PrecomputedTrajectory(self.model, 10.0, chunk_steps=100, max_steps=100000)
+        bounded = PrecomputedTrajectory(self.model, 10.0, chunk_steps=100, max_steps=300)
+        self.assertEqual(bounded.state(2000), reference.state(2000))
+        self.assertEqual(len(bounded._states), 300)
+        self.assertEqual(len(bounded), 2001)  # État initial et 20 blocs de 100 pas
+        self.assertEqual(bounded.start, 1701)
+
+        # Le premier bloc est gardé : revenir au départ ne recalcule rien
+        self.assertEqual(bounded.energies(5), reference.energies(5))
+        self.assertEqual(bounded.state(0), (0.0, 10.0, 0.0, 0.0, 0))
+        self.assertEqual((len(bounded), bounded.start), (2001, 1701))
+
+        # Un pas oublié au-delà du premier bloc est recalculé depuis sa fin
+        self.assertEqual(bounded.state(500), reference.state(500))
+        self.assertEqual((len(bounded), bounded.start), (501, 201))
+        self.assertEqual(bounded.state(2000), reference.state(2000))
+
+class TestSimulationCache(unittest.TestCase):
+    """Tests pour le cache des trajectoires précalculées"""
+
+    def test_exact_slider_values(self):
+        """Test que les valeurs des curseurs ne sont arrondies que dans la clé"""
+        cache = SimulationCache(time_step=0.01, gravity=9.8)
+        first = cache.get(parameters(e=0.7012, h0=4.96))
+        self.assertEqual((first.model.e, first.h0), (0.7012, 4.96))
+        self.assertEqual((first.model.time_step, first.model.gravity), (0.01, 9.8))
+        self.assertAlmostEqual(first.time(150), 1.5)
+        self.assertIs(cache.get(parameters(e=0.7012, h0=4.96)), first)
+
+        # Même cran : l'entrée est remplacée par une trajectoire aux valeurs exactes
+        second = cache.get(parameters(e=0.6987, h0=5.04))
+        self.assertEqual((second.model.e, second.h0), (0.6987, 5.04))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_lru_and_release(self):
+        """Test des réutilisations, de l'éviction et de la libération des trajectoires évincées"""
+        cache = SimulationCache(time_step=DT, max_entries=2)
+        first = cache.get(parameters())
+        self.assertIs(cache.get(parameters()), first)
+        self.assertIsNot(cache.get(parameters(e=0.5)), first)
+        cache.get(parameters(m=7.0, k=0.005))
+
+        released = weakref.ref(first)
+        first = None
+        gc.collect()
+        self.assertIsNone(released())  # Aucune autre trajectoire ne la retient
+        self.assertIsNot(cache.get(parameters()), released())
+        self.assertEqual((len(cache), cache.misses), (2, 4))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,14 +2,30 @@
 
 import unittest
 import sys
+import io
 import os
+import tempfile
+import time
+import numpy as np
 
 # Ajouter le répertoire src au path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.simulation.simulator import FreeFallSimulator
+from src.simulation.simulator import FreeFallSimulator, StepSnapshot, StepChunk
 from src.models.physics_object import PhysicsObject
-from src.simulation.numerical_methods import EulerMethod
+from src.simulation.numerical_methods import EulerMethod, RK4Method
+from src.simulation.batch_simulator import BatchFreeFallSimulator
+from src.models.object_array import PhysicsObjectArray
+from src.simulation.events import IMPACT, APEX, REST
+from src.utils.result_cache import ResultCache
+from src.simulation.sweep import build_grid, run_scenario, run_sweep, write_csv
+from src.simulation.prefix_cache import ImpactSnapshotStore
+from src.simulation.fixed_timestep import FixedTimestepAccumulator
+from src.simulation.physics_worker import PhysicsWorker, SnapshotBuffer
+from src.simulation.conditions import StopCondition, AllAtRest, BounceCount, EnergyBelow, HeightReached, ApexReached
+from src.simulation.recording import (RecordingPolicy, RecordEveryNthStep, RecordAtSampleRate,
+                                      RecordOnEvents, RecordNothing)
+from src.utils.constants import GRAVITY, BALL_TYPES
 
 class TestFreeFallSimulator(unittest.TestCase):
     """Tests pour le simulateur de chute libre"""
@@ -208,6 +224,58 @@ class TestFreeFallSimulator(unittest.TestCase):
         self.assertFalse(self.simulator.running)
         self.assertFalse(self.simulator.paused)
 
+class TestSleepingObjects(unittest.TestCase):
+    """Tests de la mise en sommeil des objets au repos"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.simulator = FreeFallSimulator(dt=0.001, air_resistance=False)
+        self.resting = PhysicsObject(x=0, y=0.1, vx=0, vy=0, mass=1.0, radius=0.1)
+        self.falling = PhysicsObject(x=0, y=5.0, vx=0, vy=0, mass=1.0, radius=0.1)
+        self.simulator.add_object(self.resting)
+        self.simulator.add_object(self.falling)
+
+    def test_resting_object_stops_recording(self):
+        """Test qu'un objet au repos n'est plus intégré ni enregistré"""
+        for _ in range(100):
+            self.simulator.step()
+
+        self.assertTrue(self.simulator.is_sleeping(self.resting))
+        self.assertFalse(self.simulator.is_sleeping(self.falling))
+        self.assertEqual(len(self.resting.history['time']), 1)
+        self.assertEqual(len(self.falling.history['time']), 100)
+        self.assertEqual(self.simulator.active_objects, [self.falling])
+
+    def test_impulse_wakes_object(self):
+        """Test qu'une impulsion réveille un objet au repos"""
+        self.simulator.step()
+        self.assertTrue(self.simulator.is_sleeping(self.resting))
+
+        self.simulator.apply_impulse(self.resting, 0.0, 2.0)
+
+        self.assertFalse(self.simulator.is_sleeping(self.resting))
+        self.assertAlmostEqual(self.resting.vy, 2.0)
+        self.simulator.step()
+        self.assertGreater(self.resting.y, 0.1)
+
+    def test_parameter_change_wakes_object(self):
+        """Test qu'un changement de paramètre réveille un objet au repos"""
+        self.simulator.step()
+        self.simulator.set_object_parameters(self.resting, restitution_coefficient=0.5)
+
+        self.assertFalse(self.simulator.is_sleeping(self.resting))
+        self.assertEqual(self.resting.restitution_coefficient, 0.5)
+        with self.assertRaises(AttributeError):
+            self.simulator.set_object_parameters(self.resting, elasticity=0.5)
+
+    def test_remove_sleeping_object(self):
+        """Test du retrait d'un objet endormi"""
+        self.simulator.step()
+        self.simulator.remove_object(self.resting)
+
+        self.assertEqual(self.simulator.sleeping_objects, [])
+        self.assertEqual(self.simulator.objects, [self.falling])
+
 class TestEnergyConservation(unittest.TestCase):
     """Tests de conservation d'énergie"""
 
@@ -288,5 +356,551 @@ class TestGroundCollision(unittest.TestCase):
         self.assertGreaterEqual(obj.y, obj.radius)
         # Note: la vitesse pourrait être vers le haut ou vers le bas selon le moment exact
 
+class TestRecordingPolicies(unittest.TestCase):
+    """Tests pour les politiques d'enregistrement de l'historique"""
+
+    def test_base_policy_is_abstract(self):
+        """Test qu'une politique sans should_record ne peut pas être instanciée"""
+        with self.assertRaises(TypeError):
+            RecordingPolicy()
+
+    def test_stride_and_sample_rate(self):
+        """Test de l'enregistrement un pas sur N et à fréquence fixe"""
+        simulator = FreeFallSimulator(dt=0.001, recording_policy=RecordEveryNthStep(10))
+        strided = PhysicsObject(y=50)
+        sampled = PhysicsObject(y=50)
+        silent = PhysicsObject(y=50)
+        simulator.add_object(strided)
+        simulator.add_object(sampled, recording_policy=RecordAtSampleRate(20))
+        simulator.add_object(silent, recording_policy=RecordNothing())
+
+        for _ in range(1000):
+            simulator.step()
+
+        self.assertEqual(len(strided.history['time']), 100)
+        self.assertEqual(len(sampled.history['time']), 21)
+        self.assertEqual(len(silent.history['time']), 0)
+        self.assertIs(simulator.get_recording_policy(silent).__class__, RecordNothing)
+
+    def test_event_only_recording(self):
+        """Test de l'enregistrement limité aux impacts, sommets et arrêt"""
+        simulator = FreeFallSimulator(dt=0.001, air_resistance=False,
+                                      recording_policy=RecordOnEvents())
+        obj = PhysicsObject(y=1.1, radius=0.1, restitution_coefficient=0.5)
+        simulator.add_object(obj)
+
+        kinds = []
+        for _ in range(5000):
+            simulator.step()
+            kinds.extend(event.kind for event in simulator.last_events)
+
+        self.assertEqual(kinds[0], IMPACT)
+        self.assertEqual(kinds[1], APEX)
+        self.assertEqual(kinds[-1], REST)
+        self.assertEqual(len(obj.history['time']), len(kinds))
+
+        impact_only = FreeFallSimulator(dt=0.001, air_resistance=False,
+                                        recording_policy=RecordOnEvents([IMPACT]))
+        other = PhysicsObject(y=1.1, radius=0.1, restitution_coefficient=0.5)
+        impact_only.add_object(other)
+        impact_only.run_for_duration(5.0)
+        self.assertEqual(len(other.history['time']), impact_only.physics_engine.total_rebounds)
+
+class TestStreamingAPI(unittest.TestCase):
+    """Tests pour les générateurs iter_steps et iter_events"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.simulator = FreeFallSimulator(dt=0.001, air_resistance=False, recording_policy=RecordNothing())
+        self.obj = PhysicsObject(y=1.1, radius=0.1, restitution_coefficient=0.5)
+        self.simulator.add_object(self.obj)
+
+    def test_iter_steps_lazy_and_interruptible(self):
+        """Test de la production pas à pas et de l'arrêt anticipé par le consommateur"""
+        for snapshot in self.simulator.iter_steps():
+            self.assertIsInstance(snapshot, StepSnapshot)
+            if snapshot.step == 10:
+                break
+
+        self.assertEqual(self.simulator.step_count, 10)
+        self.assertEqual(snapshot.states[0], (self.obj.x, self.obj.y, self.obj.vx, self.obj.vy))
+        self.assertAlmostEqual(snapshot.time, 0.01)
+        self.assertEqual(len(self.obj.history['time']), 0)
+
+    def test_iter_steps_chunks(self):
+        """Test des blocs de pas et de l'arrêt quand tout est au repos"""
+        chunks = list(self.simulator.iter_steps(chunk_size=256))
+        self.assertTrue(all(isinstance(chunk, StepChunk) for chunk in chunks))
+        self.assertTrue(all(len(chunk.time) == 256 for chunk in chunks[:-1]))
+        self.assertEqual(sum(len(chunk.time) for chunk in chunks), self.simulator.step_count)
+        self.assertEqual(chunks[-1].states.shape[1:], (1, 4))
+        self.assertAlmostEqual(chunks[-1].states[-1, 0, 1], 0.1)
+        self.assertTrue(self.simulator.physics_engine.simulation_stopped)
+
+        bounded = FreeFallSimulator(dt=0.01)
+        bounded.add_object(PhysicsObject(y=100))
+        self.assertEqual(sum(len(chunk.time) for chunk in bounded.iter_steps(1.0, chunk_size=30)), 100)
+
+    def test_iter_steps_chunk_abandon(self):
+        """Test qu'un bloc abandonné laisse la simulation sur sa dernière ligne, sans pas non produit"""
+        for chunk in self.simulator.iter_steps(chunk_size=64):
+            break
+
+        self.assertEqual(self.simulator.step_count, 64)
+        self.assertEqual(self.simulator.time, chunk.time[-1])
+        np.testing.assert_array_equal(chunk.states[-1, 0], (self.obj.x, self.obj.y, self.obj.vx, self.obj.vy))
+
+        resumed = next(self.simulator.iter_steps(chunk_size=64))
+        self.assertAlmostEqual(resumed.time[0], chunk.time[-1] + self.simulator.dt)
+
+    def test_iter_events(self):
+        """Test du flux d'événements typés"""
+        events = list(self.simulator.iter_events())
+        self.assertEqual(events[0].kind, IMPACT)
+        self.assertEqual(events[1].kind, APEX)
+        self.assertEqual(events[-1].kind, REST)
+        self.assertIs(events[0].obj, self.obj)
+        self.assertEqual(sum(1 for event in events if event.kind == IMPACT),
+                         self.simulator.physics_engine.total_rebounds)
+
+class TestRunUntil(unittest.TestCase):
+    """Tests pour run_until et l'avance rapide des objets au repos"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.simulator = FreeFallSimulator(dt=0.001, air_resistance=False)
+        self.obj = PhysicsObject(y=2.1, radius=0.1, restitution_coefficient=0.7)
+        self.simulator.add_object(self.obj)
+
+    def test_base_condition_is_abstract(self):
+        """Test qu'une condition sans __call__ ne peut pas être instanciée"""
+        with self.assertRaises(TypeError):
+            StopCondition()
+
+    def test_built_in_conditions(self):
+        """Test des conditions prédéfinies"""
+        condition = BounceCount(3)
+        self.assertIs(self.simulator.run_until(condition, max_duration=30.0), condition)
+        self.assertEqual(self.simulator.physics_engine.total_rebounds, 3)
+
+        self.assertIsInstance(self.simulator.run_until(ApexReached(self.obj)), ApexReached)
+        self.assertAlmostEqual(self.obj.vy, 0.0, delta=0.02)
+
+        energy = EnergyBelow(0.01)
+        self.assertIs(self.simulator.run_until(energy, AllAtRest()), energy)
+        self.assertLess(EnergyBelow.mechanical_energy(self.simulator), energy.threshold)
+
+        self.assertIsInstance(self.simulator.run_until(AllAtRest(), max_duration=30.0), AllAtRest)
+        self.assertFalse(self.simulator.active_objects)
+
+    def test_predicate_and_timeout(self):
+        """Test d'un prédicat quelconque et de la durée maximale"""
+        self.assertIsNone(self.simulator.run_until(HeightReached(5.0), max_duration=0.5))
+        self.assertAlmostEqual(self.simulator.time, 0.5, places=6)
+
+        self.simulator.apply_impulse(self.obj, 0.0, 20.0)
+        self.assertIsInstance(self.simulator.run_until(HeightReached(3.0), max_duration=5.0), HeightReached)
+        self.assertGreaterEqual(self.obj.y, 3.0)
+
+        def predicate(simulator):
+            return simulator.time > 2.0
+        self.assertIs(self.simulator.run_until(predicate), predicate)
+
+    def test_run_for_duration_fast_forwards_sleeping_objects(self):
+        """Test que le temps avance sans intégration quand tout est au repos"""
+        self.simulator.run_until(AllAtRest())
+        steps = self.simulator.step_count
+        history_length = len(self.obj.history['time'])
+
+        self.simulator.run_for_duration(100.0)
+        self.assertGreaterEqual(self.simulator.time, steps * 0.001 + 100.0 - 1e-6)
+        self.assertAlmostEqual(self.simulator.step_count - steps, 100000, delta=1)
+        self.assertEqual(len(self.obj.history['time']), history_length)
+
+class TestFixedTimestepAccumulator(unittest.TestCase):
+    """Tests pour l'accumulateur à pas fixe"""
+
+    def test_steps_follow_wall_time(self):
+        """Test que le nombre de pas suit le temps réel, quelle que soit la fréquence d'affichage"""
+        for fps in (30, 80, 144):
+            accumulator = FixedTimestepAccumulator(0.002)
+            steps = sum(accumulator.advance(1.0 / fps) for _ in range(fps))
+            self.assertAlmostEqual(steps, 500, delta=1)
+            self.assertGreaterEqual(accumulator.alpha, 0.0)
+            self.assertLess(accumulator.alpha, 1.0)
+
+    def test_time_scale_and_cap(self):
+        """Test de l'échelle de temps et de la limite de sous-pas"""
+        accumulator = FixedTimestepAccumulator(0.002, time_scale=5.0, max_substeps=100)
+        self.assertEqual(accumulator.advance(0.01), 25)
+
+        self.assertEqual(accumulator.advance(1.0), 100)
+        self.assertAlmostEqual(accumulator.dropped_time, 5.0 - 0.2, places=6)
+        self.assertLess(accumulator.accumulator, 0.002)
+
+        accumulator.reset()
+        self.assertEqual(accumulator.alpha, 0.0)
+
+    def test_interpolation(self):
+        """Test de l'interpolation de l'affichage avec le reste de l'accumulateur"""
+        accumulator = FixedTimestepAccumulator(0.01)
+        self.assertEqual(accumulator.advance(0.025), 2)
+        x, y = accumulator.interpolate((0.0, 2.0), (1.0, 1.0))
+        self.assertAlmostEqual(x, 0.5)
+        self.assertAlmostEqual(y, 1.5)
+
+class TestPhysicsWorker(unittest.TestCase):
+    """Tests pour la physique en thread séparé"""
+
+    def test_preallocated_slots(self):
+        """Test de la recopie dans deux emplacements réutilisés, sans écraser l'image lue"""
+        buffer = SnapshotBuffer(factory=lambda: [0])
+
+        def fill(value):
+            return lambda slot: slot.__setitem__(0, value)
+
+        with buffer.read() as frame:
+            self.assertEqual(frame, [0])
+            initial_slot = frame
+        self.assertTrue(buffer.write(fill(1)))
+        with buffer.read() as frame:
+            self.assertEqual(frame, [1])
+            self.assertTrue(buffer.write(fill(2)))
+            self.assertFalse(buffer.write(fill(3)))  # L'emplacement arrière est celui lu
+            self.assertEqual(frame, [1])
+            written_slot = frame
+        self.assertTrue(buffer.write(fill(4)))
+        with buffer.read() as frame:
+            self.assertEqual(frame, [4])
+            self.assertIs(frame, written_slot)
+        self.assertEqual((buffer.version, buffer.skipped), (3, 1))
+        self.assertIsNot(initial_slot, written_slot)
+
+    def test_latest_frame_is_not_overwritten_while_read(self):
+        """Test qu'une image en cours de lecture n'est jamais réécrite, quel que soit le nombre d'écritures"""
+        buffer = SnapshotBuffer(factory=lambda: [0])
+        buffer.write(lambda slot: slot.__setitem__(0, 1))
+        with buffer.read() as frame:
+            for value in range(2, 10):
+                buffer.write(lambda slot: slot.__setitem__(0, value))
+            self.assertEqual(frame, [1])
+        with buffer.read() as frame:
+            self.assertEqual(frame, [2])
+
+    def test_worker_publishes_snapshots(self):
+        """Test que le thread avance la simulation, exécute les commandes et publie des images"""
+        simulator = FreeFallSimulator(dt=0.001, recording_policy=RecordNothing())
+        obj = PhysicsObject(y=10.0)
+        simulator.add_object(obj)
+        accumulator = FixedTimestepAccumulator(simulator.dt)
+
+        def advance(elapsed):
+            for _ in range(accumulator.advance(elapsed)):
+                simulator.step()
+
+        def fill(slot):
+            slot[:] = simulator.time, obj.y
+
+        buffer = SnapshotBuffer(factory=lambda: [0.0, obj.y])
+        worker = PhysicsWorker(advance, fill, buffer, tick=0.005)
+        worker.start()
+        try:
+            time.sleep(0.2)
+            worker.submit(lambda: simulator.apply_impulse(obj, 0.0, 100.0))
+            time.sleep(0.1)
+        finally:
+            worker.stop()
+
+        self.assertFalse(worker.is_alive())
+        with buffer.read() as frame:
+            latest_time, latest_y = frame
+        self.assertGreater(buffer.version, 10)
+        self.assertGreater(latest_time, 0.2)
+        self.assertGreater(obj.vy, 0.0)  # Impulsion appliquée par le thread
+        self.assertLessEqual(latest_time, simulator.time)
+
+class TestParameterSweep(unittest.TestCase):
+    """Tests pour le balayage de paramètres"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        grounds = [{"name": "e=0.5", "restitution": 0.5}, {"name": "e=0.8", "restitution": 0.8}]
+        self.scenarios = build_grid(grounds=grounds, air_densities=[{"name": "Air", "factor": 1.0}],
+                                    heights=[2.0])
+
+    def test_preset_grid(self):
+        """Test du produit cartésien des grilles prédéfinies"""
+        grid = build_grid()
+        self.assertEqual(len(grid), 4 * 5 * 5 * 6)
+        self.assertEqual(grid[0].ball, "Tennis")
+        self.assertEqual(grid[0].height, 3.0)
+        self.assertEqual(len(self.scenarios), 8)
+
+    def test_scenario_summary(self):
+        """Test des métriques d'un scénario"""
+        row = run_scenario(self.scenarios[1], dt=0.001, max_duration=20.0)
+
+        self.assertGreater(row['bounce_count'], 3)
+        self.assertIsNotNone(row['time_to_rest'])
+        self.assertLess(row['bounce_heights'][0], 2.0)
+        self.assertEqual(row['max_bounce_height'], row['bounce_heights'][0])
+        self.assertAlmostEqual(row['dissipated_fraction'], 1.0, places=6)
+
+    def test_parallel_matches_serial(self):
+        """Test que le pool de processus donne les mêmes résultats, dans le même ordre"""
+        serial = run_sweep(self.scenarios, workers=1, max_duration=10.0)
+        parallel = run_sweep(self.scenarios, workers=2, chunksize=3, max_duration=10.0)
+        self.assertEqual(serial, parallel)
+
+        stream = io.StringIO()
+        write_csv(serial, stream)
+        self.assertEqual(len(stream.getvalue().splitlines()), len(serial) + 1)
+
+class TestImpactSnapshotStore(unittest.TestCase):
+    """Tests pour la reprise du début de trajectoire commun"""
+
+    def _simulator(self, restitution):
+        simulator = FreeFallSimulator(dt=0.002)
+        obj = PhysicsObject(y=5.0, radius=0.1, restitution_coefficient=restitution)
+        simulator.add_object(obj)
+        return simulator, obj
+
+    def test_resume_from_first_impact(self):
+        """Test qu'un changement de sol reprend au premier impact avec le même résultat"""
+        store = ImpactSnapshotStore()
+        first, _ = self._simulator(0.8)
+        self.assertFalse(store.advance(first, 10.0))
+        self.assertEqual(first.physics_engine.total_rebounds, 0)
+        impact_step = first.step_count
+        self.assertGreater(impact_step, 0)
+
+        resumed, obj = self._simulator(0.5)
+        self.assertTrue(store.advance(resumed, 10.0))
+        self.assertEqual(resumed.step_count, impact_step)
+        self.assertEqual(len(obj.history['time']), impact_step)
+        resumed.run_for_duration(3.0)
+
+        reference, expected = self._simulator(0.5)
+        reference.run_for_duration(resumed.time)
+        self.assertEqual(reference.step_count, resumed.step_count)
+        self.assertEqual((obj.y, obj.vy), (expected.y, expected.vy))
+        self.assertEqual(resumed.physics_engine.total_rebounds, reference.physics_engine.total_rebounds)
+        np.testing.assert_array_equal(obj.history['y'], expected.history['y'])
+
+    def test_snapshot_and_restore(self):
+        """Test de l'API publique d'instantanés du simulateur"""
+        simulator, obj = self._simulator(0.7)
+        simulator.run_for_duration(1.5)
+        start = [len(obj.history)]
+        saved = simulator.snapshot()
+        simulator.run_for_duration(1.5)
+        after = (simulator.time, obj.y, obj.vy, simulator.physics_engine.total_rebounds)
+
+        restored, copy = self._simulator(0.7)
+        restored.restore(saved)
+        self.assertEqual(len(copy.history), start[0])
+        restored.run_for_duration(1.5)
+        self.assertEqual((restored.time, copy.y, copy.vy, restored.physics_engine.total_rebounds), after)
+        self.assertEqual(simulator.snapshot(start).arrays['history_0'].shape[1], len(obj.history) - start[0])
+
+    def test_sweep_reuses_prefix(self):
+        """Test que le balayage donne le même résultat avec ou sans reprise"""
+        grounds = [{"name": "a", "restitution": 0.4}, {"name": "b", "restitution": 0.9}]
+        scenarios = build_grid(balls=BALL_TYPES[:1], grounds=grounds, heights=[3.0],
+                               air_densities=[{"name": "Air", "factor": 1.0}])
+        with_prefix = run_sweep(scenarios, workers=1, max_duration=10.0)
+        without_prefix = run_sweep(scenarios, workers=1, max_duration=10.0, reuse_prefix=False)
+        self.assertEqual(with_prefix, without_prefix)
+
+class TestResultCache(unittest.TestCase):
+    """Tests pour le cache disque des résultats"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.directory.name)
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.directory.cleanup()
+
+    def _run(self, restitution=0.7):
+        simulator = FreeFallSimulator(dt=0.002, result_cache=self.cache)
+        obj = PhysicsObject(y=3.0, radius=0.1, restitution_coefficient=restitution)
+        simulator.add_object(obj)
+        simulator.run_for_duration(4.0)
+        return simulator, obj
+
+    def test_run_for_duration_is_cached(self):
+        """Test qu'un appel identique restaure l'état final et l'historique"""
+        reference, first = self._run()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        cached, second = self._run()
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual((second.x, second.y, second.vx, second.vy), (first.x, first.y, first.vx, first.vy))
+        self.assertEqual(cached.time, reference.time)
+        self.assertEqual(cached.step_count, reference.step_count)
+        self.assertEqual(cached.physics_engine.get_rebounds(second), reference.physics_engine.get_rebounds(first))
+        self.assertEqual(cached.is_sleeping(second), reference.is_sleeping(first))
+        np.testing.assert_array_equal(second.history['y'], first.history['y'])
+
+        # Un paramètre différent donne une autre clé
+        self._run(restitution=0.6)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_size_limited_eviction(self):
+        """Test de l'éviction des entrées les moins récemment utilisées"""
+        for index in range(3):
+            self.cache.put(f"{index:064x}", {'data': np.random.rand(2000)})
+            os.utime(os.path.join(self.directory.name, f"{index:064x}.npz"), (index, index))
+        entry_size = os.path.getsize(os.path.join(self.directory.name, f"{0:064x}.npz"))
+
+        self.cache.max_bytes = 2 * entry_size
+        self.cache.evict()
+        self.assertIsNone(self.cache.get(f"{0:064x}"))
+        self.assertIsNotNone(self.cache.get(f"{2:064x}"))
+        self.assertEqual([name for name in os.listdir(self.directory.name) if name.endswith('.tmp')], [])
+
+    def test_chute_libre_cache(self):
+        """Test du cache devant ChuteLibre.simulate"""
+        from physics import ChuteLibre
+        try:
+            ChuteLibre.result_cache = self.cache
+            first = ChuteLibre(0.5, 5.0, 0.0, 0.001, 5.0, 0.1, 0.8)
+            second = ChuteLibre(0.5, 5.0, 0.0, 0.001, 5.0, 0.1, 0.8)
+        finally:
+            ChuteLibre.result_cache = None
+
+        self.assertEqual(self.cache.hits, 1)
+        np.testing.assert_array_equal(first.y, second.y)
+        self.assertEqual(first.rebound_indices, second.rebound_indices)
+        self.assertEqual(first.max_heights, second.max_heights)
+
+class TestBatchFreeFallSimulator(unittest.TestCase):
+    """Tests pour le simulateur vectorisé"""
+
+    def test_matches_scalar_simulator(self):
+        """Test que la passe vectorisée reproduit le simulateur objet par objet"""
+        configs = [(10.0, 0.058, 0.033, 0.85), (5.0, 0.624, 0.12, 0.65), (3.0, 0.046, 0.021, 0.3)]
+
+        batch = BatchFreeFallSimulator(dt=0.002, air_resistance=True)
+        references = []
+        for height, mass, radius, restitution in configs:
+            batch.add_object(PhysicsObject(y=height, mass=mass, radius=radius,
+                                           restitution_coefficient=restitution))
+            simulator = FreeFallSimulator(dt=0.002, air_resistance=True)
+            obj = PhysicsObject(y=height, mass=mass, radius=radius, restitution_coefficient=restitution)
+            simulator.add_object(obj)
+            references.append((simulator, obj))
+
+        for _ in range(1500):
+            batch.step()
+            for simulator, _obj in references:
+                simulator.step()
+
+        state = batch.get_state()
+        for i, (simulator, obj) in enumerate(references):
+            self.assertAlmostEqual(state['y'][i], obj.y, places=6)
+            self.assertAlmostEqual(state['vy'][i], obj.vy, places=6)
+            self.assertEqual(state['rebounds'][i], simulator.physics_engine.total_rebounds)
+
+    def test_shares_object_array(self):
+        """Test que le simulateur travaille sans copie sur un tableau d'objets"""
+        array = PhysicsObjectArray(4, y=[2.0, 4.0, 6.0, 8.0], radius=0.1)
+        batch = BatchFreeFallSimulator.from_object_array(array, dt=0.01, air_resistance=True)
+
+        self.assertTrue(np.shares_memory(batch.get_state()['y'], array.state))
+        batch.run_for_duration(0.5)
+
+        self.assertEqual(array.view(2).y, batch.get_state()['y'][2])
+        self.assertLess(array.view(3).y, 8.0)
+        self.assertLess(array.view(3).vy, 0.0)
+
+    def test_capacity_growth_and_sync(self):
+        """Test de l'agrandissement des tampons et de la synchronisation des objets"""
+        batch = BatchFreeFallSimulator(dt=0.01, air_resistance=False, capacity=2)
+        objects = [PhysicsObject(y=5.0 + i) for i in range(5)]
+        batch.add_objects(objects)
+
+        self.assertEqual(batch.count, 5)
+        self.assertGreaterEqual(batch.capacity, 5)
+
+        batch.run_for_duration(0.5)
+        batch.sync_objects()
+
+        for i, obj in enumerate(objects):
+            self.assertLess(obj.y, 5.0 + i)
+            self.assertEqual(obj.y, batch.get_state()['y'][i])
+
+    def test_stopped_objects_are_frozen(self):
+        """Test qu'une balle arrêtée ne bouge plus et n'arrête pas les autres"""
+        batch = BatchFreeFallSimulator(dt=0.001, air_resistance=False)
+        batch.add_object(PhysicsObject(y=0.1, radius=0.1, restitution_coefficient=0.0))
+        batch.add_object(PhysicsObject(y=5.0, radius=0.1))
+
+        batch.run_for_duration(0.5)
+        state = batch.get_state()
+
+        self.assertTrue(state['stopped'][0])
+        self.assertFalse(state['stopped'][1])
+        self.assertEqual(state['vy'][0], 0.0)
+        self.assertLess(state['vy'][1], 0.0)
+        self.assertFalse(batch.all_stopped)
+        self.assertEqual(batch.sleeping_count, 1)
+
+        batch.apply_impulse(0, 0.0, 1.0)
+        self.assertEqual(batch.sleeping_count, 0)
+        self.assertAlmostEqual(batch.get_state()['vy'][0], 1.0)
+
+class TestEventLocation(unittest.TestCase):
+    """Tests de la localisation exacte des impacts"""
+
+    def run_until_first_bounce(self, event_location):
+        """Simule avec un grand pas jusqu'au premier rebond"""
+        simulator = FreeFallSimulator(dt=0.05, air_resistance=False,
+                                      numerical_method=RK4Method(), event_location=event_location)
+        obj = PhysicsObject(x=0, y=10.1, vx=0, vy=0, mass=1.0, radius=0.1, restitution_coefficient=0.8)
+        simulator.add_object(obj)
+        while simulator.physics_engine.total_rebounds == 0:
+            simulator.step()
+        # Énergie mécanique au-dessus de la position de contact
+        return 0.5 * obj.vy ** 2 + GRAVITY * (obj.y - obj.radius)
+
+    def test_bounce_energy_is_exact_with_large_steps(self):
+        """Test que l'énergie après rebond vaut e² fois l'énergie initiale"""
+        expected = 0.8 ** 2 * GRAVITY * 10.0
+
+        located = self.run_until_first_bounce(event_location=True)
+        snapped = self.run_until_first_bounce(event_location=False)
+
+        self.assertAlmostEqual(located, expected, places=6)
+        self.assertGreater(abs(snapped - expected), 1e-3)
+
+    def test_impact_events_are_located_in_time(self):
+        """Test que les événements d'impact portent l'instant localisé, pas la fin du pas"""
+        simulator = FreeFallSimulator(dt=0.05, air_resistance=False,
+                                      numerical_method=RK4Method(), event_location=True)
+        obj = PhysicsObject(x=0, y=10.1, vx=0, vy=0, mass=1.0, radius=0.1, restitution_coefficient=0.8)
+        simulator.add_object(obj)
+
+        impacts = [event.time for event in simulator.iter_events(max_duration=6.0) if event.kind == IMPACT]
+        fall_time = (2 * 10.0 / GRAVITY) ** 0.5
+        expected = [fall_time, fall_time * (1 + 2 * 0.8), fall_time * (1 + 2 * 0.8 + 2 * 0.8 ** 2)]
+        for located, exact in zip(impacts, expected):
+            self.assertAlmostEqual(located, exact, places=6)
+
+    def test_weak_bounce_stops_object(self):
+        """Test qu'un rebond trop faible arrête l'objet au point d'impact"""
+        simulator = FreeFallSimulator(dt=0.05, air_resistance=False,
+                                      numerical_method=RK4Method(), event_location=True)
+        obj = PhysicsObject(x=0, y=1.1, vx=0, vy=0, mass=1.0, radius=0.1, restitution_coefficient=0.0)
+        simulator.add_object(obj)
+        simulator.run_for_duration(1.0)
+
+        self.assertTrue(simulator.physics_engine.is_stopped(obj))
+        self.assertEqual(obj.y, obj.radius)
+        self.assertEqual(obj.vy, 0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
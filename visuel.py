@@ -3,6 +3,8 @@ import platform
 import pygame
 import pygame.gfxdraw
 import math
+from src.simulation.precomputed_trajectory import SimulationCache
+from src.simulation.analytic_solutions import ParabolicTrajectory
 
 # Constantes physiques
 g = 9.81  # Accélération gravitationnelle (m/s²)
@@ -269,44 +271,43 @@ kinetic_energies = []
 potential_energies = []
 total_energies = []
 
+# Trajectoires numériques précalculées, gardées pour les configurations récentes
+simulation_cache = SimulationCache(time_step=dt, gravity=g)
+trajectory = None
+live_model = None  # Pas d'Euler appliqué à l'état affiché après un changement de restitution
+analytic_trajectory = None  # Solution sans frottement, exacte à tout instant
+analytic_start_time = 0.0  # Instant de la course auquel commence analytic_trajectory
+step = 0
+
+def change_restitution():
+    """La nouvelle restitution ne vaut que pour les rebonds à venir : la course continue de l'état affiché"""
+    global live_model, analytic_trajectory, analytic_start_time
+    live_model = (live_model or trajectory.model)._replace(e=e)
+
+    current_time = trajectory.time(step)
+    xa, ya, vxa, vya = analytic_trajectory.state_at(current_time - analytic_start_time)
+    analytic_trajectory = ParabolicTrajectory(ya, vy=vya, x=xa, vx=vxa, restitution_coefficient=e)
+    analytic_start_time = current_time
+
 def update_loop():
-    global x, y, vx, vy, x_analytic, y_analytic, vx_analytic, vy_analytic, t, rebounds, paused
+    global x, y, vx, vy, x_analytic, y_analytic, vx_analytic, vy_analytic, t, rebounds, paused, step
     if not running or paused:
         return
 
-    # Solution numérique (Euler)
-    F_gravity = -m * g
-    F_friction_y = -k * vy
-    F_wind = k * wind_speed  # Force horizontale due au vent
-    ax = F_wind / m
-    ay = (F_gravity + F_friction_y) / m
-    vx += ax * dt
-    vy += ay * dt
-    x += vx * dt
-    y += vy * dt
-
-    # Solution analytique (sans frottement)
-    ay_analytic = -g
-    vy_analytic += ay_analytic * dt
-    y_analytic += vy_analytic * dt
-    x_analytic += vx_analytic * dt
-
-    # Vérification du rebond (numérique)
-    if y <= 0 and vy < 0:
-        vy = -e * vy
-        vx *= e  # Réduction de la vitesse horizontale
-        y = 0
-        rebounds += 1
-
-    # Vérification du rebond (analytique)
-    if y_analytic <= 0 and vy_analytic < 0:
-        vy_analytic = -e * vy_analytic
-        y_analytic = 0
-
-    # Calcul des énergies
-    kinetic_energy = 0.5 * m * (vx**2 + vy**2)
-    potential_energy = m * g * y
-    total_energy = kinetic_energy + potential_energy
+    # Solution numérique (Euler) : lue dans la trajectoire précalculée, ou calculée
+    # depuis l'état affiché avec le même pas après un changement de restitution
+    step += 1
+    if live_model is None:
+        x, y, vx, vy, rebounds = trajectory.state(step)
+        kinetic_energy, potential_energy, total_energy = trajectory.energies(step)
+    else:
+        x, y, vx, vy, rebounds = live_model.step(x, y, vx, vy, rebounds)
+        kinetic_energy, potential_energy, total_energy = live_model.energies(y, vx, vy)
+
+    # Solution analytique (sans frottement), évaluée en forme fermée avec ses rebonds
+    # au même instant que l'état numérique, pris sur l'axe des temps de la trajectoire
+    x_analytic, y_analytic, vx_analytic, vy_analytic = analytic_trajectory.state_at(
+        trajectory.time(step) - analytic_start_time)
 
     # Stockage pour le graphique
     times.append(t)
@@ -324,7 +325,8 @@ def update_loop():
     t += dt
 
 def reset_simulation():
-    global x, y, vx, vy, x_analytic, y_analytic, vx_analytic, vy_analytic, t, rebounds, times, kinetic_energies, potential_energies, total_energies
+    global x, y, vx, vy, x_analytic, y_analytic, vx_analytic, vy_analytic, t, rebounds, times, kinetic_energies, potential_energies, total_energies, step
+    global trajectory, live_model, analytic_trajectory, analytic_start_time
     x = 0.0
     y = h0
     vx = 0.0
@@ -339,6 +341,11 @@ def reset_simulation():
     kinetic_energies = []
     potential_energies = []
     total_energies = []
+    step = 0
+    trajectory = simulation_cache.get({'m': m, 'k': k, 'e': e, 'wind_speed': wind_speed, 'h0': h0})
+    live_model = None
+    analytic_trajectory = ParabolicTrajectory(h0, restitution_coefficient=e)
+    analytic_start_time = 0.0
 
 def draw_modern_header(screen, title):
     header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
@@ -781,7 +788,10 @@ async def main():
 
                 # Gestion des sliders
                 if e_slider.handle_event(event):
+                    old_e = e
                     e = e_slider.val
+                    if old_e != e:
+                        change_restitution()
 
                 if h0_slider.handle_event(event):
                     old_h0 = h0